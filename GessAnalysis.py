@@ -0,0 +1,71 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: Parallel post-game analysis for the game of Gess
+
+import multiprocessing
+from collections import namedtuple
+
+from GessGame import GessGame
+from GessSearch import search
+
+# The analysis of one ply of a game: the ply number (starting at 0), the player who moved, the move played, the best
+# move found by the search, the evaluation of the best move and of the move played (both from the point of view of the
+# player who moved), and the loss caused by the move played compared to the best move.
+PlyAnalysis = namedtuple('PlyAnalysis', ['ply', 'player', 'move', 'best_move', 'evaluation', 'played_evaluation',
+                                         'loss'])
+
+
+def _analyse_position(task):
+    """
+    Analyses the position before one ply of a game. Runs in a worker process of the analysis pool.
+    :param task: A tuple of the ply number, the GessGame before the move, the move played, and the search time limit,
+    maximum depth and evaluation weights.
+    :return: Returns a PlyAnalysis.
+    """
+    (ply, gess_game, move, time_limit, max_depth, weights) = task
+    best = search(gess_game, time_limit, max_depth, weights)
+
+    # The move played is searched with the same budget, so that both evaluations can be compared
+    if best.move == move:
+        played_evaluation = best.score
+    else:
+        played_evaluation = search(gess_game, time_limit, max_depth, weights, root_moves=[move]).score
+    return PlyAnalysis(ply, gess_game.get_current_player(), move, best.move, best.score, played_evaluation,
+                       max(0, best.score - played_evaluation))
+
+
+def _replay_positions(moves, time_limit, max_depth, weights):
+    """
+    Replays a game through a GessGame, yielding the analysis task of each ply as it is reached.
+    Raises ValueError at the first move that is not legal.
+    """
+    gess = GessGame()
+    for ply, (origin_square, destination_square) in enumerate(moves):
+        position = gess.copy()
+        if not gess.make_move(origin_square, destination_square):
+            raise ValueError(f'Illegal move {origin_square}-{destination_square} at ply {ply}')
+        yield ply, position, (origin_square, destination_square), time_limit, max_depth, weights
+
+
+def analyse_game(moves, processes=None, time_limit=None, max_depth=None, weights=None, pool=None):
+    """
+    Analyses every ply of a recorded game, searching the positions in a pool of worker processes.
+    The game is replayed lazily as workers become free, and the results are yielded in ply order as soon as each is
+    ready, so a long game can be annotated while its later plies are still being searched.
+    :param moves: A list of (origin square, destination square) string pairs of the moves played.
+    :param processes: Optional integer of the number of worker processes. Defaults to the number of CPUs.
+    :param time_limit: Optional number of seconds to search each position (and the move played) for.
+    :param max_depth: Optional integer of the deepest iteration to search each position to. If neither time_limit
+    nor max_depth is given, each position is searched one ply deep.
+    :param weights: Optional dictionary of evaluation weights.
+    :param pool: Optional multiprocessing Pool to use, so that many games can share one set of workers.
+    :return: Returns a generator of PlyAnalysis tuples, one per ply. Raises ValueError if a move is illegal.
+    """
+    if time_limit is None and max_depth is None:
+        max_depth = 1
+    tasks = _replay_positions(moves, time_limit, max_depth, weights)
+    if pool is not None:
+        yield from pool.imap(_analyse_position, tasks)
+        return
+    with multiprocessing.Pool(processes) as own_pool:
+        yield from own_pool.imap(_analyse_position, tasks)
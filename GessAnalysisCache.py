@@ -0,0 +1,184 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: A persistent on-disk cache of analysed positions for the game of Gess, shared across processes
+
+import sqlite3
+import time
+
+from GessSearch import SearchResult, search
+from GessSymmetry import get_canonical_hash, transform_move
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS analysis (
+    position_hash INTEGER NOT NULL,
+    engine_version TEXT NOT NULL,
+    depth INTEGER NOT NULL,
+    score INTEGER NOT NULL,
+    best_move TEXT,
+    last_access REAL NOT NULL,
+    PRIMARY KEY (position_hash, engine_version)
+);
+CREATE INDEX IF NOT EXISTS analysis_last_access ON analysis (last_access);
+"""
+
+
+def _to_signed(position_hash):
+    """
+    Converts a 64 bit position hash into the signed range of an SQLite integer.
+    """
+    return position_hash - 2 ** 64 if position_hash >= 2 ** 63 else position_hash
+
+
+class GessAnalysisCache:
+    """
+    A GessAnalysisCache object stores evaluated positions in an SQLite database file, keyed by position hash and engine
+    version, so that analysis survives engine restarts and is shared by every process on the host using the same file.
+    The database uses write-ahead logging, so readers do not block each other or the writer.
+    Each entry holds the search depth, score and best move of a position. A deeper entry is never replaced by a
+    shallower one. Once the cache holds more than max_entries entries, the least recently used entries are evicted.
+    Reading an entry does not write to the file: the access times of the entries read are kept in memory and written
+    in one transaction every access_batch_size reads, and before evicting or closing, so readers rarely take the write
+    lock. Other processes therefore see a recent read only once it has been written.
+    Each process (and thread) should open its own GessAnalysisCache on the file.
+    """
+    def __init__(self, path, engine_version='1', max_entries=1000000, timeout=30.0, access_batch_size=256):
+        """
+        Initiates the GessAnalysisCache object, creating the database file if needed.
+        :param path: String of the path of the database file.
+        :param engine_version: String tag of the engine version. Entries of other versions are not returned.
+        :param max_entries: Integer of the number of entries kept before the least recently used are evicted.
+        :param timeout: Number of seconds to wait for another process to finish writing before giving up.
+        :param access_batch_size: Integer of the number of reads whose access times are written together.
+        """
+        self._engine_version = engine_version
+        self._max_entries = max_entries
+        self._connection = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.executescript(_SCHEMA)
+        self._writes_since_eviction = 0
+        self._access_batch_size = access_batch_size
+        self._pending_accesses = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return self._connection.execute('SELECT COUNT(*) FROM analysis').fetchone()[0]
+
+    def close(self):
+        """
+        Closes the connection to the database file.
+        :return: Returns True once the cache has been closed.
+        """
+        self._write_accesses()
+        self._connection.close()
+        return True
+
+    def get(self, position_hash, min_depth=0):
+        """
+        Returns the cached analysis of a position for this engine version, marking it as recently used.
+        :param position_hash: Integer hash of the position, as returned by GessGame.get_position_hash.
+        :param min_depth: Integer of the shallowest depth accepted.
+        :return: Returns a tuple of the depth, score and best move (an (origin square, destination square) tuple, or
+        None) of the position, or None if the position has no entry at least min_depth deep.
+        """
+        key = (_to_signed(position_hash), self._engine_version)
+        row = self._connection.execute(
+            'SELECT depth, score, best_move FROM analysis WHERE position_hash = ? AND engine_version = ?',
+            key).fetchone()
+        if row is None or row[0] < min_depth:
+            return None
+        self._pending_accesses[key] = time.time()
+        if len(self._pending_accesses) >= self._access_batch_size:
+            self._write_accesses()
+        (depth, score, best_move) = row
+        return depth, score, None if best_move is None else tuple(best_move.split('-'))
+
+    def _write_accesses(self):
+        """
+        Writes the access times of the entries read since the last write, in a single transaction. An entry stored
+        again since it was read keeps its later access time.
+        """
+        if not self._pending_accesses:
+            return
+        self._connection.execute('BEGIN IMMEDIATE')
+        try:
+            self._connection.executemany(
+                'UPDATE analysis SET last_access = MAX(last_access, ?) WHERE position_hash = ? AND engine_version = ?',
+                [(access_time,) + key for key, access_time in self._pending_accesses.items()])
+        except BaseException:
+            self._connection.execute('ROLLBACK')
+            raise
+        self._connection.execute('COMMIT')
+        self._pending_accesses.clear()
+
+    def put(self, position_hash, depth, score, best_move):
+        """
+        Stores the analysis of a position for this engine version, unless a deeper entry is already stored.
+        :param position_hash: Integer hash of the position.
+        :param depth: Integer of the depth the position was searched to.
+        :param score: Integer of the score of the position from the point of view of the player to move.
+        :param best_move: The best move as an (origin square, destination square) tuple, or None.
+        :return: Returns True once the entry has been stored or kept.
+        """
+        self._connection.execute(
+            'INSERT INTO analysis (position_hash, engine_version, depth, score, best_move, last_access) '
+            'VALUES (?, ?, ?, ?, ?, ?) '
+            'ON CONFLICT (position_hash, engine_version) DO UPDATE SET '
+            'depth = excluded.depth, score = excluded.score, best_move = excluded.best_move, '
+            'last_access = excluded.last_access WHERE excluded.depth >= analysis.depth',
+            (_to_signed(position_hash), self._engine_version, depth, score,
+             None if best_move is None else '-'.join(best_move), time.time()))
+
+        # Counting the entries on every write would be slow, so the size bound is only checked periodically
+        self._writes_since_eviction += 1
+        if self._writes_since_eviction >= max(1, self._max_entries // 100):
+            self.evict()
+        return True
+
+    def evict(self):
+        """
+        Removes the least recently used entries of every engine version, down to max_entries entries.
+        :return: Returns the number of entries removed.
+        """
+        self._writes_since_eviction = 0
+        self._write_accesses()
+        excess = len(self) - self._max_entries
+        if excess <= 0:
+            return 0
+        self._connection.execute(
+            'DELETE FROM analysis WHERE rowid IN (SELECT rowid FROM analysis ORDER BY last_access LIMIT ?)', (excess,))
+        return excess
+
+
+def search_with_cache(gess_game, cache, time_limit=None, max_depth=None, weights=None, min_depth=None):
+    """
+    Searches the current position of a GessGame, using and filling a GessAnalysisCache.
+    Positions are stored under their canonical hash, so a position and its symmetric equivalents share one entry.
+    If the cache holds an entry at least max_depth deep, it is returned without searching. A search limited only by
+    time has no depth to compare against, so the cache is only read if min_depth is given; otherwise the position is
+    searched and the result written to the cache.
+    :param gess_game: The GessGame to search. The game itself is not changed.
+    :param cache: The GessAnalysisCache to use.
+    :param time_limit: Optional number of seconds to search for.
+    :param max_depth: Optional integer of the deepest iteration to search.
+    :param weights: Optional dictionary of evaluation weights.
+    :param min_depth: Optional integer of the shallowest cached entry accepted by a search without a max_depth.
+    :return: Returns a SearchResult. A result taken from the cache has a node count of 0.
+    """
+    (position_hash, transform) = get_canonical_hash(gess_game)
+    min_depth = max_depth if max_depth is not None else min_depth
+    entry = None if min_depth is None else cache.get(position_hash, min_depth=min_depth)
+    if entry is not None:
+        (depth, score, best_move) = entry
+        return SearchResult(None if best_move is None else transform_move(best_move, transform), score, depth, 0)
+
+    result = search(gess_game, time_limit, max_depth, weights)
+    if result.depth > 0:
+        best_move = None if result.move is None else transform_move(result.move, transform)
+        cache.put(position_hash, result.depth, result.score, best_move)
+    return result
@@ -0,0 +1,124 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: Unit testing to check validity of GessAnalysisCache.py
+
+import multiprocessing
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from GessAnalysisCache import GessAnalysisCache, search_with_cache
+from GessGame import GessGame
+from GessSymmetry import get_canonical_hash, transform_move
+
+
+def fill_cache(task):
+    """
+    Writes a range of entries to a cache file from a worker process.
+    """
+    (path, start) = task
+    with GessAnalysisCache(path) as cache:
+        for position_hash in range(start, start + 50):
+            cache.put(position_hash, 1, position_hash, None)
+    return True
+
+
+class TestGessAnalysisCache(unittest.TestCase):
+    """
+    Contains unit tests for the GessAnalysisCache class and the search_with_cache function
+    """
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._directory.name, 'analysis.sqlite')
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_entries(self):
+        """
+        Tests that entries are stored by position hash and engine version, and that deeper entries are kept.
+        """
+        position_hash = 2 ** 64 - 1
+        with GessAnalysisCache(self._path) as cache:
+            self.assertEqual(cache.get(position_hash), None)
+            cache.put(position_hash, 4, -30, ('c3', 'c6'))
+            cache.put(position_hash, 2, 50, None)
+            self.assertEqual(cache.get(position_hash), (4, -30, ('c3', 'c6')))
+            self.assertEqual(cache.get(position_hash, min_depth=5), None)
+            cache.put(position_hash, 5, 10, None)
+            self.assertEqual(cache.get(position_hash), (5, 10, None))
+
+        # The entries survive reopening the file, but are not shared with another engine version
+        with GessAnalysisCache(self._path) as cache:
+            self.assertEqual(cache.get(position_hash), (5, 10, None))
+        with GessAnalysisCache(self._path, engine_version='2') as cache:
+            self.assertEqual(cache.get(position_hash), None)
+
+    def test_least_recently_used_eviction(self):
+        """
+        Tests that the least recently used entries are evicted once the cache is full.
+        """
+        with GessAnalysisCache(self._path, max_entries=3) as cache:
+            for position_hash in range(3):
+                cache.put(position_hash, 1, 0, None)
+            cache.get(0)
+            cache.put(3, 1, 0, None)
+            self.assertEqual(len(cache), 3)
+            self.assertEqual(cache.get(1), None)
+            self.assertNotEqual(cache.get(0), None)
+
+    def test_reads_do_not_take_the_write_lock(self):
+        """
+        Tests that entries can be read while another connection holds the write lock, and that the access times of the
+        reads are written once enough reads have been made.
+        """
+        with GessAnalysisCache(self._path, timeout=0.1, access_batch_size=2) as cache:
+            cache.put(1, 1, 0, None)
+            cache.put(2, 1, 0, None)
+            writer = sqlite3.connect(self._path, isolation_level=None)
+            writer.execute('BEGIN IMMEDIATE')
+            self.assertEqual(cache.get(1), (1, 0, None))
+            writer.execute('ROLLBACK')
+
+            (stored_access,) = writer.execute('SELECT last_access FROM analysis WHERE position_hash = 1').fetchone()
+            cache.get(2)
+            (written_access,) = writer.execute('SELECT last_access FROM analysis WHERE position_hash = 1').fetchone()
+            self.assertGreater(written_access, stored_access)
+            writer.close()
+
+    def test_concurrent_processes(self):
+        """
+        Tests that several processes can write to the same cache file at once.
+        """
+        with multiprocessing.Pool(4) as pool:
+            self.assertEqual(pool.map(fill_cache, [(self._path, start) for start in range(0, 200, 50)]), [True] * 4)
+        with GessAnalysisCache(self._path) as cache:
+            self.assertEqual(len(cache), 200)
+            self.assertEqual(cache.get(123), (1, 123, None))
+
+    def test_search_with_cache(self):
+        """
+        Tests that a searched position is stored under its canonical hash, and found in the cache when searched again,
+        and that a search limited only by time reads the cache only when given a shallowest depth to accept.
+        """
+        gess = GessGame()
+        gess.make_move('c3', 'c6')
+        with GessAnalysisCache(self._path) as cache:
+            result = search_with_cache(gess, cache, max_depth=1)
+            self.assertGreater(result.nodes, 0)
+            self.assertEqual(search_with_cache(gess, cache, max_depth=1), result._replace(nodes=0))
+            self.assertEqual(search_with_cache(gess, cache, time_limit=10, min_depth=1), result._replace(nodes=0))
+            self.assertGreater(search_with_cache(gess, cache, time_limit=0.2).nodes, 0)
+
+            # The stored move belongs to the canonical position, and maps back to the searched position
+            (position_hash, transform) = get_canonical_hash(gess)
+            (depth, score, best_move) = cache.get(position_hash)
+            self.assertEqual((depth, score), (1, result.score))
+            self.assertEqual(transform_move(best_move, transform), result.move)
+            self.assertGreater(search_with_cache(gess, cache, max_depth=2, time_limit=0.2).nodes, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: Unit testing to check validity of GessAnalysis.py
+
+import unittest
+
+from GessAnalysis import analyse_game
+from GessGame import GessGame
+from GessSearch import WIN_SCORE, search
+from GessTestGames import FULL_GAME
+
+
+class TestGessAnalysis(unittest.TestCase):
+    """
+    Contains unit tests for the analyse_game function
+    """
+
+    def test_annotates_every_ply_in_order(self):
+        """
+        Tests that each ply is annotated in order, and that the final winning move is recognised as the best move.
+        """
+        # Black's final move captures White's only ring, so it is the best move and causes no loss.
+        annotations = list(analyse_game(FULL_GAME, processes=4, max_depth=1))
+        self.assertEqual([annotation.ply for annotation in annotations], list(range(len(FULL_GAME))))
+        self.assertEqual([annotation.move for annotation in annotations], FULL_GAME)
+        self.assertEqual(annotations[0].player, 'B')
+        self.assertEqual(annotations[1].player, 'W')
+
+        final = annotations[-1]
+        self.assertEqual(final.best_move, ('i13', 'l16'))
+        self.assertEqual(final.evaluation, WIN_SCORE - 1)
+        self.assertEqual(final.loss, 0)
+        for annotation in annotations:
+            self.assertGreaterEqual(annotation.loss, 0)
+            self.assertEqual(annotation.loss, annotation.evaluation - annotation.played_evaluation)
+
+    def test_time_limited_analysis(self):
+        """
+        Tests that a time limit alone searches beyond one ply, so the reply to the move played is taken into account.
+        """
+        # Searching the single move played two plies deep takes a small fraction of the time limit. Its score differs
+        # from the one ply score, as does the three ply score a fast machine may reach.
+        (annotation,) = analyse_game([('c3', 'c5')], processes=1, time_limit=2)
+        shallow = search(GessGame(), max_depth=1, root_moves=[('c3', 'c5')]).score
+        self.assertNotEqual(annotation.played_evaluation, shallow)
+
+    def test_illegal_move(self):
+        """
+        Tests that the plies before an illegal move are annotated before the illegal move is reported.
+        """
+        annotations = analyse_game([('c3', 'c5'), ('c5', 'c7')], processes=2, max_depth=1)
+        self.assertEqual(next(annotations).ply, 0)
+        self.assertRaises(ValueError, next, annotations)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,250 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: A line-based engine protocol for the game of Gess over standard input and output
+
+import sys
+import threading
+
+from GessGame import GessGame
+from GessSearch import GessSearcher, TranspositionTable
+
+ENGINE_NAME = 'GessEngine'
+ENGINE_AUTHOR = 'Asa Holland'
+
+# The engine reads one command per line and writes one reply per line, in the spirit of UCI:
+#
+#   gess                                   -> id name <name>, id author <author>, option lines, then gessok
+#   isready                                -> readyok at once, even while a search is running
+#   setoption name Ponder value true       -> think on the opponent's time after each move (default false)
+#   newgame                                -> forget the previous game and the transposition table
+#   position startpos [moves c3-c6 ...]    -> set up the starting position and play the given moves
+#   go [movetime <ms>] [depth <n>] [infinite] [ponder]
+#                                          -> search the current position on a worker thread, then reply
+#                                             info depth <n> score <score> nodes <n> and bestmove <move> [ponder <move>]
+#                                             With ponder, the position ends with the reply the engine expects, and
+#                                             nothing is reported until ponderhit or stop
+#   ponderhit                              -> the opponent played the expected reply: the ponder search goes on as a
+#                                             normal search, its movetime counted from now
+#   stop                                   -> stop the search and reply with the best move found so far
+#   quit                                   -> stop searching and exit
+#
+# Moves are written as origin-destination using the square names accepted by GessGame.make_move, and a player with no
+# legal move replies bestmove none. Anything the engine wants to report is sent as info string <text>.
+
+
+class GessEngine:
+    """
+    A GessEngine object runs the engine protocol over a pair of text streams, such as standard input and output.
+    Searches run on a worker thread, so the engine keeps reading commands, such as stop, while it searches.
+    With pondering switched on, the engine keeps searching after each of its moves, on the position after the reply it
+    expects from the opponent. The work is kept in a transposition table, which the next search reuses.
+    A controlling process can instead ask for pondering with go ponder, and tell the engine with ponderhit or stop
+    whether the opponent played the expected reply.
+    """
+    def __init__(self, input_stream=None, output_stream=None, weights=None, table_size=2 ** 18):
+        """
+        Initiates the GessEngine object.
+        :param input_stream: Optional text stream of commands. Defaults to standard input.
+        :param output_stream: Optional text stream for replies. Defaults to standard output.
+        :param weights: Optional dictionary of evaluation weights.
+        :param table_size: Integer of the number of entries in the transposition table.
+        """
+        self._input = input_stream if input_stream is not None else sys.stdin
+        self._output = output_stream if output_stream is not None else sys.stdout
+        self._output_lock = threading.Lock()
+        self._table = TranspositionTable(table_size)
+        self._searcher = GessSearcher(self._table, weights)
+        self._game = GessGame()
+        self._ponder = False
+        self._search_thread = None
+        self._stop_event = threading.Event()
+        self._ponderhit_event = None
+        self._ponder_time_limit = None
+        self._ponder_timer = None
+
+    def send(self, line):
+        """
+        Writes a line of output and flushes it at once, so the controlling process sees it without delay.
+        :param line: String of the line, without a line ending.
+        :return: Returns True once the line has been written.
+        """
+        with self._output_lock:
+            self._output.write(line + '\n')
+            self._output.flush()
+        return True
+
+    def run(self):
+        """
+        Reads and handles commands until quit is received or the input ends.
+        :return: Returns True once the engine has stopped.
+        """
+        try:
+            for line in self._input:
+                if not self.handle_command(line):
+                    break
+        finally:
+            self._stop_search()
+            self._table.close()
+        return True
+
+    def handle_command(self, line):
+        """
+        Handles one command.
+        :param line: String of the command line.
+        :return: Returns False if the command was quit, or True otherwise.
+        """
+        tokens = line.split()
+        if not tokens:
+            return True
+        (command, arguments) = (tokens[0], tokens[1:])
+
+        if command == 'quit':
+            return False
+        elif command == 'gess':
+            self.send(f'id name {ENGINE_NAME}')
+            self.send(f'id author {ENGINE_AUTHOR}')
+            self.send('option name Ponder type check default false')
+            self.send('gessok')
+        elif command == 'isready':
+            self.send('readyok')
+        elif command == 'setoption':
+            self._set_option(arguments)
+        elif command == 'newgame':
+            self._stop_search()
+            self._game = GessGame()
+            self._table.clear()
+        elif command == 'position':
+            self._stop_search()
+            self._set_position(arguments)
+        elif command == 'go':
+            self._stop_search()
+            self._go(arguments)
+        elif command == 'ponderhit':
+            self._ponderhit()
+        elif command == 'stop':
+            self._stop_search()
+        else:
+            self.send(f'info string unknown command: {command}')
+        return True
+
+    def _set_option(self, arguments):
+        """
+        Handles setoption name <name> value <value>.
+        """
+        if len(arguments) == 4 and arguments[0] == 'name' and arguments[2] == 'value' and arguments[1] == 'Ponder':
+            self._ponder = arguments[3].lower() == 'true'
+        else:
+            self.send(f'info string unknown option: {" ".join(arguments)}')
+
+    def _set_position(self, arguments):
+        """
+        Handles position startpos [moves <move> ...]. Moves after an illegal move are ignored.
+        """
+        if not arguments or arguments[0] != 'startpos' or (len(arguments) > 1 and arguments[1] != 'moves'):
+            self.send(f'info string invalid position: {" ".join(arguments)}')
+            return
+        self._game = GessGame()
+        for move in arguments[2:]:
+            squares = move.split('-')
+            if len(squares) != 2 or not self._game.make_move(*squares):
+                self.send(f'info string illegal move: {move}')
+                return
+
+    def _go(self, arguments):
+        """
+        Handles go [movetime <ms>] [depth <n>] [infinite] [ponder], starting the search on a worker thread.
+        """
+        time_limit = None
+        max_depth = None
+        ponder = False
+        try:
+            for index, argument in enumerate(arguments):
+                if argument == 'ponder':
+                    ponder = True
+                elif argument == 'movetime':
+                    time_limit = int(arguments[index + 1]) / 1000
+                elif argument == 'depth':
+                    max_depth = int(arguments[index + 1])
+        except (IndexError, ValueError):
+            self.send(f'info string invalid go: {" ".join(arguments)}')
+            return
+
+        # Each search gets its own stop event, so a search that is being stopped can never pick up the event of the
+        # search that replaces it
+        self._stop_event = threading.Event()
+
+        # A ponder search has no time limit of its own. Its movetime starts once ponderhit arrives.
+        if ponder:
+            self._ponderhit_event = threading.Event()
+            (self._ponder_time_limit, time_limit) = (time_limit, None)
+        self._search_thread = threading.Thread(target=self._search,
+                                               args=(self._game.copy(), time_limit, max_depth, self._stop_event,
+                                                     self._ponderhit_event))
+        self._search_thread.start()
+
+    def _ponderhit(self):
+        """
+        Handles ponderhit, turning the ponder search in progress into a normal search.
+        """
+        if self._ponderhit_event is None or self._ponderhit_event.is_set():
+            self.send('info string ponderhit without a ponder search')
+            return
+        if self._ponder_time_limit is not None:
+            self._ponder_timer = threading.Timer(self._ponder_time_limit, self._stop_event.set)
+            self._ponder_timer.start()
+        self._ponderhit_event.set()
+
+    def _search(self, gess_game, time_limit, max_depth, stop_event, ponderhit_event=None):
+        """
+        Searches a position and reports the best move. Runs on the search thread.
+        """
+        result = self._searcher.search(gess_game, time_limit, max_depth, stop_event)
+
+        # A ponder search that reached its depth holds its move until ponderhit or stop
+        if ponderhit_event is not None:
+            ponderhit_event.wait()
+        self.send(f'info depth {result.depth} score {result.score} nodes {result.nodes}')
+        if result.move is None:
+            self.send('bestmove none')
+            return
+
+        # The reply expected from the opponent is the best move stored for the position after the best move
+        gess_game.make_move(*result.move)
+        expected_reply = None
+        entry = self._table.probe(gess_game.get_position_hash())
+        if entry is not None and entry[3] is not None and gess_game.copy().make_move(*entry[3]):
+            expected_reply = entry[3]
+        self.send(f'bestmove {"-".join(result.move)}' +
+                  (f' ponder {"-".join(expected_reply)}' if expected_reply else ''))
+
+        # Think on the opponent's time, until the next command arrives, unless the controlling process asks for
+        # pondering itself with go ponder
+        if self._ponder and ponderhit_event is None and expected_reply is not None and not stop_event.is_set():
+            gess_game.make_move(*expected_reply)
+            self._searcher.search(gess_game, stop_event=stop_event)
+
+    def _stop_search(self):
+        """
+        Stops the search or pondering in progress, if any, and waits for it to finish.
+        """
+        self._stop_event.set()
+        if self._ponder_timer is not None:
+            self._ponder_timer.cancel()
+            self._ponder_timer = None
+        if self._ponderhit_event is not None:
+            self._ponderhit_event.set()
+            self._ponderhit_event = None
+        if self._search_thread is not None:
+            self._search_thread.join()
+            self._search_thread = None
+
+
+def main():
+    """
+    Runs the engine over standard input and output.
+    """
+    GessEngine().run()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,179 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: Unit testing to check validity of GessEngine.py
+
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+import unittest
+
+from GessEngine import GessEngine
+from GessGame import GessGame
+
+
+class EngineOutput:
+    """
+    Collects the lines written by an engine, so a test can wait for a reply.
+    """
+    def __init__(self):
+        self._lines = queue.Queue()
+        self._partial = ''
+
+    def write(self, text):
+        self._partial += text
+        while '\n' in self._partial:
+            (line, self._partial) = self._partial.split('\n', 1)
+            self._lines.put(line)
+
+    def flush(self):
+        pass
+
+    def read_until(self, prefix, timeout=30):
+        """
+        Returns the lines written up to and including the first line starting with prefix.
+        """
+        lines = []
+        while not lines or not lines[-1].startswith(prefix):
+            lines.append(self._lines.get(timeout=timeout))
+        return lines
+
+
+class TestGessEngine(unittest.TestCase):
+    """
+    Contains unit tests for the GessEngine class.
+    """
+    def setUp(self):
+        """
+        Starts an engine on a thread, reading commands from a queue.
+        """
+        self.commands = queue.Queue()
+        self.output = EngineOutput()
+        self.engine = GessEngine(iter(self.commands.get, None), self.output, table_size=2 ** 12)
+        self.engine_thread = threading.Thread(target=self.engine.run)
+        self.engine_thread.start()
+
+    def tearDown(self):
+        """
+        Quits the engine and waits for it to exit.
+        """
+        self.commands.put('quit\n')
+        self.engine_thread.join(timeout=30)
+        self.assertFalse(self.engine_thread.is_alive())
+
+    def send(self, command):
+        self.commands.put(command + '\n')
+
+    def test_handshake(self):
+        """
+        Tests that the engine identifies itself, lists its options and answers isready.
+        """
+        self.send('gess')
+        lines = self.output.read_until('gessok')
+        self.assertTrue(lines[0].startswith('id name'))
+        self.assertIn('option name Ponder type check default false', lines)
+        self.send('isready')
+        self.assertEqual(self.output.read_until('readyok'), ['readyok'])
+        self.send('frobnicate')
+        self.assertEqual(self.output.read_until('info string'), ['info string unknown command: frobnicate'])
+
+    def test_go_depth(self):
+        """
+        Tests that a search to a fixed depth reports a legal best move of the position set up, and a legal expected
+        reply.
+        """
+        self.send('position startpos moves c3-c5 r18-r16')
+        self.send('go depth 1')
+        lines = self.output.read_until('bestmove')
+        self.assertTrue(lines[0].startswith('info depth 1 score'))
+        tokens = lines[-1].split()
+
+        gess = GessGame()
+        self.assertTrue(gess.make_move('c3', 'c5'))
+        self.assertTrue(gess.make_move('r18', 'r16'))
+        self.assertTrue(gess.make_move(*tokens[1].split('-')))
+        if len(tokens) > 2:
+            self.assertEqual(tokens[2], 'ponder')
+            self.assertTrue(gess.make_move(*tokens[3].split('-')))
+
+    def test_stop_infinite_search(self):
+        """
+        Tests that stop ends an infinite search with a best move, and that pondering is stopped by the next command.
+        """
+        self.send('setoption name Ponder value true')
+        self.send('go infinite')
+        self.send('stop')
+        lines = self.output.read_until('bestmove')
+        self.assertIn(tuple(lines[-1].split()[1].split('-')), GessGame().get_legal_moves())
+
+        self.send('go movetime 50')
+        self.output.read_until('bestmove')
+        self.send('isready')
+        self.assertEqual(self.output.read_until('readyok'), ['readyok'])
+
+    def test_illegal_position_move(self):
+        """
+        Tests that an illegal move in a position command is reported, and the moves before it are kept.
+        """
+        self.send('position startpos moves c3-c5 c5-c7 r18-r16')
+        self.assertEqual(self.output.read_until('info string'), ['info string illegal move: c5-c7'])
+        self.send('go depth 1')
+        origin = self.output.read_until('bestmove')[-1].split()[1].split('-')[0]
+        self.assertIn(origin, [origin_square for (origin_square, _) in self._moves_after('c3', 'c5')])
+
+    def test_ponder(self):
+        """
+        Tests that go ponder searches without reporting until ponderhit, then reports once its movetime has passed, and
+        that stop ends a ponder search with a best move.
+        """
+        black_moves = self._moves_after('c3', 'c5')
+        self.send('position startpos moves c3-c5')
+        self.send('go ponder movetime 100')
+        time.sleep(0.5)
+        self.send('isready')
+        self.assertEqual(self.output.read_until('readyok'), ['readyok'])
+        self.send('ponderhit')
+        lines = self.output.read_until('bestmove')
+        self.assertGreaterEqual(int(lines[0].split()[2]), 1)
+        self.assertIn(tuple(lines[-1].split()[1].split('-')), black_moves)
+        self.send('ponderhit')
+        self.assertEqual(self.output.read_until('info string'), ['info string ponderhit without a ponder search'])
+
+        self.send('go ponder')
+        self.send('isready')
+        self.assertEqual(self.output.read_until('readyok'), ['readyok'])
+        self.send('stop')
+        self.assertIn(tuple(self.output.read_until('bestmove')[-1].split()[1].split('-')), black_moves)
+
+    def _moves_after(self, origin_square, destination_square):
+        gess = GessGame()
+        gess.make_move(origin_square, destination_square)
+        return gess.get_legal_moves()
+
+
+class TestGessEngineProcess(unittest.TestCase):
+    """
+    Contains a unit test running the engine as a subprocess over standard input and output.
+    """
+    def test_subprocess(self):
+        """
+        Tests that the engine answers over pipes, replies to go with a legal best move, and exits on quit.
+        """
+        engine_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'GessEngine.py')
+        completed = subprocess.run([sys.executable, engine_path], input='isready\ngo depth 1\nisready\nquit\n',
+                                   capture_output=True, text=True, timeout=60)
+        self.assertEqual(completed.returncode, 0)
+        lines = completed.stdout.split('\n')
+        self.assertEqual(lines[0], 'readyok')
+        self.assertIn('readyok', lines[1:])
+
+        # The search may be stopped by quit before it finishes its first depth, but it still replies with a best move
+        best_moves = [line.split() for line in lines if line.startswith('bestmove')]
+        self.assertEqual(len(best_moves), 1)
+        self.assertIn(tuple(best_moves[0][1].split('-')), GessGame().get_legal_moves())
+
+
+if __name__ == '__main__':
+    unittest.main()
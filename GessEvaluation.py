@@ -0,0 +1,195 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: Incrementally updated evaluation features for the game of Gess
+
+from GessGame import CENTER_BIT, SIGNATURE_UPDATES
+
+# The features kept for each player, in the order they are reported
+FEATURES = ('tokens', 'rings', 'movable_pieces', 'center_pieces', 'border_exposure')
+
+# The default weight of each feature when scoring a position
+DEFAULT_WEIGHTS = {
+    'tokens': 1,
+    'rings': 40,
+    'movable_pieces': 2,
+    'center_pieces': 3,
+    'border_exposure': -1,
+}
+
+_OPPONENTS = {'W': 'B', 'B': 'W'}
+
+# The kind of piece a player has for each piece signature, when the piece holds none of the opponent's tokens: 0 if it
+# cannot move (no token outside the center to set a direction), 1 if it is a movable piece and 2 if it is a movable
+# piece with a center token
+_PIECE_KINDS = tuple(0 if not signature & ~CENTER_BIT else 2 if signature & CENTER_BIT else 1
+                     for signature in range(512))
+
+
+def _classify_center(board, column_number, row_number):
+    """
+    Classifies the piece centered on a square of the board for each player.
+    :param board: A list of lists representing the Gess board.
+    :param column_number: Integer of the column of the center square, from 1 to 18.
+    :param row_number: Integer of the row of the center square, from 1 to 18.
+    :return: Returns a dictionary from each player to a tuple of three booleans: whether the square is the center of
+    one of the player's rings, whether it is the center of a movable piece of the player, and whether that movable piece
+    has a center token.
+    """
+    piece = [board[row][column]
+             for row in range(row_number - 1, row_number + 2)
+             for column in range(column_number - 1, column_number + 2)]
+    classification = {}
+    for token in 'WB':
+        ring = piece[4] == ' ' and piece.count(token) == 8
+
+        # A movable piece has only the player's tokens, including at least one outside the center to set a direction
+        movable = _OPPONENTS[token] not in piece and token in piece[:4] + piece[5:]
+        classification[token] = (ring, movable, movable and piece[4] == token)
+    return classification
+
+
+def _is_border_square(column_number, row_number):
+    """
+    Returns whether a square is on the outermost line of the playable area (columns b and s, rows 2 and 19), where a
+    token is one step from being pushed off the board.
+    """
+    return column_number in (1, 18) or row_number in (1, 18)
+
+
+def compute_features(board):
+    """
+    Computes the evaluation features of both players from scratch.
+    :param board: A list of lists representing the Gess board.
+    :return: Returns a dictionary from each player ('W' and 'B') to a dictionary from feature name to value.
+    """
+    features = {token: {feature: 0 for feature in FEATURES} for token in 'WB'}
+    for row_number in range(20):
+        for column_number in range(20):
+            square = board[row_number][column_number]
+            if square in features:
+                features[square]['tokens'] += 1
+                if _is_border_square(column_number, row_number):
+                    features[square]['border_exposure'] += 1
+
+    for row_number in range(1, 19):
+        for column_number in range(1, 19):
+            for token, (ring, movable, center) in _classify_center(board, column_number, row_number).items():
+                features[token]['rings'] += ring
+                features[token]['movable_pieces'] += movable
+                features[token]['center_pieces'] += center
+    return features
+
+
+class GessEvaluator:
+    """
+    A GessEvaluator object keeps the evaluation features of both players up to date as a GessBoard changes.
+    The GessEvaluator listens to every square set on the board, including the lifting, placing and clearing of tokens by
+    GessGame.make_move and the restoring of squares by GessGame.undo_move.
+    For each change, only the token counts of the square and the nine piece centers around it are updated, instead of
+    recomputing the features over the whole board. The pieces are read from the signatures the GessBoard keeps up to
+    date, rather than from the squares of the board.
+    The GessEvaluator scores positions as a weighted sum of the difference between the players' features.
+    """
+    def __init__(self, gess_board, weights=None):
+        """
+        Initiates the GessEvaluator object, computes the features of the current board and attaches to the board.
+        :param gess_board: The GessBoard object to evaluate, such as the one returned by GessGame.get_board_object.
+        :param weights: Optional dictionary from feature name to weight. Missing features use DEFAULT_WEIGHTS.
+        """
+        self._gess_board = gess_board
+        self._weights = dict(DEFAULT_WEIGHTS)
+        if weights is not None:
+            self.set_weights(weights)
+
+        self._features = compute_features(gess_board.get_board())
+
+        # The kind of piece (from _PIECE_KINDS, or 0 if the opponent has a token in it) centered on each square
+        self._signatures = {token: gess_board.get_signatures(token) for token in 'WB'}
+        self._piece_kinds = {token: [[0] * 20 for _ in range(20)] for token in 'WB'}
+        for token in 'WB':
+            (signatures, opponent_signatures) = (self._signatures[token], self._signatures[_OPPONENTS[token]])
+            for row_number in range(1, 19):
+                for column_number in range(1, 19):
+                    if not opponent_signatures[row_number][column_number]:
+                        self._piece_kinds[token][row_number][column_number] = \
+                            _PIECE_KINDS[signatures[row_number][column_number]]
+        gess_board.add_listener(self)
+
+    def detach(self):
+        """
+        Stops updating the features as the board changes.
+        :return: Returns True once the evaluator has been detached from the board.
+        """
+        return self._gess_board.remove_listener(self)
+
+    def set_weights(self, weights):
+        """
+        Changes the weights used to score positions.
+        :param weights: Dictionary from feature name to weight. Features not included keep their current weight.
+        :return: Returns True once the weights have been updated.
+        """
+        for feature, weight in weights.items():
+            if feature not in self._weights:
+                raise ValueError(f'Unknown evaluation feature: {feature}')
+            self._weights[feature] = weight
+        return True
+
+    def get_features(self, token):
+        """
+        Returns the current features of a player.
+        :param token: A single character ('W' or 'B') referring to the player.
+        :return: Returns a dictionary from feature name to value.
+        """
+        return dict(self._features[token])
+
+    def square_changed(self, column_number, row_number, previous, token):
+        """
+        Updates the features after a square of the board has changed. Called by the GessBoard for every change.
+        :param column_number: Integer of the column of the changed square.
+        :param row_number: Integer of the row of the changed square.
+        :param previous: String of the previous contents of the square.
+        :param token: String of the new contents of the square.
+        """
+        if row_number > 19 or column_number > 19:
+            return
+
+        border = _is_border_square(column_number, row_number)
+        if previous in self._features:
+            self._features[previous]['tokens'] -= 1
+            self._features[previous]['border_exposure'] -= border
+        if token in self._features:
+            self._features[token]['tokens'] += 1
+            self._features[token]['border_exposure'] += border
+
+        # Only the pieces centered on the square and its eight neighbours can change. The board has already updated
+        # their signatures and its ring centers by the time its listeners are notified.
+        (white_signatures, black_signatures) = (self._signatures['W'], self._signatures['B'])
+        (white_kinds, black_kinds) = (self._piece_kinds['W'], self._piece_kinds['B'])
+        changes = {'W': [0, 0], 'B': [0, 0]}
+        for (center_row, center_column, _) in SIGNATURE_UPDATES[row_number][column_number]:
+            white_signature = white_signatures[center_row][center_column]
+            black_signature = black_signatures[center_row][center_column]
+            for (player, kinds, kind) in (('W', white_kinds, 0 if black_signature else _PIECE_KINDS[white_signature]),
+                                          ('B', black_kinds, 0 if white_signature else _PIECE_KINDS[black_signature])):
+                old_kind = kinds[center_row][center_column]
+                if kind != old_kind:
+                    kinds[center_row][center_column] = kind
+                    changes[player][0] += (kind > 0) - (old_kind > 0)
+                    changes[player][1] += (kind == 2) - (old_kind == 2)
+
+        for player in 'WB':
+            features = self._features[player]
+            features['rings'] = self._gess_board.get_ring_count(player)
+            features['movable_pieces'] += changes[player][0]
+            features['center_pieces'] += changes[player][1]
+
+    def evaluate(self, token):
+        """
+        Scores the current position from the point of view of a player.
+        :param token: A single character ('W' or 'B') referring to the player.
+        :return: Returns the weighted sum of the differences between the player's features and the opponent's features.
+        """
+        features = self._features[token]
+        opponent_features = self._features[_OPPONENTS[token]]
+        return sum(weight * (features[feature] - opponent_features[feature])
+                   for feature, weight in self._weights.items())
@@ -0,0 +1,62 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: Unit testing to check validity of GessEvaluation.py
+
+import unittest
+
+from GessEvaluation import GessEvaluator, compute_features
+from GessGame import GessGame
+from GessTestGames import FULL_GAME
+
+
+class TestGessEvaluation(unittest.TestCase):
+    """
+    Contains unit tests for the GessEvaluator class
+    """
+
+    def test_starting_features(self):
+        """
+        Tests the features of the starting position, which are the same for both players.
+        """
+        evaluator = GessEvaluator(GessGame().get_board_object())
+        self.assertEqual(evaluator.get_features('B'), evaluator.get_features('W'))
+        self.assertEqual(evaluator.get_features('B')['tokens'], 43)
+        self.assertEqual(evaluator.get_features('B')['rings'], 1)
+        self.assertEqual(evaluator.evaluate('B'), 0)
+
+    def test_features_follow_moves_and_undo(self):
+        """
+        Tests that the incrementally updated features match features computed from scratch after every move and undo.
+        """
+        gess = GessGame()
+        evaluator = GessEvaluator(gess.get_board_object())
+        for (origin_square, destination_square) in FULL_GAME:
+            gess.make_move(origin_square, destination_square)
+            for token in 'WB':
+                self.assertEqual(evaluator.get_features(token), compute_features(gess.get_gess_board())[token])
+        self.assertEqual(gess.get_game_state(), 'BLACK_WON')
+        self.assertEqual(evaluator.get_features('W')['rings'], 0)
+        self.assertGreater(evaluator.evaluate('B'), 0)
+
+        while gess.undo_move():
+            for token in 'WB':
+                self.assertEqual(evaluator.get_features(token), compute_features(gess.get_gess_board())[token])
+        self.assertEqual(evaluator.evaluate('B'), 0)
+
+    def test_weights(self):
+        """
+        Tests that the score uses the configured weights, and that unknown features are rejected.
+        """
+        gess = GessGame()
+        evaluator = GessEvaluator(gess.get_board_object(), weights={'tokens': 10})
+        gess.make_move('c3', 'c6')
+        evaluator.set_weights({'rings': 0, 'movable_pieces': 0, 'center_pieces': 0, 'border_exposure': 0})
+        # Black's move captures one of its own tokens on c7
+        self.assertEqual(evaluator.evaluate('B'), -10)
+        self.assertEqual(evaluator.evaluate('W'), 10)
+        self.assertRaises(ValueError, evaluator.set_weights, {'mobility': 1})
+        self.assertEqual(evaluator.detach(), True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,293 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: A differential fuzz harness comparing the fast move paths of Gess to the reference rules of make_move
+
+import multiprocessing
+import random
+import sys
+from collections import namedtuple
+
+from GessGame import GessGame
+from GessPosition import Position
+
+_COLUMNS = 'abcdefghijklmnopqrst'
+
+# Square names tried as move attempts: every square of the board, including the boundary rows and columns, and a few
+# names just off the board
+_SQUARE_NAMES = [f'{column}{row}' for column in _COLUMNS for row in range(1, 21)] + ['u5', 'a21', 'c0', 'k21']
+
+# A divergence found by the harness: the index of the attempt after which a move path disagreed with the reference, the
+# name of the move path, and a description of the disagreement.
+Divergence = namedtuple('Divergence', ['attempt', 'path', 'message'])
+
+# A failure found by fuzz: the seed of the game it was found in, the name of the move path, the shortest list of
+# (origin square, destination square) move attempts found that still shows the divergence, and the divergence itself.
+FuzzFailure = namedtuple('FuzzFailure', ['seed', 'path', 'attempts', 'divergence'])
+
+# The result of a fuzz run: the number of games played, the number of move attempts made and a list of FuzzFailures.
+FuzzReport = namedtuple('FuzzReport', ['games', 'attempts', 'failures'])
+
+
+def _find_ring_centers(rows, token):
+    """
+    Returns the (row, column) centers of a player's rings, found by scanning the rows of the board.
+    """
+    ring = (token,) * 3
+    ring_middle = (token, ' ', token)
+    return tuple((row_number, column_number) for row_number in range(1, 19) for column_number in range(1, 19)
+                 if rows[row_number][column_number] == ' '
+                 and tuple(rows[row_number][column_number - 1:column_number + 2]) == ring_middle
+                 and tuple(rows[row_number - 1][column_number - 1:column_number + 2]) == ring
+                 and tuple(rows[row_number + 1][column_number - 1:column_number + 2]) == ring)
+
+
+class ReferencePath:
+    """
+    The reference rules: GessGame.make_move, with the rings found by scanning the board.
+    Every other move path is compared against this one.
+    A move path has a name, and four methods: start returns the state of a new game, apply makes a move attempt on a
+    state and returns whether the move was accepted and the state after the attempt, describe returns the rows of the
+    playable area of the board, the player to move, the game state and the ring centers of each player, and check
+    returns a description of anything wrong with a state that describe cannot show, or None.
+    """
+    name = 'make_move'
+
+    def start(self):
+        return GessGame()
+
+    def apply(self, gess_game, move):
+        return gess_game.make_move(*move), gess_game
+
+    def describe(self, gess_game):
+        rows = tuple(tuple(row[:20]) for row in gess_game.get_gess_board()[:20])
+        return (rows, gess_game.get_current_player(), gess_game.get_game_state(),
+                {token: _find_ring_centers(rows, token) for token in 'BW'})
+
+    def check(self, gess_game):
+        return None
+
+
+class PositionPath(ReferencePath):
+    """
+    Moves through immutable Position snapshots, with the opponent's rings updated incrementally by apply_move.
+    """
+    name = 'Position.apply_move'
+
+    def start(self):
+        return Position.from_game(GessGame())
+
+    def apply(self, position, move):
+        next_position = position.apply_move(*move)
+        return (False, position) if next_position is None else (True, next_position)
+
+    def describe(self, position):
+        return (position.get_rows(), position.get_current_player(), position.get_game_state(),
+                {token: position.get_ring_centers(token) for token in 'BW'})
+
+
+class LegalMovesPath(ReferencePath):
+    """
+    Accepts a move attempt exactly when it is one of the moves listed by GessGame.get_legal_moves.
+    """
+    name = 'get_legal_moves'
+
+    def apply(self, gess_game, move):
+        if tuple(move) not in gess_game.get_legal_moves():
+            return False, gess_game
+        gess_game.make_move(*move)
+        return True, gess_game
+
+
+class IncrementalRingsPath(ReferencePath):
+    """
+    Reads the rings kept incrementally by GessBoard, and the moves found by the ring capture detector, which must win.
+    """
+    name = 'GessBoard.get_ring_centers'
+
+    def describe(self, gess_game):
+        board = gess_game.get_board_object()
+        (rows, player, game_state, _) = super().describe(gess_game)
+        return (rows, player, game_state,
+                {token: tuple((row_number, column_number)
+                              for [column_number, row_number] in board.get_ring_centers(token)) for token in 'BW'})
+
+    def check(self, gess_game):
+        ring_capture_move = gess_game.get_ring_capture_move()
+        if ring_capture_move is None:
+            return None
+        captured = gess_game.copy()
+        if not captured.make_move(*ring_capture_move) or captured.get_game_state() == 'UNFINISHED':
+            return f'ring capture {"-".join(ring_capture_move)} does not win'
+        return None
+
+
+# The move paths compared by default
+MOVE_PATHS = (PositionPath, LegalMovesPath, IncrementalRingsPath)
+
+
+def _describe_difference(reference, other):
+    """
+    Returns a description of the first difference between two descriptions of a state.
+    """
+    (rows, player, game_state, ring_centers) = reference
+    (other_rows, other_player, other_game_state, other_ring_centers) = other
+    for row_number in (range(20) if rows != other_rows else ()):
+        for column_number in range(20):
+            if rows[row_number][column_number] != other_rows[row_number][column_number]:
+                return (f'square {_COLUMNS[column_number]}{20 - row_number} holds '
+                        f'{other_rows[row_number][column_number]!r} instead of {rows[row_number][column_number]!r}')
+    if player != other_player:
+        return f'player to move is {other_player!r} instead of {player!r}'
+    if game_state != other_game_state:
+        return f'game state is {other_game_state} instead of {game_state}'
+    for token in 'BW':
+        if tuple(sorted(ring_centers[token])) != tuple(sorted(other_ring_centers[token])):
+            return f'rings of {token} are {sorted(other_ring_centers[token])} instead of {sorted(ring_centers[token])}'
+    return None
+
+
+def run_attempts(move_paths, attempts):
+    """
+    Makes a sequence of move attempts through the reference rules and through each move path, comparing the return
+    value, board, player to move, game state and rings after every attempt, and running the checks of each move path.
+    :param move_paths: A sequence of move path classes, such as MOVE_PATHS.
+    :param attempts: A list of (origin square, destination square) string pairs, legal or not.
+    :return: Returns the first Divergence found, or None if every move path agreed with the reference throughout.
+    """
+    reference = ReferencePath()
+    reference_state = reference.start()
+    paths = [move_path() for move_path in move_paths]
+    states = [path.start() for path in paths]
+    for index, move in enumerate(attempts):
+        (accepted, reference_state) = reference.apply(reference_state, move)
+        description = reference.describe(reference_state)
+        for path_index, path in enumerate(paths):
+            (path_accepted, states[path_index]) = path.apply(states[path_index], move)
+            if path_accepted != accepted:
+                return Divergence(index, path.name, f'{"-".join(move)} returned {path_accepted} instead of {accepted}')
+            message = _describe_difference(description, path.describe(states[path_index])) or \
+                path.check(states[path_index])
+            if message is not None:
+                return Divergence(index, path.name, f'after {"-".join(move)}, {message}')
+    return None
+
+
+def shrink_attempts(move_paths, attempts):
+    """
+    Shrinks a sequence of move attempts showing a divergence by delta debugging: chunks of attempts are removed for as
+    long as the divergence, in the same move path, remains.
+    :param move_paths: A sequence of move path classes.
+    :param attempts: A list of move attempts for which run_attempts finds a divergence.
+    :return: Returns the shortened list of move attempts, from which no single attempt can be removed without losing the
+    divergence.
+    """
+    divergence = run_attempts(move_paths, attempts)
+    if divergence is None:
+        raise ValueError('The move attempts show no divergence to shrink')
+
+    # Attempts after the divergence are never needed
+    attempts = list(attempts[:divergence.attempt + 1])
+    chunk_count = 2
+    while len(attempts) >= 2:
+        chunk_size = -(-len(attempts) // chunk_count)
+        for start in range(0, len(attempts), chunk_size):
+            candidate = attempts[:start] + attempts[start + chunk_size:]
+            candidate_divergence = run_attempts(move_paths, candidate)
+            if candidate_divergence is not None and candidate_divergence.path == divergence.path:
+                attempts = candidate[:candidate_divergence.attempt + 1]
+                chunk_count = max(chunk_count - 1, 2)
+                break
+        else:
+            if chunk_size == 1:
+                break
+            chunk_count = min(chunk_count * 2, len(attempts))
+    return attempts
+
+
+def _generate_attempt(random_attempts, gess_game, legal_fraction):
+    """
+    Returns a random move attempt: a legal move with probability legal_fraction, and otherwise a pair of squares that
+    is often in a straight line, so that many attempts fail late in the rules rather than at once.
+    """
+    if random_attempts.random() < legal_fraction:
+        legal_moves = gess_game.get_legal_moves()
+        if legal_moves:
+            return random_attempts.choice(legal_moves)
+    origin_square = random_attempts.choice(_SQUARE_NAMES)
+    if random_attempts.random() < 0.5 and origin_square[0] in _COLUMNS and origin_square[1:] in map(str, range(1, 21)):
+        (row_step, column_step) = random_attempts.choice([(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1),
+                                                           (1, 0), (1, 1)])
+        distance = random_attempts.randint(1, 8)
+        column_number = _COLUMNS.index(origin_square[0]) + column_step * distance
+        row_number = int(origin_square[1:]) + row_step * distance
+        if 0 <= column_number < 20 and 1 <= row_number <= 20:
+            return origin_square, f'{_COLUMNS[column_number]}{row_number}'
+    return origin_square, random_attempts.choice(_SQUARE_NAMES)
+
+
+def _fuzz_game(task):
+    """
+    Plays one game of random move attempts through every move path, shrinking the attempts if a divergence is found.
+    Runs in a worker process of fuzz.
+    :param task: A tuple of the seed of the game, the move path classes, the largest number of attempts and the fraction
+    of attempts that are legal moves.
+    :return: Returns a tuple of the number of attempts made and a FuzzFailure, or None if no divergence was found.
+    """
+    (seed, move_paths, max_attempts, legal_fraction) = task
+    random_attempts = random.Random(seed)
+    gess = GessGame()
+    attempts = []
+    while len(attempts) < max_attempts and gess.get_game_state() == 'UNFINISHED':
+        move = _generate_attempt(random_attempts, gess, legal_fraction)
+        gess.make_move(*move)
+        attempts.append(tuple(move))
+
+    divergence = run_attempts(move_paths, attempts)
+    if divergence is None:
+        return len(attempts), None
+    shrunk_attempts = shrink_attempts(move_paths, attempts)
+    return len(attempts), FuzzFailure(seed, divergence.path, shrunk_attempts, run_attempts(move_paths, shrunk_attempts))
+
+
+def fuzz(move_paths=MOVE_PATHS, games=1000, max_attempts=200, legal_fraction=0.5, seed=0, processes=None,
+         games_per_chunk=8):
+    """
+    Plays games of random legal and illegal move attempts in worker processes, comparing each move path to the reference
+    rules of GessGame.make_move after every attempt.
+    :param move_paths: A sequence of move path classes, defined at the top level of a module so that worker processes
+    can load them. See ReferencePath for the methods of a move path.
+    :param games: Integer of the number of games to play.
+    :param max_attempts: Integer of the largest number of move attempts in each game.
+    :param legal_fraction: The fraction of move attempts chosen among the legal moves.
+    :param seed: Integer seed of the first game. Game i uses seed + i, so a failure can be replayed from its seed.
+    :param processes: Optional integer of the number of worker processes. Defaults to the number of CPUs.
+    :param games_per_chunk: Integer of the number of games sent to a worker at a time.
+    :return: Returns a FuzzReport.
+    """
+    tasks = [(seed + index, tuple(move_paths), max_attempts, legal_fraction) for index in range(games)]
+    attempt_count = 0
+    failures = []
+    with multiprocessing.Pool(processes) as pool:
+        for (game_attempts, failure) in pool.imap(_fuzz_game, tasks, chunksize=games_per_chunk):
+            attempt_count += game_attempts
+            if failure is not None:
+                failures.append(failure)
+    return FuzzReport(games, attempt_count, failures)
+
+
+def main():
+    """
+    Runs the fuzz harness from the command line, with an optional number of games, and prints the failures found.
+    """
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    report = fuzz(games=games)
+    print(f'{report.games} games, {report.attempts} move attempts, {len(report.failures)} failures')
+    for failure in report.failures:
+        print(f'seed {failure.seed}: {failure.path}: {failure.divergence.message}')
+        print('    ' + ' '.join(f'{origin_square}-{destination_square}'
+                                for (origin_square, destination_square) in failure.attempts))
+    return 1 if report.failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,77 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: Unit testing to check validity of GessFuzz.py
+
+import unittest
+
+from GessFuzz import MOVE_PATHS, Divergence, PositionPath, fuzz, run_attempts, shrink_attempts
+
+
+class ForgetfulPositionPath(PositionPath):
+    """
+    A deliberately broken move path, which rejects every move of a piece from column c.
+    """
+    name = 'forgetful'
+
+    def apply(self, position, move):
+        if move[0].startswith('c'):
+            return False, position
+        return super().apply(position, move)
+
+
+class SuspiciousPositionPath(PositionPath):
+    """
+    A move path whose check reports a problem whenever White is to move.
+    """
+    name = 'suspicious'
+
+    def check(self, position):
+        return 'White is not trusted' if position.get_current_player() == 'W' else None
+
+
+class TestGessFuzz(unittest.TestCase):
+    """
+    Contains unit tests for the GessFuzz harness
+    """
+
+    def test_move_paths_agree(self):
+        """
+        Tests that the move paths agree with the reference rules over games of random move attempts.
+        """
+        report = fuzz(games=4, max_attempts=60, processes=2, games_per_chunk=1)
+        self.assertEqual(report.games, 4)
+        self.assertGreater(report.attempts, 100)
+        self.assertEqual(report.failures, [])
+
+    def test_divergence_is_found_and_shrunk(self):
+        """
+        Tests that a broken move path is caught, and that its failing move attempts are shrunk to a sequence from which
+        no attempt can be removed.
+        """
+        report = fuzz(MOVE_PATHS + (ForgetfulPositionPath,), games=4, max_attempts=60, processes=2)
+        self.assertGreater(len(report.failures), 0)
+        for failure in report.failures:
+            self.assertEqual(failure.path, 'forgetful')
+            self.assertEqual(failure.divergence.attempt, len(failure.attempts) - 1)
+            self.assertTrue(failure.attempts[-1][0].startswith('c'))
+            for index in range(len(failure.attempts)):
+                divergence = run_attempts((ForgetfulPositionPath,), failure.attempts[:index] +
+                                          failure.attempts[index + 1:])
+                self.assertIsNone(divergence)
+
+        self.assertEqual(shrink_attempts((ForgetfulPositionPath,), [('r3', 'r4'), ('a1', 'a2'), ('r18', 'r17'),
+                                                                    ('c3', 'c4'), ('r17', 'r16')]),
+                         [('c3', 'c4')])
+        with self.assertRaises(ValueError):
+            shrink_attempts(MOVE_PATHS, [('c3', 'c4')])
+
+    def test_check_failure_is_a_divergence(self):
+        """
+        Tests that a problem reported by the check of a move path is a divergence after the attempt that caused it.
+        """
+        self.assertEqual(run_attempts((SuspiciousPositionPath,), [('a1', 'a2'), ('c3', 'c4')]),
+                         Divergence(1, 'suspicious', 'after c3-c4, White is not trusted'))
+
+
+if __name__ == '__main__':
+    unittest.main()
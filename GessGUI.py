@@ -2,7 +2,11 @@
 # Date: 06/04/2020
 # Description: A GUI implementation of the game of Gess using Kivy
 
+import sys
+
 from GessGame import GessGame
+from GessNotation import NotationError, read_games
+from GessReplay import GessReplay
 from kivy.app import App
 from kivy.lang import Builder
 from kivy.uix.boxlayout import BoxLayout
@@ -99,6 +103,23 @@ kv_string = """
                 text: ' '
                 size_hint_x: None
                 width: 3
+        BoxLayout:
+            orientation: 'horizontal'
+            id: replay_bar
+            size_hint_y: None
+            height: 25
+            Label:
+                text: 'Replay'
+                size_hint_x: None
+                width: 60
+            Slider:
+                id: replay_slider
+                min: 0
+                max: 0
+                step: 1
+                value: 0
+                disabled: True
+                on_value: root.seek_replay(int(self.value))
         Label:
             text: ' '
             size_hint_y: None
@@ -202,6 +223,8 @@ class GessGameGUI(BoxLayout):
     The GessGameGUI allows the user to press the resign and reset buttons, respectively resigning or resetting the game.
     The GessGameGUI provides highlights to selection (green for selected origin square and yellow for selected tokens).
     The GessGameGUI removes highlights from squares after a move has been made, whether valid or invalid.
+    The GessGameGUI can load a recorded game into replay mode, where the slider moves the board to any ply of the game.
+    Seeks go through the snapshots of a GessReplay, and only the squares that changed are redrawn.
     """
 
     def __init__(self, **kwargs):
@@ -215,12 +238,16 @@ class GessGameGUI(BoxLayout):
         self._status = 'WAITING_FOR_SELECTION'
         self._origin_square_selection = ''
         self._destination_square_selection = ''
+        self._replay = None
         self.update_board()
 
     def press_resign_button(self):
         """
         When the 'Resign Game' button is pressed, updates the current game status in the back end and the GUI display.
         """
+        # Games being replayed cannot be resigned
+        if self._replay is not None:
+            return
         # First, call the resign game function in the back end class. This effectively ends the game.
         self._gess_game.resign_game()
         # Then, update the current GUI to reflect that the game has ended and the appropriate player has won.
@@ -230,8 +257,12 @@ class GessGameGUI(BoxLayout):
         """
         When the 'Reset Game' button is pressed, updates the current game status in the back end and the GUI display.
         """
-        # First, reset the current back end class. This effectively resets the game.
+        # First, reset the current back end class and leave replay mode. This effectively resets the game.
         self._gess_game = GessGame()
+        self._replay = None
+        self.ids['replay_slider'].disabled = True
+        self.ids['replay_slider'].max = 0
+        self.ids['replay_slider'].value = 0
         # Then, update the current GUI to reflect that the game has been reset.
         self.update_board()
         self.update_current_status()
@@ -282,7 +313,7 @@ class GessGameGUI(BoxLayout):
         # Initial test for validation of squares within the playable board
         # If the square coordinates received are not within the playable area, return False
         global square_names
-        if square_coords not in just_playable_square_names:
+        if square_coords not in just_playable_square_names or self._replay is not None:
             return False
 
         # If this is the first square selection made by the current player, set the selected square as the origin
@@ -345,7 +376,13 @@ class GessGameGUI(BoxLayout):
         Updates the current status displayed in the game GUI based on the backend of the Gess game.
         :return: Returns None
         """
-        if self._gess_game.get_game_state() == 'UNFINISHED':
+        if self._replay is not None:
+            current_ply = self._replay.get_current_ply()
+            self.ids['current_status_gui'].text = f'Replay: ply {current_ply} of {len(self._replay)}'
+            if current_ply == len(self._replay) and self._replay.get_result() != 'UNFINISHED':
+                winning_player = 'Black' if self._replay.get_result() == 'BLACK_WON' else 'White'
+                self.ids['current_status_gui'].text += ' - ' + winning_player + ' Won!'
+        elif self._gess_game.get_game_state() == 'UNFINISHED':
             current_player = 'Black' if self._gess_game.get_current_player() == 'B' else 'White'
             self.ids['current_status_gui'].text = 'Current Player: ' + current_player
         else:
@@ -372,43 +409,97 @@ class GessGameGUI(BoxLayout):
         # For each match, set the resulting square of the GUI so that it's contents match the backend contents
         square_names_and_contents = zip(square_names, current_contents)
         for (square_name, square_contents) in square_names_and_contents:
-            square = self.ids[square_name]
+            self.update_square(square_name, square_contents)
+
+        # Update the current status displayed at the top of the board
+        self.update_current_status()
 
-            # For squares with containing tokens, place the token (a unicode filled circle symbol) in the square center.
-            if square_contents in {'W', 'B'}:
-                square.text = u'\u25CF'
-                square.font_size = 40
-                square.bold = False
-                square.text_size = (0, 38)
+    def update_square(self, square_name, square_contents):
+        """
+        Updates a single square of the GUI board to display the given contents.
+        :param square_name: Takes a string representing the letter and number of a square on the Gess Board (f5 or o12)
+        :param square_contents: Takes the contents of the square: 'W', 'B', ' ' or the text of a label square.
+        :return: Returns None.
+        """
+        square = self.ids[square_name]
 
-                # For squares with Black tokens, set the font color of the token to Black.
-                if square_contents == 'B':
-                    square.color = 0, 0, 0, 1
+        # For squares with containing tokens, place the token (a unicode filled circle symbol) in the square center.
+        if square_contents in {'W', 'B'}:
+            square.text = u'\u25CF'
+            square.font_size = 40
+            square.bold = False
+            square.text_size = (0, 38)
 
-                # If the token is white, set the font color to White.
-                else:
-                    square.color = 1, 1, 1, 1
+            # For squares with Black tokens, set the font color of the token to Black.
+            if square_contents == 'B':
+                square.color = 0, 0, 0, 1
 
-            # For squares without tokens, set the text format to black and normal font.
+            # If the token is white, set the font color to White.
             else:
-                square.text = square_contents
-                square.color = 0, 0, 0, 1
-                square.font_size = 16
-                square.bold = True
-                square.text_size = (None, None)
+                square.color = 1, 1, 1, 1
 
-        # Update the current status displayed at the top of the board
+        # For squares without tokens, set the text format to black and normal font.
+        else:
+            square.text = square_contents
+            square.color = 0, 0, 0, 1
+            square.font_size = 16
+            square.bold = True
+            square.text_size = (None, None)
+
+    def load_replay(self, path):
+        """
+        Loads the first game of a file in Gess text notation and enters replay mode at its starting position.
+        :param path: Takes a string of the path of the file.
+        :return: Returns True if a game was loaded, or False if the file holds no game or its first game is not valid
+        Gess notation.
+        """
+        try:
+            with open(path) as game_file:
+                game = next(read_games(game_file), None)
+        except NotationError:
+            return False
+        if game is None:
+            return False
+
+        # Show the starting position, then let the slider move through every ply of the game
+        self._gess_game = GessGame()
+        self._replay = GessReplay(game.moves, game.result)
+        self._status = 'WAITING_FOR_SELECTION'
+        self.update_board()
+        self.ids['replay_slider'].max = len(self._replay)
+        self.ids['replay_slider'].value = 0
+        self.ids['replay_slider'].disabled = False
+        return True
+
+    def seek_replay(self, ply):
+        """
+        Moves the replayed game to a ply, redrawing only the squares that changed.
+        :param ply: Takes an integer between 0 (the starting position) and the number of moves of the replayed game.
+        :return: Returns None.
+        """
+        if self._replay is None or ply == self._replay.get_current_ply():
+            return
+        for (square_name, square_contents) in self._replay.seek(ply):
+            self.update_square(square_name, square_contents)
         self.update_current_status()
 
 
 class GessApp(App):
     """
     Runs an App and loads a fresh copy of the Gess Game GUI for the user to utilize.
+    If given the path of a recorded game in Gess text notation, the GUI starts in replay mode on that game.
     """
+    def __init__(self, replay_path=None, **kwargs):
+        super(GessApp, self).__init__(**kwargs)
+        self._replay_path = replay_path
+
     def build(self):
-        return GessGameGUI()
+        gess_game_gui = GessGameGUI()
+        if self._replay_path is not None:
+            gess_game_gui.load_replay(self._replay_path)
+        return gess_game_gui
 
 
-# Allows the Gess App to be run as a script.
+# Allows the Gess App to be run as a script, optionally with the path of a recorded game to replay.
 if __name__ == '__main__':
-    GessApp().run()
+    GessApp(sys.argv[1] if len(sys.argv) > 1 else None).run()
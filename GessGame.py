@@ -2,6 +2,34 @@
 # Date: 06/01/2020
 # Description: An implementation of the game of Gess
 
+import random
+from collections import namedtuple
+
+from GessRenderer import GessTerminalRenderer
+
+# Random keys used to hash positions, one for each token color on each square of the playable 20x20 area,
+# and one for White being the player to move. A fixed seed keeps hashes identical across processes and runs.
+_hash_random = random.Random(6012020)
+_SQUARE_KEYS = {token: [[_hash_random.getrandbits(64) for _ in range(20)] for _ in range(20)] for token in 'WB'}
+_WHITE_TO_MOVE_KEY = _hash_random.getrandbits(64)
+
+
+def get_position_hash(board, player):
+    """
+    Returns a 64 bit hash of a Gess position, which is stable across processes and runs.
+    :param board: A list of lists representing the Gess board, as returned by GessBoard.get_board.
+    :param player: The character 'W' or 'B' representing the player to move.
+    :return: Returns an integer between 0 and 2**64 - 1 identifying the position.
+    """
+    position_hash = _WHITE_TO_MOVE_KEY if player == 'W' else 0
+    for row_index in range(20):
+        row = board[row_index]
+        for column_index in range(20):
+            square = row[column_index]
+            if square in _SQUARE_KEYS:
+                position_hash ^= _SQUARE_KEYS[square][row_index][column_index]
+    return position_hash
+
 
 class GessBoard:
     """
@@ -20,6 +48,16 @@ class GessBoard:
         """
         self._gess_board = []
         self._square_coords = {}
+        self._board_hash = 0
+        self._listeners = []
+        self._change_log = None
+
+        # For each player, the 9 bit signature of the player's tokens in the piece centered on each square, and the
+        # centers of the player's rings. Both are kept up to date by set_square, so pieces can be examined without
+        # building lists of their squares.
+        self._signatures = {token: [[0] * 20 for _ in range(20)] for token in 'WB'}
+        self._ring_centers = {token: set() for token in 'WB'}
+
         # Create a dictionary of the letters represented on the Gess board.
         # Use enumerate to obtain the placement of that letter in the dictionary.
         self._LETTERS = {index: letter for letter, index in enumerate('abcdefghijklmnopqrst', 1)}
@@ -51,9 +89,7 @@ class GessBoard:
             :param token: A character ('B' for Black or 'W' for White) representing the color of the token to place
             :return: Returns True if the token was successfully placed in the square, or False if not.
             """
-            # Square coord is the column followed by the row, so this must be reversed to access the board row first
-            self._gess_board[square_coord[1]][square_coord[0]] = token
-            return True
+            return self.set_square(square_coord[0], square_coord[1], token)
 
         # Iterate over the lists of starting tokens by color and place tokens in each square in the list
         [place_token(self.get_square_from_coords(coords), 'W') for coords in white_tokens]
@@ -65,30 +101,188 @@ class GessBoard:
         :param token: A single character ('W' or 'B') referring to which player whose ring status is desired
         :return: If the player whose token was searched has rings remaining, return True. If not, return False.
         """
-        # Iterate through the rows of the board
-        # Ignore rows that are not part of the board (row 20, row 1, and the column header row)
-        # Then iterate through the columns of each row
-        # Ignore columns that are not part of the board (column a, column t, and the row header column)
-        # If the middle square is empty, then check if the piece around that square is a ring for the player
-        # If it is, return True.
-        # If we iterate through to the end of the board without finding a ring, return False.
-        for row_index, row_contents in enumerate(self._gess_board):
-            if row_index not in [0, 20, 21]:
-                for column_index, square_contents in enumerate(row_contents):
-                    if column_index not in [0, 20, 21]:
-                        if square_contents == ' ':
-                            piece = self.get_piece_from_square([row_index, column_index])
-                            if piece == [token, token, token, token, ' ', token, token, token, token]:
-                                return True
-        return False
+        # The centers of the player's rings are kept up to date as squares change, so no search is needed
+        return len(self._ring_centers[token]) > 0
 
     def get_board(self):
         """
         Returns the current state of the Gess board.
+        The board should only be changed through set_square, so that listeners and the board hash stay up to date.
         :return: Returns a list of lists representing the Gess Board.
         """
         return self._gess_board
 
+    def get_board_hash(self):
+        """
+        Returns the hash of the tokens on the board, which is updated as each square changes.
+        :return: Returns an integer between 0 and 2**64 - 1, equal to get_position_hash of the board with Black to move.
+        """
+        return self._board_hash
+
+    def set_square(self, column_number, row_number, token):
+        """
+        Sets the contents of a square of the board.
+        Every change to the board is made through this function, which updates the board hash, records the change in
+        the change log (if one has been started) and notifies each listener of the change.
+        :param column_number: Integer of the column of the square on the board.
+        :param row_number: Integer of the row of the square on the board.
+        :param token: String of the new contents of the square (' ', 'W' or 'B').
+        :return: Returns True once the square has been set.
+        """
+        previous = self._gess_board[row_number][column_number]
+        if previous == token:
+            return True
+        self._gess_board[row_number][column_number] = token
+
+        # Only the tokens of the playable 20x20 area are part of the hash and signatures, not the row and column labels
+        if row_number < 20 and column_number < 20:
+            if previous in _SQUARE_KEYS:
+                self._board_hash ^= _SQUARE_KEYS[previous][row_number][column_number]
+            if token in _SQUARE_KEYS:
+                self._board_hash ^= _SQUARE_KEYS[token][row_number][column_number]
+            self._update_signatures(column_number, row_number, previous, token)
+
+        if self._change_log is not None:
+            self._change_log.append((column_number, row_number, previous))
+        for listener in self._listeners:
+            listener.square_changed(column_number, row_number, previous, token)
+        return True
+
+    def _update_signatures(self, column_number, row_number, previous, token):
+        """
+        Updates the piece signatures and ring centers of the pieces around a square whose contents have changed.
+        """
+        previous_signatures = self._signatures.get(previous)
+        signatures = self._signatures.get(token)
+        white_signatures = self._signatures['W']
+        black_signatures = self._signatures['B']
+        for (center_row, center_column, bit) in SIGNATURE_UPDATES[row_number][column_number]:
+            if previous_signatures is not None:
+                previous_signatures[center_row][center_column] &= ~bit
+            if signatures is not None:
+                signatures[center_row][center_column] |= bit
+
+            # A ring has all eight outer squares of the player and an empty center square
+            white_signature = white_signatures[center_row][center_column]
+            black_signature = black_signatures[center_row][center_column]
+            for (signature, center_token, ring_centers) in (
+                    (white_signature, black_signature & CENTER_BIT, self._ring_centers['W']),
+                    (black_signature, white_signature & CENTER_BIT, self._ring_centers['B'])):
+                if signature == RING_SIGNATURE and not center_token:
+                    ring_centers.add((center_row, center_column))
+                else:
+                    ring_centers.discard((center_row, center_column))
+
+    def get_piece_signature(self, token, center_square):
+        """
+        Returns the signature of a player's tokens in the piece centered on a square.
+        :param token: A single character ('W' or 'B') referring to the player.
+        :param center_square: List of the column number and row number of the center square, from 1 to 18.
+        :return: Returns a 9 bit integer, in which bit i is set if square i of the piece (in the order of
+        get_piece_from_square) holds one of the player's tokens.
+        """
+        [column_number, row_number] = center_square
+        return self._signatures[token][row_number][column_number]
+
+    def is_empty_piece(self, center_square):
+        """
+        Returns whether the piece centered on a square holds no tokens of either player.
+        :param center_square: List of the column number and row number of the center square, from 1 to 18.
+        :return: Returns True if all nine squares of the piece are empty, or False if not.
+        """
+        [column_number, row_number] = center_square
+        return not (self._signatures['W'][row_number][column_number] or
+                    self._signatures['B'][row_number][column_number])
+
+    def is_movable_piece(self, token, center_square):
+        """
+        Returns whether the piece centered on a square can be moved by a player: it holds only the player's tokens,
+        with at least one token outside the center square to give it a direction.
+        :param token: A single character ('W' or 'B') referring to the player.
+        :param center_square: List of the column number and row number of the center square, from 1 to 18.
+        :return: Returns True if the player may move the piece, or False if not.
+        """
+        [column_number, row_number] = center_square
+        opponent = 'B' if token == 'W' else 'W'
+        return (self._signatures[token][row_number][column_number] & ~CENTER_BIT != 0 and
+                self._signatures[opponent][row_number][column_number] == 0)
+
+    def get_piece_directions(self, token, center_square):
+        """
+        Returns the directions a player's piece can move in, given by the player's tokens around its center square.
+        :param token: A single character ('W' or 'B') referring to the player.
+        :param center_square: List of the column number and row number of the center square, from 1 to 18.
+        :return: Returns a tuple of (change in rows, change in columns) tuples, in the order of DIRECTIONS.
+        """
+        return PIECE_DIRECTIONS[self.get_piece_signature(token, center_square)]
+
+    def has_center_token(self, token, center_square):
+        """
+        Returns whether the piece centered on a square has one of a player's tokens in its center, allowing it to move
+        any distance.
+        :param token: A single character ('W' or 'B') referring to the player.
+        :param center_square: List of the column number and row number of the center square, from 1 to 18.
+        :return: Returns True if the center square holds the player's token, or False if not.
+        """
+        return self.get_piece_signature(token, center_square) & CENTER_BIT != 0
+
+    def is_ring(self, token, center_square):
+        """
+        Returns whether the piece centered on a square is a ring of a player.
+        :param token: A single character ('W' or 'B') referring to the player.
+        :param center_square: List of the column number and row number of the center square, from 1 to 18.
+        :return: Returns True if the piece is a ring of the player, or False if not.
+        """
+        [column_number, row_number] = center_square
+        return (row_number, column_number) in self._ring_centers[token]
+
+    def add_listener(self, listener):
+        """
+        Registers a listener to be notified of every change to the board.
+        :param listener: An object with a square_changed(column_number, row_number, previous, token) method.
+        :return: Returns True once the listener has been added.
+        """
+        self._listeners.append(listener)
+        return True
+
+    def remove_listener(self, listener):
+        """
+        Stops notifying a listener of changes to the board.
+        :param listener: A listener previously registered using add_listener.
+        :return: Returns True if the listener was removed, or False if it was not registered.
+        """
+        if listener not in self._listeners:
+            return False
+        self._listeners.remove(listener)
+        return True
+
+    def start_change_log(self):
+        """
+        Starts recording the previous contents of every square that is changed, so the changes can be undone.
+        :return: Returns the list the changes are recorded in, as (column number, row number, previous contents) tuples.
+        """
+        self._change_log = []
+        return self._change_log
+
+    def stop_change_log(self):
+        """
+        Stops recording changes to the board.
+        :return: Returns the list of changes recorded since start_change_log was called.
+        """
+        change_log = self._change_log
+        self._change_log = None
+        return change_log
+
+    def undo_changes(self, change_log):
+        """
+        Restores the squares of a change log to their previous contents, most recent change first.
+        :param change_log: A list of changes returned by stop_change_log.
+        :return: Returns True once the changes have been undone.
+        """
+        for (column_number, row_number, previous) in reversed(change_log):
+            self.set_square(column_number, row_number, previous)
+        return True
+
     def get_square_from_coords(self, center_square_coords):
         """
         Converts a string of the column letter and row number of a Gess board square into a list of coordinates.
@@ -117,6 +311,59 @@ class GessBoard:
         self._square_coords[center_square_coords] = [column_number - 1, row_number - 1]
         return [column_number - 1, row_number - 1]
 
+    def get_coords_from_square(self, square):
+        """
+        Converts a list of the column and row of a square on the Gess board into the square's column letter and row
+        number. This is the reverse of get_square_from_coords.
+        :param square: List of the column number and row number of a square on the Gess board.
+        :return: A string of the column letter and row number of the square, such as 'c3'.
+        """
+        [column_number, row_number] = square
+        return 'abcdefghijklmnopqrst'[column_number] + str(20 - row_number)
+
+    def get_ring_centers(self, token):
+        """
+        Returns the center squares of all of the rings of the requested player.
+        :param token: A single character ('W' or 'B') referring to the player whose rings are desired.
+        :return: A list of [column number, row number] lists of the empty center square of each ring.
+        """
+        return [[column_number, row_number] for (row_number, column_number) in sorted(self._ring_centers[token])]
+
+    def get_ring_count(self, token):
+        """
+        Returns the number of rings of the requested player, without listing their centers.
+        :param token: A single character ('W' or 'B') referring to the player whose rings are counted.
+        :return: Returns an integer of the number of rings.
+        """
+        return len(self._ring_centers[token])
+
+    def get_signatures(self, token):
+        """
+        Returns the piece signatures of a player, for code that examines many pieces at once, such as an evaluator
+        listening to the board. The rows are kept up to date by set_square before listeners are notified, and must
+        not be changed by the caller.
+        :param token: A single character ('W' or 'B') referring to the player.
+        :return: Returns a 20x20 list of lists, indexed by row number and then column number, of the 9 bit signature
+        of the piece centered on each square, as returned by get_piece_signature.
+        """
+        return self._signatures[token]
+
+    def copy(self):
+        """
+        Returns a new GessBoard with the same tokens, without the listeners or change log of this board.
+        :return: Returns a GessBoard object.
+        """
+        board_copy = GessBoard.__new__(GessBoard)
+        board_copy._gess_board = [list(row) for row in self._gess_board]
+        board_copy._square_coords = self._square_coords
+        board_copy._LETTERS = self._LETTERS
+        board_copy._board_hash = self._board_hash
+        board_copy._signatures = {token: [list(row) for row in rows] for token, rows in self._signatures.items()}
+        board_copy._ring_centers = {token: set(centers) for token, centers in self._ring_centers.items()}
+        board_copy._listeners = []
+        board_copy._change_log = None
+        return board_copy
+
     def get_piece_from_square(self, center_square):
         """
         Takes a list of the column and row of a square on the Gess board square and returns the piece of that square.
@@ -137,6 +384,48 @@ class GessBoard:
         return piece
 
 
+# The eight directions a piece can move in, as (change in rows, change in columns, index of the token in the piece that
+# allows a move in that direction). The order of the piece indices matches get_piece_from_square.
+DIRECTIONS = ((-1, -1, 0), (-1, 0, 1), (-1, 1, 2), (0, -1, 3), (0, 1, 5), (1, -1, 6), (1, 0, 7), (1, 1, 8))
+
+# The bit of the center square in a piece signature, and the signature of a ring (every square but the center)
+CENTER_BIT = 1 << 4
+RING_SIGNATURE = 0b111111111 & ~CENTER_BIT
+
+# The directions a piece can move in for each of the 512 piece signatures, as (change in rows, change in columns)
+PIECE_DIRECTIONS = tuple(tuple((row_step, column_step) for (row_step, column_step, index) in DIRECTIONS
+                               if signature & (1 << index))
+                         for signature in range(512))
+
+# For each square of the playable area, the (center row, center column, bit) of each piece signature the square is
+# part of. Only the pieces centered on rows and columns 1 to 18 are kept, since no other square can be a piece center.
+SIGNATURE_UPDATES = [[tuple((center_row, center_column, 1 << ((row_number - center_row + 1) * 3 +
+                                                               column_number - center_column + 1))
+                             for center_row in range(max(row_number - 1, 1), min(row_number + 2, 19))
+                             for center_column in range(max(column_number - 1, 1), min(column_number + 2, 19)))
+                       for column_number in range(20)]
+                      for row_number in range(20)]
+
+# For a piece centered up to two rows and columns away from another piece, the bits of its signature that lie within
+# the footprint of the other piece, keyed by (change in rows, change in columns) between the two centers.
+_FOOTPRINT_OVERLAPS = {(row_offset, column_offset): sum(1 << (row_index * 3 + column_index)
+                                                        for row_index in range(3) for column_index in range(3)
+                                                        if abs(row_offset + row_index - 1) <= 1
+                                                        and abs(column_offset + column_index - 1) <= 1)
+                       for row_offset in range(-2, 3) for column_offset in range(-2, 3)}
+
+# The kinds of event a GessGame sends to its subscribers
+GAME_EVENTS = ('move', 'resign', 'game_over')
+
+# An event sent to the subscribers of a GessGame. The kind is one of GAME_EVENTS, and the player is the player who moved
+# or resigned. For a move, the origin and destination are the squares of the move, and lifted, captured and
+# border_cleared are tuples of (square, token) pairs: the tokens lifted from the origin footprint, the tokens removed
+# from the destination footprint, and the tokens removed from the boundary rows and columns after the move.
+# The game state is the state of the game after the move or resignation.
+GessEvent = namedtuple('GessEvent', ['kind', 'player', 'origin', 'destination', 'lifted', 'captured',
+                                     'border_cleared', 'game_state'])
+
+
 class GessGame:
     """
     A GessGame object represents a game of Gess, a variant of the two board games Chess and Go.
@@ -153,6 +442,75 @@ class GessGame:
         self._game_state = 'UNFINISHED'
         self._current_player = "B"
         self._board = GessBoard()
+        self._history = []
+        self._subscribers = []
+        self._last_move_tokens = None
+
+    def copy(self):
+        """
+        Returns a new GessGame in the same position, with the same current player and game state.
+        The copy does not share the board, listeners or move history of this game, so it can be searched freely.
+        :return: Returns a GessGame object.
+        """
+        game_copy = GessGame.__new__(GessGame)
+        game_copy._game_state = self._game_state
+        game_copy._current_player = self._current_player
+        game_copy._board = self._board.copy()
+        game_copy._history = []
+        game_copy._subscribers = []
+        game_copy._last_move_tokens = None
+        return game_copy
+
+    def subscribe(self, callback, events=GAME_EVENTS):
+        """
+        Registers a callback to be called synchronously with a GessEvent after each move, resignation or game over.
+        :param callback: A function taking a single GessEvent.
+        :param events: Optional collection of the kinds of event (from GAME_EVENTS) the callback receives.
+        :return: Returns True once the callback has been registered.
+        """
+        for kind in events:
+            if kind not in GAME_EVENTS:
+                raise ValueError(f'Unknown game event: {kind}')
+        self._subscribers.append((callback, frozenset(events)))
+        return True
+
+    def subscribe_queue(self, event_queue, loop, events=GAME_EVENTS):
+        """
+        Registers an asyncio queue to receive each GessEvent, so that coroutines can await the events of the game.
+        Events are handed to the queue through the event loop, so moves may be made from any thread.
+        :param event_queue: The asyncio.Queue the events are put on.
+        :param loop: The asyncio event loop the queue belongs to.
+        :param events: Optional collection of the kinds of event (from GAME_EVENTS) the queue receives.
+        :return: Returns the callback that was registered, which can be passed to unsubscribe.
+        """
+        def put_event(event):
+            loop.call_soon_threadsafe(event_queue.put_nowait, event)
+        self.subscribe(put_event, events)
+        return put_event
+
+    def unsubscribe(self, callback):
+        """
+        Stops sending events to a callback.
+        :param callback: A callback registered with subscribe, or returned by subscribe_queue.
+        :return: Returns True if the callback was removed, or False if it was not registered.
+        """
+        for subscriber in self._subscribers:
+            if subscriber[0] == callback:
+                self._subscribers.remove(subscriber)
+                return True
+        return False
+
+    def _publish(self, event):
+        """
+        Sends an event to each subscriber of its kind, followed by a game over event if the game has just ended.
+        """
+        events = [event]
+        if event.game_state != 'UNFINISHED':
+            events.append(event._replace(kind='game_over'))
+        for event_to_send in events:
+            for (callback, kinds) in list(self._subscribers):
+                if event_to_send.kind in kinds:
+                    callback(event_to_send)
 
     def get_gess_board(self):
         """
@@ -161,29 +519,32 @@ class GessGame:
         """
         return self._board.get_board()
 
-    def display(self):
-        """
-        Displays the current state of the Gess Board as a series of print statements.
-        :return: Returns True once the board has been displayed using print statements.
-        """
-        current_board = self._board.get_board()
-        for row_index, row in enumerate(current_board):
-            if row_index == 20:
-                line = '|'.join([letter for letter in row])
-            else:
-                formatted_row = []
-                for square in row:
-                    square_format = f'\033[;4m{square}\033[0m'
-                    if square == ' ':
-                        square_format = f'\033[;37;4;43m{square}\033[0m'
-                    if square == 'W':
-                        square_format = '\033[;30;4;1;43mO\033[0m'
-                    if square == 'B':
-                        square_format = '\033[;4;37;1;43mO\033[0m' #●
-                    formatted_row.append(square_format)
-                line = '\033[;43;4;37m|\033[0m'.join([formatted_square for formatted_square in formatted_row])
-            print(line)
-        print('\n')
+    def get_position_hash(self):
+        """
+        Returns a hash of the current position, including the player to move, for use in caches and opening books.
+        :return: Returns an integer between 0 and 2**64 - 1 identifying the current position.
+        """
+        position_hash = self._board.get_board_hash()
+        return position_hash ^ _WHITE_TO_MOVE_KEY if self.get_current_player() == 'W' else position_hash
+
+    def get_board_object(self):
+        """
+        Returns the GessBoard object of the game, so that components such as evaluators can listen to its changes.
+        :return: Returns the GessBoard object holding the board of the game.
+        """
+        return self._board
+
+    def display(self, renderer=None):
+        """
+        Displays the current state of the Gess Board in the terminal.
+        The frame is built in a single buffer by a GessTerminalRenderer and written at once.
+        :param renderer: Optional GessTerminalRenderer to draw with, such as a live renderer that only redraws changes.
+        If not provided, the full board is written to standard output.
+        :return: Returns True once the board has been displayed (or skipped by the renderer's frame rate limit).
+        """
+        if renderer is None:
+            renderer = GessTerminalRenderer()
+        renderer.draw(self._board.get_board())
         return True
 
     def get_game_state(self):
@@ -226,6 +587,53 @@ class GessGame:
         return True
 
     def make_move(self, origin_square, destination_square):
+        """
+        Allows the current player to move a token from the origin square to the destination square.
+        The changes made by a successful move are recorded so that the move can be taken back with undo_move.
+        The rules of a legal move are described in _apply_move.
+        :param origin_square: string of column letter and row number of a Gess board square
+        whose the desired piece is being moved from
+        :param destination_square: string of column letter and row number of a Gess board square
+        where the desired piece is being moved to
+        :return: Returns True if the move was made successfully. Returns False if the move was not allowed.
+        """
+        previous_player = self.get_current_player()
+        previous_game_state = self.get_game_state()
+        self._board.start_change_log()
+        try:
+            moved = self._apply_move(origin_square, destination_square)
+        finally:
+            change_log = self._board.stop_change_log()
+        if moved:
+            self._history.append((change_log, previous_player, previous_game_state))
+            if self._subscribers:
+                (lifted, captured, border_cleared) = self._last_move_tokens
+                self._publish(GessEvent('move', previous_player, origin_square, destination_square, lifted, captured,
+                                        border_cleared, self.get_game_state()))
+        return moved
+
+    def _get_footprint_tokens(self, piece, center_column, center_row):
+        """
+        Returns the tokens of a piece as (square, token) pairs, given the column and row of its center square.
+        """
+        return tuple((self._board.get_coords_from_square([center_column + index % 3 - 1, center_row + index // 3 - 1]),
+                      token)
+                     for index, token in enumerate(piece) if token in ('W', 'B'))
+
+    def undo_move(self):
+        """
+        Takes back the last successful move or resignation, restoring the board, current player and game state.
+        :return: Returns True if a move was taken back, or False if no moves have been made.
+        """
+        if not self._history:
+            return False
+        (change_log, previous_player, previous_game_state) = self._history.pop()
+        self._board.undo_changes(change_log)
+        self.set_current_player(previous_player)
+        self.set_game_state(previous_game_state)
+        return True
+
+    def _apply_move(self, origin_square, destination_square):
         """
         Allows the current player to move a token from the origin square to the destination square.
         A legal move:
@@ -269,8 +677,9 @@ class GessGame:
         # This is because the only thing the current player can move is their own tokens.
         # If the current piece contains any tokens of the waiting player, then the move is also invalid.
         # This is because a player cannot move another player's tokens.
-        origin_piece = self._board.get_piece_from_square(origin_coords)
-        if self.get_current_player() not in origin_piece or self.get_waiting_player() in origin_piece:
+        # The piece signatures kept by the board answer this without examining the squares of the piece.
+        # A piece with only a center token has no direction to move in, so it is also invalid.
+        if not self._board.is_movable_piece(self.get_current_player(), origin_coords):
             return False
 
         # Next, examine the desired destination in comparison with the origin piece
@@ -283,56 +692,38 @@ class GessGame:
         change_in_columns = destination_column - origin_column
         change_in_rows = destination_row - origin_row
 
-        # Next, examine the tokens that make up the origin piece to determine which movements are possible.
-        [up_left, up, up_right, left, center, right, down_left, down, down_right] = origin_piece
-
-        # Each modification tuple is formatted as follows:
-        #   (change in rows needed, change in columns needed, square token needed)
-        # For example, if the change is rows is less than zero (first value)
-        # and the change in columns is equal to zero (second value),
-        # and the piece contains a piece in the left square (third value).
-        direction_modifications = (
-            (change_in_rows < 0, change_in_columns > 0, up_right),
-            (change_in_rows < 0, change_in_columns < 0, up_left),
-            (change_in_rows < 0, change_in_columns == 0, up),
-            (change_in_rows > 0, change_in_columns > 0, down_right),
-            (change_in_rows > 0, change_in_columns < 0, down_left),
-            (change_in_rows > 0, change_in_columns == 0, down),
-            (change_in_rows == 0, change_in_columns > 0, right),
-            (change_in_rows == 0, change_in_columns < 0, left)
-        )
-
-        # Iterate over the modifications and find the needed movement direction.
-        # Check to see if the piece contains the token in the square necessary for a move to made in that direction.
-        # If the piece does not contain the necessary token, the move is invalid. Return False.
-        # Otherwise, end the check.
-        for modification in direction_modifications:
-            if modification[0] and modification[1]:
-                if modification[2] != self.get_current_player():
-                    return False
-                else:
-                    break
-
-        # Check to see if the move distance is greater than 3 but the piece does not contain a center token.
-        # If so, then the move is invalid because the destination square is too far for the piece to move.
-        # Without a center token, the piece can only move three squares. In this case, False is returned.
-        if (abs(change_in_rows) > 3 or abs(change_in_columns) > 3) and center != self.get_current_player():
+        # A piece can only move in a straight line: along a row, along a column, or along a diagonal.
+        # Any other destination can never be reached, so the move is invalid. Return False.
+        if change_in_rows != 0 and change_in_columns != 0 and abs(change_in_rows) != abs(change_in_columns):
             return False
 
         # Determine the necessary movement in the x axis (along the columns).
         x_move = y_move = 0
         if change_in_columns != 0:
-            y_move = change_in_columns / abs(change_in_columns)
+            y_move = change_in_columns // abs(change_in_columns)
 
         # Determine the necessary movement in the y axis (along the rows).
         if change_in_rows != 0:
-            x_move = change_in_rows / abs(change_in_rows)
+            x_move = change_in_rows // abs(change_in_rows)
+
+        # Next, examine the tokens that make up the origin piece to determine which movements are possible.
+        # The piece can only move in a direction if it contains a token in the square on that side of its center.
+        # If the piece does not contain the necessary token, the move is invalid. Return False.
+        if (x_move, y_move) not in self._board.get_piece_directions(self.get_current_player(), origin_coords):
+            return False
+
+        # Check to see if the move distance is greater than 3 but the piece does not contain a center token.
+        # If so, then the move is invalid because the destination square is too far for the piece to move.
+        # Without a center token, the piece can only move three squares. In this case, False is returned.
+        if (abs(change_in_rows) > 3 or abs(change_in_columns) > 3) and \
+                not self._board.has_center_token(self.get_current_player(), origin_coords):
+            return False
 
         # If the move is legal, lift the piece from the board.
-        lifted = list(origin_piece)
+        lifted = self._board.get_piece_from_square(origin_coords)
         for row_value in range(origin_row - 1, origin_row + 2):
             for column_value in range(origin_column - 1, origin_column + 2):
-                self._board.get_board()[row_value][column_value] = ' '
+                self._board.set_square(column_value, row_value, ' ')
 
         # Create a function to iterate over squares in the provided piece and place the tokens in the provided location
         def place_piece(piece_to_place, row_to_place, column_to_place):
@@ -345,7 +736,7 @@ class GessGame:
             piece_index = 0
             for row_of_piece in range(row_to_place - 1, row_to_place + 2):
                 for column_of_piece in range(column_to_place - 1, column_to_place + 2):
-                    self._board.get_board()[row_of_piece][column_of_piece] = piece_to_place[piece_index]
+                    self._board.set_square(column_of_piece, row_of_piece, piece_to_place[piece_index])
                     piece_index += 1
 
         # Check that by lifting this piece away, the current player has not broken their last remaining ring
@@ -360,19 +751,18 @@ class GessGame:
         # This is because the only valid move is one that claims a piece, not one that moves beyond a token.
         (current_row, current_column) = (origin_row, origin_column)
         while not (current_row == destination_row and current_column == destination_column):
-            for square in self._board.get_piece_from_square([current_column, current_row]):
-                if square != ' ':
-                    # If we have encountered another obstruction piece here, place the lifted piece back
-                    place_piece(lifted, origin_row, origin_column)
-                    return False
-            current_row += int(x_move)
-            current_column += int(y_move)
+            if not self._board.is_empty_piece([current_column, current_row]):
+                # If we have encountered another obstruction piece here, place the lifted piece back
+                place_piece(lifted, origin_row, origin_column)
+                return False
+            current_row += x_move
+            current_column += y_move
 
         # If the path has been determined to be clear, check that the footprint will not overlap a ring
-        lifted_destination = list(self._board.get_piece_from_square(destination_coords))
+        lifted_destination = self._board.get_piece_from_square(destination_coords)
         for row_value in range(destination_row - 1, destination_row + 2):
             for column_value in range(destination_column - 1, destination_column + 2):
-                self._board.get_board()[row_value][column_value] = ' '
+                self._board.set_square(column_value, row_value, ' ')
 
         # Check that by lifting the tokens in the destination footprint, the current player still has a remaining ring
         # If they do not, this is an invalid move. Place the destination and origin pieces back, and Return False.
@@ -384,17 +774,31 @@ class GessGame:
         # If the path has been determined to be clear of obstructions, place the piece in the destination
         place_piece(lifted, destination_row, destination_column)
 
-        # Clearing the boundary rows and columns
+        # Clearing the boundary rows and columns, keeping track of the tokens removed
         # First, eliminate all tokens in the boundary rows (1 and 20)
+        border_cleared = []
         for row_number in [0, 19]:
             if len(set(self._board.get_board()[row_number])) != 2:
-                for index, square in enumerate(self._board.get_board()[row_number]):
-                    self._board.get_board()[row_number][index] = ' '
+                # Only the 20 squares of the row are cleared, keeping the row label in the last column
+                for index, square in enumerate(self._board.get_board()[row_number][:20]):
+                    if square in ('W', 'B'):
+                        border_cleared.append(([index, row_number], square))
+                    self._board.set_square(index, row_number, ' ')
 
         # Then, eliminate all tokens in the boundary columns (a and t).
         for row_number in range(0, 20):
             for column_number in [0, 19]:
-                self._board.get_board()[row_number][column_number] = ' '
+                square = self._board.get_board()[row_number][column_number]
+                if square in ('W', 'B'):
+                    border_cleared.append(([column_number, row_number], square))
+                self._board.set_square(column_number, row_number, ' ')
+
+        # Keep the tokens lifted, captured and cleared by the move, for the events sent to subscribers
+        if self._subscribers:
+            self._last_move_tokens = (
+                self._get_footprint_tokens(lifted, origin_column, origin_row),
+                self._get_footprint_tokens(lifted_destination, destination_column, destination_row),
+                tuple((self._board.get_coords_from_square(square), token) for (square, token) in border_cleared))
 
         # At the end of a successful move, check to see if the current player has removed the opposing player's ring
         # If so, the current player has won and the game is over.
@@ -406,6 +810,152 @@ class GessGame:
         self.set_current_player(self.get_waiting_player())
         return True
 
+    def get_legal_moves(self):
+        """
+        Returns every legal move of the current player, following the same rules as make_move.
+        Rather than trying each move on the board, the rings of the current player are found once, and a move keeps a
+        ring if any ring lies outside both the origin footprint and the destination footprint. Lifting or clearing
+        tokens can never form a new ring, since every square of a footprint has other squares of the footprint around it.
+        :return: Returns a list of (origin square, destination square) string tuples.
+        """
+        if self.get_game_state() != 'UNFINISHED':
+            return []
+
+        player = self.get_current_player()
+        ring_centers = self._board.get_ring_centers(player)
+        legal_moves = []
+
+        for origin_row in range(1, 19):
+            for origin_column in range(1, 19):
+                origin_center = [origin_column, origin_row]
+                if not self._board.is_movable_piece(player, origin_center):
+                    continue
+
+                # The rings that remain once the piece has been lifted from the board
+                remaining_rings = [[ring_column, ring_row] for [ring_column, ring_row] in ring_centers
+                                   if abs(ring_column - origin_column) > 2 or abs(ring_row - origin_row) > 2]
+                if not remaining_rings:
+                    continue
+
+                origin_square = self._board.get_coords_from_square([origin_column, origin_row])
+                maximum_distance = 17 if self._board.has_center_token(player, origin_center) else 3
+                for (row_step, column_step) in self._board.get_piece_directions(player, origin_center):
+                    for distance in range(1, maximum_distance + 1):
+                        destination_row = origin_row + row_step * distance
+                        destination_column = origin_column + column_step * distance
+                        if not (1 <= destination_row <= 18 and 1 <= destination_column <= 18):
+                            break
+
+                        # The piece stops at the first footprint along its path that holds a token.
+                        # The squares the piece was lifted from are empty while it moves.
+                        if distance > 1:
+                            path_center = [destination_column - column_step, destination_row - row_step]
+                            tokens = (self._board.get_piece_signature('W', path_center) |
+                                      self._board.get_piece_signature('B', path_center))
+                            lifted_squares = _FOOTPRINT_OVERLAPS.get(
+                                ((distance - 1) * row_step, (distance - 1) * column_step), 0)
+                            if tokens & ~lifted_squares:
+                                break
+
+                        # Clearing the destination footprint must also leave the current player a ring
+                        if any(abs(ring_column - destination_column) > 2 or abs(ring_row - destination_row) > 2
+                               for [ring_column, ring_row] in remaining_rings):
+                            destination_square = self._board.get_coords_from_square(
+                                [destination_column, destination_row])
+                            legal_moves.append((origin_square, destination_square))
+        return legal_moves
+
+    def get_ring_capture_move(self, player=None):
+        """
+        Returns a move that breaks every remaining ring of a player's opponent, winning the game, without generating or
+        trying every move.
+        The opponent's rings are broken by any destination footprint that overlaps all of them, so the destinations are
+        limited to the squares within two rows and columns of every ring center. From each destination, the eight rays
+        back towards possible origin squares are scanned for a piece that can reach it.
+        :param player: Optional character 'W' or 'B' of the player to find a move for, who need not be the player to
+        move. Defaults to the current player.
+        :return: Returns an (origin square, destination square) tuple of a winning move, or None if there is none.
+        """
+        if self.get_game_state() != 'UNFINISHED':
+            return None
+        if player is None:
+            player = self.get_current_player()
+        opponent = 'B' if player == 'W' else 'W'
+        board = self._board
+        ring_centers = board.get_ring_centers(player)
+        if not ring_centers:
+            return None
+
+        # Rings with tokens in the boundary rows and columns are cleared after any move. In play this never happens,
+        # since those rows and columns are cleared after every move.
+        target_rings = [[ring_column, ring_row] for [ring_column, ring_row] in board.get_ring_centers(opponent)
+                        if 1 < ring_column < 18 and 1 < ring_row < 18]
+
+        # The destinations within two rows and columns of every ring of the opponent
+        low_row = max([ring_row - 2 for [_, ring_row] in target_rings] + [1])
+        high_row = min([ring_row + 2 for [_, ring_row] in target_rings] + [18])
+        low_column = max([ring_column - 2 for [ring_column, _] in target_rings] + [1])
+        high_column = min([ring_column + 2 for [ring_column, _] in target_rings] + [18])
+
+        for destination_row in range(low_row, high_row + 1):
+            for destination_column in range(low_column, high_column + 1):
+                # Clearing the destination footprint must leave the player a ring
+                destination_rings = [[ring_column, ring_row] for [ring_column, ring_row] in ring_centers
+                                     if abs(ring_column - destination_column) > 2 or abs(ring_row - destination_row) > 2]
+                if not destination_rings:
+                    continue
+
+                for (row_step, column_step, _) in DIRECTIONS:
+                    # Centers of the path between the origin and the destination far enough from the origin to share
+                    # none of its squares must be empty. Once one holds a token, no origin further along the ray can
+                    # reach the destination.
+                    for distance in range(1, 18):
+                        origin_row = destination_row - row_step * distance
+                        origin_column = destination_column - column_step * distance
+                        if not (1 <= origin_row <= 18 and 1 <= origin_column <= 18):
+                            break
+                        if distance > 3:
+                            far_center = [destination_column - column_step * (distance - 3),
+                                          destination_row - row_step * (distance - 3)]
+                            if not board.is_empty_piece(far_center):
+                                break
+
+                        origin_center = [origin_column, origin_row]
+                        if not board.is_movable_piece(player, origin_center) or \
+                                (row_step, column_step) not in board.get_piece_directions(player, origin_center) or \
+                                (distance > 3 and not board.has_center_token(player, origin_center)):
+                            continue
+
+                        # The two path centers nearest the origin share squares with the lifted piece
+                        blocked = False
+                        for path_distance in range(1, min(distance, 3)):
+                            path_center = [origin_column + column_step * path_distance,
+                                           origin_row + row_step * path_distance]
+                            tokens = (board.get_piece_signature('W', path_center) |
+                                      board.get_piece_signature('B', path_center))
+                            if tokens & ~_FOOTPRINT_OVERLAPS[(row_step * path_distance, column_step * path_distance)]:
+                                blocked = True
+                                break
+
+                        # The player must keep a ring outside both the origin and the destination footprints
+                        if not blocked and any(abs(ring_column - origin_column) > 2 or abs(ring_row - origin_row) > 2
+                                               for [ring_column, ring_row] in destination_rings):
+                            return (board.get_coords_from_square(origin_center),
+                                    board.get_coords_from_square([destination_column, destination_row]))
+        return None
+
+    def is_ring_threatened(self, player=None):
+        """
+        Returns whether a player's opponent could break every remaining ring of the player with their next move.
+        :param player: Optional character 'W' or 'B' of the player whose rings are checked. Defaults to the current
+        player, in which case the threat is the opponent's reply to the current player's move, if the position did not
+        change.
+        :return: Returns True if the opponent has a move breaking all of the player's rings, or False if not.
+        """
+        if player is None:
+            player = self.get_current_player()
+        return self.get_ring_capture_move('B' if player == 'W' else 'W') is not None
+
     def resign_game(self):
         """
         Allows the current player to resign.
@@ -418,7 +968,12 @@ class GessGame:
             return False
 
         # Determine the current player, then set the other player as the winner.
+        # The resignation is recorded so that it can be taken back with undo_move.
+        self._history.append(([], self.get_current_player(), self.get_game_state()))
         self.set_game_state('WHITE_WON' if self.get_current_player() == 'B' else 'BLACK_WON')
+        if self._subscribers:
+            self._publish(GessEvent('resign', self.get_current_player(), None, None, (), (), (),
+                                    self.get_game_state()))
         return True
 
 
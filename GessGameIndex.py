@@ -0,0 +1,236 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: An indexed database of archived games of Gess, searchable by position and by structural features
+
+import multiprocessing
+import sqlite3
+
+from GessGame import GessGame
+
+# The structural features recorded for each player after every ply: the number of rings, the number of movable pieces
+# with a center token, and the number of the player's tokens removed from the boundary rows and columns so far
+FEATURES = ('rings', 'center_pieces', 'border_captures')
+
+_PLAYERS = {'B': 'black', 'W': 'white'}
+_FEATURE_COLUMNS = [f'{color}_{feature}' for feature in FEATURES for color in ('black', 'white')]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    game_id INTEGER PRIMARY KEY,
+    moves TEXT NOT NULL,
+    result TEXT NOT NULL,
+    plies INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS positions (
+    position_hash INTEGER NOT NULL,
+    game_id INTEGER NOT NULL,
+    ply INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS positions_hash ON positions (position_hash);
+CREATE TABLE IF NOT EXISTS ply_features (
+    game_id INTEGER NOT NULL,
+    ply INTEGER NOT NULL,
+    """ + ',\n    '.join(f'{column} INTEGER NOT NULL' for column in _FEATURE_COLUMNS) + """,
+    PRIMARY KEY (game_id, ply)
+);
+CREATE TABLE IF NOT EXISTS ring_centers (
+    player TEXT NOT NULL,
+    center TEXT NOT NULL,
+    game_id INTEGER NOT NULL,
+    ply INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ring_centers_center ON ring_centers (player, center, ply);
+""" + ''.join(f'CREATE INDEX IF NOT EXISTS ply_features_{column} ON ply_features ({column}, ply);\n'
+              for column in _FEATURE_COLUMNS)
+
+
+def _to_signed(position_hash):
+    """
+    Converts a 64 bit position hash into the signed range of an SQLite integer.
+    """
+    return position_hash - 2 ** 64 if position_hash >= 2 ** 63 else position_hash
+
+
+def _count_center_pieces(gess_board, token):
+    """
+    Returns the number of movable pieces of a player that have a center token.
+    """
+    return sum(1 for row_number in range(1, 19) for column_number in range(1, 19)
+               if gess_board.has_center_token(token, [column_number, row_number])
+               and gess_board.is_movable_piece(token, [column_number, row_number]))
+
+
+def _index_game(moves):
+    """
+    Replays a game record and collects the index entries of every position reached. Runs in a worker process.
+    :param moves: A list of (origin square, destination square) string pairs. The game is replayed up to its first
+    illegal move.
+    :return: Returns a tuple of the moves played, the final game state, and a list with one entry per ply (starting from
+    ply 0, the starting position) of the position hash, the values of the feature columns and the ring centers.
+    """
+    gess = GessGame()
+    gess_board = gess.get_board_object()
+    border_captures = {'B': 0, 'W': 0}
+
+    def count_border_captures(event):
+        for (_, token) in event.border_cleared:
+            border_captures[token] += 1
+    gess.subscribe(count_border_captures, events=['move'])
+
+    def describe_position():
+        features = {
+            'rings': {token: len(gess_board.get_ring_centers(token)) for token in 'BW'},
+            'center_pieces': {token: _count_center_pieces(gess_board, token) for token in 'BW'},
+            'border_captures': dict(border_captures),
+        }
+        ring_centers = [(token, gess_board.get_coords_from_square(center))
+                        for token in 'BW' for center in gess_board.get_ring_centers(token)]
+        return (gess.get_position_hash(), [features[feature][token] for feature in FEATURES for token in 'BW'],
+                ring_centers)
+
+    played = []
+    plies = [describe_position()]
+    for (origin_square, destination_square) in moves:
+        if not gess.make_move(origin_square, destination_square):
+            break
+        played.append((origin_square, destination_square))
+        plies.append(describe_position())
+    return played, gess.get_game_state(), plies
+
+
+class GessGameIndex:
+    """
+    A GessGameIndex object stores archived games in an SQLite database file, together with an inverted index from the
+    hash of every position reached to the games and plies it was reached in, and the structural features of every
+    position: the rings, movable pieces with center tokens and boundary captures of each player.
+    Questions such as which games reached a position, or in which games White had two rings by ply 20, are answered by
+    index lookups instead of replaying the archive.
+    """
+    def __init__(self, path, timeout=30.0):
+        """
+        Initiates the GessGameIndex object, creating the database file if needed.
+        :param path: String of the path of the database file.
+        :param timeout: Number of seconds to wait for another process to finish writing before giving up.
+        """
+        self._connection = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return self._connection.execute('SELECT COUNT(*) FROM games').fetchone()[0]
+
+    def close(self):
+        """
+        Closes the connection to the database file.
+        :return: Returns True once the index has been closed.
+        """
+        self._connection.close()
+        return True
+
+    def add_games(self, records, processes=None, games_per_chunk=16):
+        """
+        Replays game records in worker processes and adds them to the index.
+        :param records: An iterable of game records, each a list of (origin square, destination square) string pairs.
+        Each game is indexed up to its first illegal move.
+        :param processes: Optional integer of the number of worker processes. Defaults to the number of CPUs.
+        :param games_per_chunk: Integer of the number of games sent to a worker at a time.
+        :return: Returns the list of game ids given to the games, in the order of the records.
+        """
+        game_ids = []
+        with multiprocessing.Pool(processes) as pool:
+            for (moves, result, plies) in pool.imap(_index_game, records, chunksize=games_per_chunk):
+                # Each game is added in one transaction, so readers never see a partly indexed game
+                self._connection.execute('BEGIN')
+                try:
+                    game_id = self._connection.execute(
+                        'INSERT INTO games (moves, result, plies) VALUES (?, ?, ?)',
+                        (' '.join(f'{origin}-{destination}' for (origin, destination) in moves), result,
+                         len(moves))).lastrowid
+                    self._connection.executemany(
+                        'INSERT INTO positions (position_hash, game_id, ply) VALUES (?, ?, ?)',
+                        [(_to_signed(position_hash), game_id, ply)
+                         for ply, (position_hash, _, _) in enumerate(plies)])
+                    self._connection.executemany(
+                        f'INSERT INTO ply_features (game_id, ply, {", ".join(_FEATURE_COLUMNS)}) '
+                        f'VALUES (?, ?, {", ".join("?" for _ in _FEATURE_COLUMNS)})',
+                        [(game_id, ply, *values) for ply, (_, values, _) in enumerate(plies)])
+                    self._connection.executemany(
+                        'INSERT INTO ring_centers (player, center, game_id, ply) VALUES (?, ?, ?, ?)',
+                        [(token, center, game_id, ply)
+                         for ply, (_, _, ring_centers) in enumerate(plies) for (token, center) in ring_centers])
+                    self._connection.execute('COMMIT')
+                except BaseException:
+                    self._connection.execute('ROLLBACK')
+                    raise
+                game_ids.append(game_id)
+        return game_ids
+
+    def get_game(self, game_id):
+        """
+        Returns an indexed game.
+        :param game_id: Integer id of the game, as returned by add_games.
+        :return: Returns a tuple of the list of moves played and the final game state, or None if there is no such game.
+        """
+        row = self._connection.execute('SELECT moves, result FROM games WHERE game_id = ?', (game_id,)).fetchone()
+        if row is None:
+            return None
+        (moves, result) = row
+        return [tuple(move.split('-')) for move in moves.split()], result
+
+    def find_position(self, position_hash):
+        """
+        Returns every occurrence of a position in the indexed games.
+        :param position_hash: Integer hash of the position, as returned by GessGame.get_position_hash.
+        :return: Returns a list of (game id, ply) tuples, where ply 0 is the starting position, ordered by game id.
+        """
+        return self._connection.execute(
+            'SELECT game_id, ply FROM positions WHERE position_hash = ? ORDER BY game_id, ply',
+            (_to_signed(position_hash),)).fetchall()
+
+    def find_games_reaching(self, position_hash):
+        """
+        Returns the games that reached a position.
+        :param position_hash: Integer hash of the position, as returned by GessGame.get_position_hash.
+        :return: Returns a sorted list of game ids.
+        """
+        return [game_id for (game_id,) in self._connection.execute(
+            'SELECT DISTINCT game_id FROM positions WHERE position_hash = ? ORDER BY game_id',
+            (_to_signed(position_hash),))]
+
+    def find_games_with_feature(self, player, feature, minimum, max_ply=None, min_ply=0):
+        """
+        Returns the games in which a feature of a player reached a value, such as White having two rings.
+        :param player: The character 'W' or 'B' of the player.
+        :param feature: One of the names in FEATURES.
+        :param minimum: Integer of the smallest value of the feature to match.
+        :param max_ply: Optional integer of the last ply (counting each player's move) by which the feature must reach
+        the value.
+        :param min_ply: Integer of the first ply at which the feature is checked.
+        :return: Returns a sorted list of game ids.
+        """
+        if feature not in FEATURES:
+            raise ValueError(f'Unknown game feature: {feature}')
+        column = f'{_PLAYERS[player]}_{feature}'
+        return [game_id for (game_id,) in self._connection.execute(
+            f'SELECT DISTINCT game_id FROM ply_features WHERE {column} >= ? AND ply BETWEEN ? AND ? ORDER BY game_id',
+            (minimum, min_ply, max_ply if max_ply is not None else 2 ** 31))]
+
+    def find_games_with_ring_at(self, player, square, max_ply=None, min_ply=0):
+        """
+        Returns the games in which a player had a ring centered on a square.
+        :param player: The character 'W' or 'B' of the player.
+        :param square: String of column letter and row number of the center square, such as 'l3'.
+        :param max_ply: Optional integer of the last ply by which the ring must have been formed.
+        :param min_ply: Integer of the first ply at which the ring is looked for.
+        :return: Returns a sorted list of game ids.
+        """
+        return [game_id for (game_id,) in self._connection.execute(
+            'SELECT DISTINCT game_id FROM ring_centers WHERE player = ? AND center = ? AND ply BETWEEN ? AND ? '
+            'ORDER BY game_id', (player, square, min_ply, max_ply if max_ply is not None else 2 ** 31))]
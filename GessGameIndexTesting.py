@@ -0,0 +1,91 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: Unit testing to check validity of GessGameIndex.py
+
+import os
+import tempfile
+import unittest
+
+from GessGame import GessGame
+from GessGameIndex import GessGameIndex
+from GessTestGames import FULL_GAME
+from GessTournament import RandomPolicy, play_game
+
+# A short game in which White forms a second ring on its sixth ply, which random games almost never do
+SECOND_WHITE_RING_GAME = [('c3', 'c6'), ('r18', 'r15'), ('c7', 'd6'), ('f19', 'g19'), ('c4', 'c5'), ('h17', 'i17')]
+
+
+class TestGessGameIndex(unittest.TestCase):
+    """
+    Contains unit tests for the GessGameIndex class
+    """
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._directory.name, 'games.db')
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_find_games_reaching_position(self):
+        """
+        Tests that games are found by the positions they reached, and can be read back from the index.
+        """
+        # Both games start from the starting position, but only the full game plays c3-c5.
+        with GessGameIndex(self._path) as index:
+            (full_game, short_game) = index.add_games([FULL_GAME, [('r3', 'r6'), ('c3', 'c4')]], processes=2)
+            self.assertEqual(len(index), 2)
+            self.assertEqual(index.get_game(full_game), (FULL_GAME, 'BLACK_WON'))
+            self.assertEqual(index.get_game(short_game), ([('r3', 'r6')], 'UNFINISHED'))
+
+            gess = GessGame()
+            self.assertEqual(index.find_games_reaching(gess.get_position_hash()), [full_game, short_game])
+            gess.make_move('c3', 'c5')
+            self.assertEqual(index.find_position(gess.get_position_hash()), [(full_game, 1)])
+            self.assertEqual(index.find_games_reaching(12345), [])
+
+        # The index is kept on disk
+        with GessGameIndex(self._path) as index:
+            self.assertEqual(len(index), 2)
+
+    def test_find_games_with_feature(self):
+        """
+        Tests that feature queries return exactly the games found by replaying every game.
+        """
+        # Random games and a game known to have each feature are indexed, then replayed to find the games where White
+        # had two rings by ply 20, where Black had a ring centered on l3 at ply 10 or later, and where Black lost tokens
+        # to the boundary by ply 30. Each feature is found in some of the games but not all of them.
+        games = [play_game(RandomPolicy(), RandomPolicy(), max_plies=40, seed=seed).moves for seed in range(12)]
+        games.append(SECOND_WHITE_RING_GAME)
+        with GessGameIndex(self._path) as index:
+            game_ids = index.add_games(games, processes=2)
+            two_white_rings = []
+            black_border_captures = []
+            ring_at_l3 = []
+            for game_id, moves in zip(game_ids, games):
+                gess = GessGame()
+                board = gess.get_board_object()
+                events = []
+                gess.subscribe(events.append)
+                for ply in range(len(moves) + 1):
+                    if ply > 0:
+                        gess.make_move(*moves[ply - 1])
+                    if ply <= 20 and len(board.get_ring_centers('W')) >= 2 and game_id not in two_white_rings:
+                        two_white_rings.append(game_id)
+                    if ply >= 10 and board.is_ring('B', [11, 17]) and game_id not in ring_at_l3:
+                        ring_at_l3.append(game_id)
+                if any(token == 'B' for event in events[:30] for (_, token) in event.border_cleared):
+                    black_border_captures.append(game_id)
+            for expected_games in (two_white_rings, ring_at_l3, black_border_captures):
+                self.assertTrue(expected_games)
+                self.assertLess(len(expected_games), len(game_ids))
+            self.assertEqual(index.find_games_with_feature('W', 'rings', 2, max_ply=20), two_white_rings)
+            self.assertEqual(index.find_games_with_ring_at('B', 'l3', min_ply=10), ring_at_l3)
+            self.assertEqual(index.find_games_with_feature('B', 'border_captures', 1, max_ply=30),
+                             black_border_captures)
+            self.assertEqual(index.find_games_with_feature('B', 'rings', 0), game_ids)
+            self.assertRaises(ValueError, index.find_games_with_feature, 'W', 'tokens', 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
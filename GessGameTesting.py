@@ -2,9 +2,11 @@
 # Date: 05/30/2020
 # Description: Unit testing to check validity of GessGame.py
 
+import asyncio
+import random
 import unittest
 
-from GessGame import GessGame, GessBoard
+from GessGame import GessGame, GessBoard, GessEvent, get_position_hash
 
 
 class TestGess(unittest.TestCase):
@@ -268,6 +270,17 @@ class TestGess(unittest.TestCase):
         print('Test boundary handling: Testing that boundary areas are cleared when tokens are placed there.')
         gess.display()
 
+    def test_boundary_row_cleared_twice(self):
+        """
+        Test that tokens placed in a boundary row are removed every time, and that the row label is kept.
+        """
+        # Black's moves i3-i2 and c3-c2 each place tokens in row 1, which must be cleared both times.
+        gess = GessGame()
+        gess.make_move('i3', 'i2')
+        gess.make_move('c18', 'c17')
+        gess.make_move('c3', 'c2')
+        self.assertEqual(gess.get_gess_board()[19], [' '] * 20 + ['1'])
+
     def test_full_game(self):
         """
         Test that will go through multiple moves by each player, resulting in a conclusion of a game.
@@ -292,6 +305,178 @@ class TestGess(unittest.TestCase):
         print('Test complete game: Testing that the game ends when a player breaks the opponent\'s last ring.')
         gess.display()
 
+    def test_undo_move(self):
+        """
+        Tests that moves and resignations can be taken back, restoring the board, current player and game state.
+        """
+        # In this test, Black captures a token and White resigns. Both are taken back in turn.
+        # After each undo, the board and its hash must match the position before the move.
+        gess = GessGame()
+        starting_board = [list(row) for row in gess.get_gess_board()]
+        starting_hash = gess.get_position_hash()
+        self.assertEqual(gess.undo_move(), False)
+        self.assertEqual(gess.make_move('c3', 'c6'), True)
+        self.assertEqual(gess.get_position_hash(), get_position_hash(gess.get_gess_board(), 'W'))
+        self.assertEqual(gess.make_move('c3', 'c6'), False)
+        self.assertEqual(gess.resign_game(), True)
+        self.assertEqual(gess.get_game_state(), 'BLACK_WON')
+        self.assertEqual(gess.undo_move(), True)
+        self.assertEqual(gess.get_game_state(), 'UNFINISHED')
+        self.assertEqual(gess.get_current_player(), 'W')
+        self.assertEqual(gess.undo_move(), True)
+        self.assertEqual(gess.get_current_player(), 'B')
+        self.assertEqual(gess.get_gess_board(), starting_board)
+        self.assertEqual(gess.get_position_hash(), starting_hash)
+        self.assertEqual(gess.undo_move(), False)
+
+    def test_ring_check_uses_board_orientation(self):
+        """
+        Tests that a move far from White's ring does not end the game.
+        """
+        # Black moves a piece containing only the token on c7 up to c8, which places that token on c9.
+        # White's ring around l18 is untouched, so White still has a ring and the game continues.
+        gess = GessGame()
+        self.assertEqual(gess.make_move('c6', 'c8'), True)
+        self.assertEqual(gess.get_game_state(), 'UNFINISHED')
+        self.assertEqual(gess.get_current_player(), 'W')
+
+    def test_illegal_move_not_in_straight_line(self):
+        """
+        Tests that a player cannot move a piece to a square that is not along a row, column or diagonal.
+        """
+        # The piece around c3 has tokens allowing moves up and to the right, but d6 is neither.
+        # The move is invalid, and the piece stays on the board.
+        gess = GessGame()
+        starting_board = [list(row) for row in gess.get_gess_board()]
+        self.assertEqual(gess.make_move('c3', 'd6'), False)
+        self.assertEqual(gess.get_current_player(), 'B')
+        self.assertEqual(gess.get_gess_board(), starting_board)
+
+    def test_legal_moves(self):
+        """
+        Tests that the legal moves returned by get_legal_moves are exactly the moves make_move accepts.
+        """
+        # Every move from a few origin squares of the starting position is tried on a copy of the game.
+        gess = GessGame()
+        legal_moves = gess.get_legal_moves()
+        self.assertIn(('c3', 'c6'), legal_moves)
+        self.assertNotIn(('n3', 'o3'), legal_moves)
+        for origin_square in ['c3', 'l3', 'n3', 'r3', 'c7', 'l6', 'r18']:
+            for column in 'bcdefghijklmnopqrs':
+                for row in range(2, 20):
+                    destination_square = column + str(row)
+                    self.assertEqual(gess.copy().make_move(origin_square, destination_square),
+                                     (origin_square, destination_square) in legal_moves)
+        gess.resign_game()
+        self.assertEqual(gess.get_legal_moves(), [])
+
+    def test_piece_signatures(self):
+        """
+        Tests that the piece signatures of the board answer piece queries, and stay up to date as moves are made and
+        taken back.
+        """
+        # The piece around c3 has Black tokens in its up, left, center, right and down squares.
+        gess = GessGame()
+        board = gess.get_board_object()
+        self.assertEqual(board.get_piece_signature('B', [2, 17]), 0b010111010)
+        self.assertEqual(board.get_piece_signature('W', [2, 17]), 0)
+        self.assertEqual(board.is_movable_piece('B', [2, 17]), True)
+        self.assertEqual(board.is_movable_piece('W', [2, 17]), False)
+        self.assertEqual(board.has_center_token('B', [2, 17]), True)
+        self.assertEqual(board.get_piece_directions('B', [2, 17]), ((-1, 0), (0, -1), (0, 1), (1, 0)))
+        self.assertEqual(board.is_empty_piece([10, 10]), True)
+        self.assertEqual(board.is_ring('B', [11, 17]), True)
+        self.assertEqual(board.get_ring_centers('W'), [[11, 2]])
+
+        # Moving the piece with its center token to c6 takes the Black token from c7.
+        gess.make_move('c3', 'c6')
+        self.assertEqual(board.is_empty_piece([2, 17]), True)
+        self.assertEqual(board.get_piece_signature('B', [2, 14]), 0b010111010)
+        gess.undo_move()
+        self.assertEqual(board.get_piece_signature('B', [2, 17]), 0b010111010)
+        self.assertEqual(board.get_piece_signature('B', [2, 13]), 0b000010000)
+        for token in 'WB':
+            self.assertEqual(board.get_ring_centers(token), board.copy().get_ring_centers(token))
+
+    def test_ring_capture_move(self):
+        """
+        Tests that get_ring_capture_move finds a winning move exactly when trying every legal move finds one, for both
+        the player to move and the waiting player.
+        """
+        # Before the last move of the full game, Black can break White's last ring, and White is threatened.
+        gess = GessGame()
+        for move in [('c3', 'c5'), ('r18', 'r16'), ('r3', 'r5'), ('r16', 'q16'), ('k6', 'n9'), ('m15', 'j12'),
+                     ('r5', 'r3'), ('j13', 'h15'), ('j7', 'h7'), ('j10', 'h12'), ('i3', 'i13'), ('c15', 'c12')]:
+            gess.make_move(*move)
+        self.assertNotEqual(gess.get_ring_capture_move(), None)
+        self.assertEqual(gess.is_ring_threatened('W'), True)
+
+        # Along a random game, the detector agrees with playing out every legal move of each player.
+        random_moves = random.Random(6)
+        gess = GessGame()
+        for _ in range(40):
+            for player in 'BW':
+                trial = gess.copy()
+                trial.set_current_player(player)
+                winning = []
+                for move in trial.get_legal_moves():
+                    trial_move = trial.copy()
+                    trial_move.make_move(*move)
+                    if trial_move.get_game_state() != 'UNFINISHED':
+                        winning.append(move)
+                self.assertEqual(gess.get_ring_capture_move(player) in winning, bool(winning))
+                self.assertEqual(gess.get_ring_capture_move(player) is None, not winning)
+            legal_moves = gess.get_legal_moves()
+            if not legal_moves:
+                break
+            gess.make_move(*random_moves.choice(legal_moves))
+            if gess.get_game_state() != 'UNFINISHED':
+                break
+
+    def test_move_events(self):
+        """
+        Tests that subscribers receive an event for each move, resignation and game over, and none for illegal moves.
+        """
+        # Black's move r3-s3 lifts five tokens and pushes the token at t3 off the board.
+        gess = GessGame()
+        events = []
+        game_over_events = []
+        gess.subscribe(events.append)
+        gess.subscribe(game_over_events.append, events=['game_over'])
+        self.assertEqual(gess.make_move('c3', 'd6'), False)
+        self.assertEqual(events, [])
+        gess.make_move('r3', 's3')
+        self.assertEqual(events, [GessEvent('move', 'B', 'r3', 's3',
+                                            (('r4', 'B'), ('q3', 'B'), ('r3', 'B'), ('s3', 'B'), ('r2', 'B')), (),
+                                            (('t3', 'B'),), 'UNFINISHED')])
+
+        # White resigns, which is followed by the end of the game.
+        gess.resign_game()
+        self.assertEqual([event.kind for event in events], ['move', 'resign', 'game_over'])
+        self.assertEqual(game_over_events, [events[2]])
+        self.assertEqual(events[2].player, 'W')
+        self.assertEqual(events[2].game_state, 'BLACK_WON')
+
+        # Unsubscribed callbacks receive no more events, and unknown kinds of event are rejected.
+        self.assertEqual(gess.unsubscribe(events.append), True)
+        self.assertEqual(gess.unsubscribe(events.append), False)
+        self.assertRaises(ValueError, gess.subscribe, events.append, ['capture'])
+
+    def test_move_events_on_asyncio_queue(self):
+        """
+        Tests that the events of a game can be awaited from an asyncio queue while the moves are made in another thread.
+        """
+        async def play_and_collect():
+            gess = GessGame()
+            event_queue = asyncio.Queue()
+            gess.subscribe_queue(event_queue, asyncio.get_running_loop())
+            await asyncio.get_running_loop().run_in_executor(None, gess.make_move, 'c3', 'c6')
+            return await asyncio.wait_for(event_queue.get(), 5)
+
+        event = asyncio.run(play_and_collect())
+        self.assertEqual((event.kind, event.player, event.origin, event.destination), ('move', 'B', 'c3', 'c6'))
+        self.assertEqual(event.captured, (('c7', 'B'),))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,201 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: Legal-move masks for batches of Gess positions, computed with vectorised NumPy operations
+
+import numpy as np
+
+from GessGame import DIRECTIONS, GessGame
+from GessPosition import Position
+from GessTrainingData import board_to_tensor
+
+_COLUMNS = 'abcdefghijklmnopqrst'
+
+# The shape of the legal-move mask of one position: the row and column of the origin center (rows and columns 1 to 18
+# of the board lists, stored as 0 to 17), the direction of the move (in the order of GessGame.DIRECTIONS) and the
+# distance of the move minus one (1 to 17, stored as 0 to 16)
+MASK_SHAPE = (18, 18, 8, 17)
+
+_DISTANCES = np.arange(1, 18)
+_CENTERS = np.arange(1, 19)
+
+
+def positions_to_arrays(positions):
+    """
+    Stacks the boards and players to move of several positions into the arrays taken by get_legal_move_masks.
+    :param positions: A sequence of GessGame or Position objects.
+    :return: Returns a tuple of a uint8 array of shape (N, 2, 20, 20), with the planes of board_to_tensor, and an int8
+    array of shape (N,) of the player to move (0 for Black and 1 for White), as stored in training data shards.
+    """
+    boards = np.stack([board_to_tensor(position.get_rows() if isinstance(position, Position)
+                                       else position.get_gess_board()) for position in positions])
+    players = np.array([0 if position.get_current_player() == 'B' else 1 for position in positions], dtype=np.int8)
+    return boards, players
+
+
+def _summed_area_table(planes, dtype=np.int16):
+    """
+    Returns the summed-area table of a stack of 20x20 planes, padded by two squares on every side, so that the number
+    of nonzero squares in any rectangle within two squares of a center is found with four lookups.
+    """
+    table = np.zeros((len(planes), 25, 25), dtype=dtype)
+    table[:, 3:23, 3:23] = planes
+    return table.cumsum(axis=1, dtype=dtype).cumsum(axis=2, dtype=dtype)
+
+
+def _offset_sums(table, first_row, last_row, first_column, last_column):
+    """
+    Returns, for every center of rows and columns 1 to 18, the sum of a summed-area table's planes over the rectangle
+    from first_row to last_row and first_column to last_column (inclusive) relative to the center, each between -2 and
+    2. The rectangles are the same for every center, so the sums are found by slicing rather than indexing.
+    :return: Returns an array of shape (N, 18, 18).
+    """
+    (start_row, end_row, start_column, end_column) = (first_row + 3, last_row + 4, first_column + 3, last_column + 4)
+    return (table[:, end_row:end_row + 18, end_column:end_column + 18] -
+            table[:, start_row:start_row + 18, end_column:end_column + 18] -
+            table[:, end_row:end_row + 18, start_column:start_column + 18] +
+            table[:, start_row:start_row + 18, start_column:start_column + 18])
+
+
+def get_legal_move_masks(boards, players):
+    """
+    Computes the legal moves of a batch of positions at once, following the same rules as GessGame.get_legal_moves.
+    Every step works on the whole batch: ownership of the pieces comes from 3x3 neighbourhood sums of each player's
+    tokens, the directions a piece can move in from shifted token planes, obstruction from the cumulative occupancy of
+    the footprints along each path, and whether the mover keeps a ring from summed-area tables of the ring centers.
+    Positions are treated as unfinished; a player without a ring has no legal move.
+    :param boards: An array of shape (N, 2, 20, 20) of the playable area of N boards, where plane 0 is nonzero for a
+    Black token and plane 1 for a White token, as returned by board_to_tensor or positions_to_arrays.
+    :param players: An array of shape (N,) of the player to move in each position, 0 for Black and 1 for White.
+    :return: Returns a boolean array of shape (N,) + MASK_SHAPE, True for each legal (origin center, direction,
+    distance) move. Use mask_to_moves to list the moves of a position.
+    """
+    boards = np.asarray(boards).astype(bool)
+    players = np.asarray(players).astype(np.intp)
+    batch = np.arange(len(boards))
+    own = boards[batch, players]
+    opponent = boards[batch, 1 - players]
+    own_table = _summed_area_table(own)
+    occupied_table = own_table + _summed_area_table(opponent)
+
+    # The number of the mover's tokens and of all tokens in the footprint of each center, with shape (N, 18, 18).
+    # A piece can move if its footprint holds only the mover's tokens, and more than three squares with a center token.
+    own_counts = _offset_sums(own_table, -1, 1, -1, 1)
+    occupied_counts = _offset_sums(occupied_table, -1, 1, -1, 1)
+    movable = (own_counts > 0) & (own_counts == occupied_counts)
+    has_center = own[:, 1:19, 1:19]
+    footprint_occupied = occupied_counts > 0
+
+    # The rings of the mover have eight of the mover's tokens around an empty center. The summed-area table of the
+    # ring centers gives the number of rings near any square. Ring centers are at least two squares apart, so there
+    # are never more than 81 rings and the counts fit in 8 bits.
+    rings = np.zeros(own.shape, dtype=np.int8)
+    rings[:, 1:19, 1:19] = (own_counts == 8) & (occupied_counts == 8) & ~has_center
+    ring_table = _summed_area_table(rings, np.int8)
+    ring_count = ring_table[:, -1, -1]
+
+    # The rings within two squares of each center are broken when a piece is lifted from or placed on the center
+    near_rings = _offset_sums(ring_table, -2, 2, -2, 2)
+
+    # The moves of each direction are worked out with the distance before the origin row and column, so that the
+    # cumulative occupancy along each path runs over whole planes. The axes are put in the order of MASK_SHAPE last.
+    center_rows = _CENTERS[None, :, None]
+    center_columns = _CENTERS[None, None, :]
+    distances = _DISTANCES[:, None, None]
+    in_range = has_center[:, None] | (distances <= 3)
+    masks = np.zeros((len(boards), 8, 17, 18, 18), dtype=bool)
+    for direction_index, (row_step, column_step, _) in enumerate(DIRECTIONS):
+        # The destination center of each distance and origin, with shape (17, 18, 18)
+        destination_rows = center_rows + row_step * distances
+        destination_columns = center_columns + column_step * distances
+        inside = (destination_rows >= 1) & (destination_rows <= 18) & (destination_columns >= 1) & \
+            (destination_columns <= 18)
+        path_rows = np.clip(destination_rows, 1, 18) - 1
+        path_columns = np.clip(destination_columns, 1, 18) - 1
+
+        # The footprint of each center along the path, without the squares the piece was lifted from, holds a token.
+        # Only the footprints one and two steps away overlap the squares the piece was lifted from.
+        # The path to distance k is clear if none of the footprints at distances 1 to k - 1 holds a token.
+        path_occupied = footprint_occupied[:, path_rows, path_columns]
+        for distance in (1, 2):
+            (row_offset, column_offset) = (-row_step * distance, -column_step * distance)
+            lifted_counts = _offset_sums(occupied_table, max(row_offset - 1, -1), min(row_offset + 1, 1),
+                                         max(column_offset - 1, -1), min(column_offset + 1, 1))
+            partly_occupied = occupied_counts > lifted_counts
+            path_occupied[:, distance - 1] = partly_occupied[:, path_rows[distance - 1], path_columns[distance - 1]]
+        path_blocked = np.zeros(path_occupied.shape, dtype=bool)
+        for distance in range(1, 17):
+            np.logical_or(path_blocked[:, distance - 1], path_occupied[:, distance - 1], out=path_blocked[:, distance])
+
+        # The mover keeps a ring if some ring lies outside both the origin and the destination footprint areas. The two
+        # areas only share rings when the piece moves four squares or less.
+        kept_rings = ring_count[:, None, None, None] - near_rings[:, None] - near_rings[:, path_rows, path_columns]
+        for distance in range(1, 5):
+            (row_offset, column_offset) = (row_step * distance, column_step * distance)
+            kept_rings[:, distance - 1] += _offset_sums(ring_table, max(row_offset, 0) - 2, min(row_offset, 0) + 2,
+                                                        max(column_offset, 0) - 2, min(column_offset, 0) + 2)
+
+        # The conditions are combined in place, since each array of the batch is large
+        legal = masks[:, direction_index]
+        np.greater(kept_rings, 0, out=legal)
+        legal &= ~path_blocked
+        legal &= inside
+        legal &= in_range
+        legal &= (movable & own[:, 1 + row_step:19 + row_step, 1 + column_step:19 + column_step])[:, None]
+    return np.ascontiguousarray(masks.transpose(0, 3, 4, 1, 2))
+
+
+def move_to_index(move):
+    """
+    Converts a move into its index in a legal-move mask.
+    :param move: A tuple of the origin and destination squares of a move, such as ('c3', 'c6').
+    :return: Returns a tuple of the origin row, origin column, direction and distance indices in MASK_SHAPE. Raises a
+    ValueError if the move is not in a straight line, or its centers are outside rows and columns 1 to 18.
+    """
+    ((origin_row, origin_column), (destination_row, destination_column)) = [
+        (20 - int(square[1:]), _COLUMNS.index(square[0])) for square in move]
+    row_change = destination_row - origin_row
+    column_change = destination_column - origin_column
+    distance = max(abs(row_change), abs(column_change))
+    if distance == 0 or (row_change != 0 and column_change != 0 and abs(row_change) != abs(column_change)) or \
+            not all(1 <= number <= 18 for number in (origin_row, origin_column, destination_row, destination_column)):
+        raise ValueError(f'{move[0]}-{move[1]} is not a move of a piece in a straight line')
+    direction_index = [(row_step, column_step) for (row_step, column_step, _) in DIRECTIONS].index(
+        (row_change // distance, column_change // distance))
+    return origin_row - 1, origin_column - 1, direction_index, distance - 1
+
+
+def index_to_move(index):
+    """
+    Converts an index of a legal-move mask back into a move.
+    :param index: A tuple of the origin row, origin column, direction and distance indices, as returned by
+    move_to_index or found in a mask.
+    :return: Returns a tuple of the origin and destination squares.
+    """
+    (row_index, column_index, direction_index, distance_index) = [int(number) for number in index]
+    (row_step, column_step, _) = DIRECTIONS[direction_index]
+    (origin_row, origin_column) = (row_index + 1, column_index + 1)
+    (destination_row, destination_column) = (origin_row + row_step * (distance_index + 1),
+                                             origin_column + column_step * (distance_index + 1))
+    return (f'{_COLUMNS[origin_column]}{20 - origin_row}',
+            f'{_COLUMNS[destination_column]}{20 - destination_row}')
+
+
+def mask_to_moves(mask):
+    """
+    Lists the moves of a legal-move mask of one position.
+    :param mask: A boolean array of MASK_SHAPE.
+    :return: Returns a list of (origin square, destination square) tuples.
+    """
+    return [index_to_move(index) for index in np.argwhere(mask)]
+
+
+def main():
+    """
+    Allows for basic testing in case the GessMoveMask.py file is called as a script.
+    """
+    (boards, players) = positions_to_arrays([GessGame()])
+    print(f'{len(mask_to_moves(get_legal_move_masks(boards, players)[0]))} legal moves at the start of the game')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: Unit testing to check validity of GessMoveMask.py
+
+import random
+import unittest
+
+import numpy as np
+
+from GessGame import GessGame
+from GessMoveMask import MASK_SHAPE, get_legal_move_masks, index_to_move, mask_to_moves, move_to_index, \
+    positions_to_arrays
+from GessPosition import Position
+
+
+class TestGessMoveMask(unittest.TestCase):
+    """
+    Contains unit tests for the GessMoveMask functions
+    """
+
+    def test_masks_match_legal_moves(self):
+        """
+        Tests that the masks of a batch of positions from random games list exactly the moves of get_legal_moves.
+        """
+        random_moves = random.Random(5)
+        games = []
+        for _ in range(6):
+            gess = GessGame()
+            while gess.get_game_state() == 'UNFINISHED' and gess.get_legal_moves() and len(games) < 400:
+                games.append(gess.copy())
+                gess.make_move(*random_moves.choice(gess.get_legal_moves()))
+
+        (boards, players) = positions_to_arrays(games)
+        masks = get_legal_move_masks(boards, players)
+        self.assertEqual(masks.shape, (len(games),) + MASK_SHAPE)
+        self.assertEqual(masks.dtype, np.bool_)
+        for gess, mask in zip(games, masks):
+            self.assertEqual(sorted(mask_to_moves(mask)), sorted(gess.get_legal_moves()))
+
+        # Positions give the same arrays as the games they were taken from
+        (position_boards, position_players) = positions_to_arrays([Position.from_game(gess) for gess in games[:10]])
+        self.assertTrue(np.array_equal(position_boards, boards[:10]))
+        self.assertTrue(np.array_equal(position_players, players[:10]))
+
+    def test_move_indices(self):
+        """
+        Tests the conversion between moves and mask indices.
+        """
+        self.assertEqual(move_to_index(('c3', 'c6')), (16, 1, 1, 2))
+        self.assertEqual(index_to_move((16, 1, 1, 2)), ('c3', 'c6'))
+        self.assertEqual(index_to_move(move_to_index(('r18', 'b2'))), ('r18', 'b2'))
+        for move in (('c3', 'c3'), ('c3', 'd5'), ('a3', 'c3')):
+            with self.assertRaises(ValueError):
+                move_to_index(move)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,284 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: A text notation for games of Gess, with a streaming parser and exporter and a parallel validator
+
+import multiprocessing
+import os
+import re
+from collections import namedtuple
+
+from GessGame import GessGame
+
+# A game in text notation is a block of header tags, one per line, followed by the moves and the result:
+#
+#     [Event "Club championship"]
+#     [Black "Ada"]
+#     [White "Grace"]
+#     [Result "BLACK_WON"]
+#
+#     1. c3-c5 r18-r16 2. r3-r5 r16-q16 3. k6-n9 m15-j12 4. r5-r3 j13-h15 5. j7-h7 j10-h12 6. i3-i13 c15-c12
+#     7. i13-l16 BLACK_WON
+#
+# Moves are written as origin-destination using the square names accepted by GessGame.make_move. Move numbers are
+# optional. The moves end with the result, which is a game state: 'BLACK_WON', 'WHITE_WON' or 'UNFINISHED'. A game won
+# while the board is still unfinished is a resignation (or forfeit) of the player to move. Games are separated by a
+# blank line, and a new game starts at the first tag line after the moves of the previous game, or at the first line
+# after the result of the previous game.
+RESULTS = ('BLACK_WON', 'WHITE_WON', 'UNFINISHED')
+
+# A parsed game: a dictionary of its tags, its list of (origin square, destination square) moves, its result, the line
+# number the game starts on and the line number of each move.
+GameText = namedtuple('GameText', ['tags', 'moves', 'result', 'line', 'move_lines'])
+
+# An error found in a game: the line number it was found on, the ply of the move it concerns (1 for the first move, or 0
+# for errors that do not concern a move) and a description.
+ValidationError = namedtuple('ValidationError', ['line', 'ply', 'message'])
+
+_TAG = re.compile(r'^\[(\w+) "((?:[^"\\]|\\.)*)"\]$')
+_MOVE = re.compile(r'^([a-t](?:[1-9]|1[0-9]|20))-([a-t](?:[1-9]|1[0-9]|20))$')
+_MOVE_NUMBER = re.compile(r'^\d+\.$')
+
+
+class NotationError(ValueError):
+    """
+    A NotationError is raised when text is not valid Gess notation.
+    The line number and ply of the error are kept in the line and ply attributes.
+    """
+    def __init__(self, line, ply, message):
+        super().__init__(f'line {line}, ply {ply}: {message}')
+        self.line = line
+        self.ply = ply
+        self.message = message
+
+
+def _split_games(lines, first_line=1):
+    """
+    Groups lines of text into the lines of each game.
+    :param lines: An iterable of lines of text.
+    :param first_line: Integer line number of the first line.
+    :return: Returns a generator of (line number, list of (line number, line) tuples) for each game, skipping blank
+    lines.
+    """
+    game_line = None
+    game_lines = []
+    previous_is_tag = False
+    previous_ends_game = False
+    for line_number, line in enumerate(lines, first_line):
+        line = line.strip()
+        if not line:
+            continue
+        is_tag = line.startswith('[')
+        if game_lines and ((is_tag and not previous_is_tag) or previous_ends_game):
+            yield game_line, game_lines
+            game_lines = []
+        if not game_lines:
+            game_line = line_number
+        game_lines.append((line_number, line))
+        previous_is_tag = is_tag
+        previous_ends_game = not is_tag and line.split()[-1] in RESULTS
+    if game_lines:
+        yield game_line, game_lines
+
+
+def _parse_game(game_line, game_lines):
+    """
+    Parses the lines of one game.
+    :param game_line: Integer line number the game starts on.
+    :param game_lines: A list of (line number, line) tuples of the game, without blank lines.
+    :return: Returns a GameText. Raises a NotationError if the game is not valid notation.
+    """
+    tags = {}
+    moves = []
+    move_lines = []
+    result = None
+    for line_number, line in game_lines:
+        if line.startswith('['):
+            match = _TAG.match(line)
+            if match is None:
+                raise NotationError(line_number, 0, f'invalid tag line: {line}')
+            tags[match.group(1)] = re.sub(r'\\(.)', r'\1', match.group(2))
+            continue
+
+        for token in line.split():
+            if result is not None:
+                raise NotationError(line_number, len(moves), f'text after the result: {token}')
+            if token in RESULTS:
+                result = token
+            elif not _MOVE_NUMBER.match(token):
+                match = _MOVE.match(token)
+                if match is None:
+                    raise NotationError(line_number, len(moves) + 1, f'invalid move: {token}')
+                moves.append(match.groups())
+                move_lines.append(line_number)
+
+    if result is None:
+        raise NotationError(game_lines[-1][0], len(moves), 'missing result')
+    if tags.get('Result', result) != result:
+        raise NotationError(game_line, 0, f'result tag {tags["Result"]} does not match the result {result}')
+    return GameText(tags, moves, result, game_line, move_lines)
+
+
+def read_games(stream):
+    """
+    Reads games in text notation one at a time, so files of any size can be read with little memory.
+    :param stream: A text file or other iterable of lines.
+    :return: Returns a generator of GameText tuples. Raises a NotationError at the first game that is not valid
+    notation. The moves themselves are not checked against the rules; see check_game.
+    """
+    for game_line, game_lines in _split_games(stream):
+        yield _parse_game(game_line, game_lines)
+
+
+def check_game(game):
+    """
+    Replays a parsed game through a GessGame, checking every move and the result against the rules.
+    :param game: A GameText.
+    :return: Returns a ValidationError for the first problem found, or None if the game is valid.
+    """
+    gess = GessGame()
+    for ply, (move, line_number) in enumerate(zip(game.moves, game.move_lines), 1):
+        if gess.get_game_state() != 'UNFINISHED':
+            return ValidationError(line_number, ply, f'move {"-".join(move)} after the end of the game')
+        if not gess.make_move(*move):
+            return ValidationError(line_number, ply, f'illegal move {"-".join(move)}')
+
+    # A win on an unfinished board is a resignation of the player to move
+    final_state = gess.get_game_state()
+    resigned_state = 'WHITE_WON' if gess.get_current_player() == 'B' else 'BLACK_WON'
+    if game.result != final_state and not (final_state == 'UNFINISHED' and game.result == resigned_state):
+        line_number = game.move_lines[-1] if game.move_lines else game.line
+        return ValidationError(line_number, len(game.moves),
+                               f'result {game.result} does not match the game state {final_state}')
+    return None
+
+
+def format_game(moves, result, tags=None, line_length=80):
+    """
+    Writes a game in text notation.
+    :param moves: A list of (origin square, destination square) string pairs.
+    :param result: The result of the game, one of RESULTS.
+    :param tags: Optional dictionary of header tags, written in order.
+    :param line_length: Integer of the longest line of moves written.
+    :return: Returns a string of the game, ending with a blank line.
+    """
+    lines = []
+    for name, value in (tags or {}).items():
+        escaped_value = str(value).replace('\\', '\\\\').replace('"', '\\"')
+        lines.append(f'[{name} "{escaped_value}"]')
+    if lines:
+        lines.append('')
+
+    tokens = []
+    for ply, (origin_square, destination_square) in enumerate(moves):
+        if ply % 2 == 0:
+            tokens.append(f'{ply // 2 + 1}.')
+        tokens.append(f'{origin_square}-{destination_square}')
+    tokens.append(result)
+
+    line = ''
+    for token in tokens:
+        if line and len(line) + 1 + len(token) > line_length:
+            lines.append(line)
+            line = token
+        else:
+            line = f'{line} {token}' if line else token
+    lines.append(line)
+    return '\n'.join(lines) + '\n\n'
+
+
+def write_games(games, stream):
+    """
+    Writes games in text notation one at a time, so any number of games can be exported with little memory.
+    :param games: An iterable of GameText tuples, or of (moves, result) or (moves, result, tags) tuples.
+    :param stream: A text file to write to.
+    :return: Returns the number of games written.
+    """
+    count = 0
+    for game in games:
+        if isinstance(game, GameText):
+            stream.write(format_game(game.moves, game.result, game.tags))
+        else:
+            stream.write(format_game(*game))
+        count += 1
+    return count
+
+
+def _find_game_start(game_file, offset):
+    """
+    Returns the byte offset of the first game that starts at or after an offset of a file opened in binary mode,
+    following the same rule as _split_games. The line the offset falls in is skipped, since the line before it is not
+    known.
+    """
+    game_file.seek(max(offset - 1, 0))
+    if offset > 0:
+        game_file.readline()
+    previous_is_tag = True
+    previous_ends_game = False
+    while True:
+        line_start = game_file.tell()
+        line = game_file.readline()
+        if not line:
+            return line_start
+        line = line.strip()
+        if not line:
+            continue
+        is_tag = line.startswith(b'[')
+        if (is_tag and not previous_is_tag) or previous_ends_game:
+            return line_start
+        previous_is_tag = is_tag
+        previous_ends_game = not is_tag and line.split()[-1].decode('utf-8', 'replace') in RESULTS
+
+
+def _validate_range(task):
+    """
+    Parses and checks the games in a byte range of a file. Runs in a worker process of validate_file.
+    :param task: A tuple of the path of the file and the start and end byte offsets of the range, which start at games.
+    :return: Returns a tuple of the number of lines in the range, the number of games in the range, and a list of the
+    ValidationErrors found, with line numbers counted from 1 at the start of the range.
+    """
+    (path, start, end) = task
+    with open(path, 'rb') as game_file:
+        game_file.seek(start)
+        text = game_file.read(end - start).decode('utf-8')
+
+    errors = []
+    game_count = 0
+    for game_line, game_lines in _split_games(text.split('\n')):
+        game_count += 1
+        try:
+            error = check_game(_parse_game(game_line, game_lines))
+        except NotationError as notation_error:
+            error = ValidationError(notation_error.line, notation_error.ply, notation_error.message)
+        if error is not None:
+            errors.append(error)
+    return text.count('\n'), game_count, errors
+
+
+def validate_file(path, processes=None, chunk_size=2 ** 24):
+    """
+    Checks every game of a file in text notation against the notation and the rules, in parallel.
+    The file is split into byte ranges of about chunk_size bytes, each starting at the start of a game, and the ranges
+    are parsed and replayed in worker processes. Only the ranges in flight are held in memory.
+    :param path: String of the path of the file.
+    :param processes: Optional integer of the number of worker processes. Defaults to the number of CPUs.
+    :param chunk_size: Integer of the number of bytes in each range given to a worker.
+    :return: Returns a tuple of the number of games in the file and a list of ValidationErrors, ordered by line number.
+    Each error has the line number within the whole file.
+    """
+    file_size = os.path.getsize(path)
+    boundaries = [0]
+    with open(path, 'rb') as game_file:
+        while boundaries[-1] < file_size:
+            boundaries.append(max(_find_game_start(game_file, boundaries[-1] + chunk_size), boundaries[-1] + 1))
+    boundaries[-1] = min(boundaries[-1], file_size)
+    tasks = [(path, start, end) for start, end in zip(boundaries, boundaries[1:])]
+
+    game_count = 0
+    errors = []
+    lines_before = 0
+    with multiprocessing.Pool(processes) as pool:
+        for (line_count, range_game_count, range_errors) in pool.imap(_validate_range, tasks):
+            game_count += range_game_count
+            errors.extend(error._replace(line=error.line + lines_before) for error in range_errors)
+            lines_before += line_count
+    return game_count, errors
@@ -0,0 +1,90 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: Unit testing to check validity of GessNotation.py
+
+import io
+import os
+import tempfile
+import unittest
+
+from GessNotation import GameText, NotationError, ValidationError, check_game, format_game, read_games, \
+    validate_file, write_games
+from GessTestGames import FULL_GAME
+
+
+class TestGessNotation(unittest.TestCase):
+    """
+    Contains unit tests for reading, writing and validating games in text notation
+    """
+
+    def test_round_trip(self):
+        """
+        Tests that games written in text notation are read back unchanged, and that valid games pass check_game.
+        """
+        stream = io.StringIO()
+        tags = {'Event': 'Club "A" final', 'Black': 'Ada', 'White': 'Grace', 'Result': 'BLACK_WON'}
+        self.assertEqual(write_games([(FULL_GAME, 'BLACK_WON', tags), ([('c3', 'c6')], 'BLACK_WON')], stream), 2)
+        self.assertTrue(stream.getvalue().startswith('[Event "Club \\"A\\" final"]\n'))
+
+        stream.seek(0)
+        (full_game, resigned_game) = list(read_games(stream))
+        self.assertEqual((full_game.tags, full_game.moves, full_game.result, full_game.line), (tags, FULL_GAME,
+                                                                                               'BLACK_WON', 1))
+        self.assertEqual(full_game.move_lines, [6] * 9 + [7] * 4)
+        self.assertEqual(resigned_game.line, 9)
+        self.assertEqual(check_game(full_game), None)
+
+        # After c3-c6, White is to move, so only White can have resigned
+        self.assertEqual(check_game(resigned_game), None)
+        self.assertEqual(check_game(resigned_game._replace(result='WHITE_WON')),
+                         ValidationError(9, 1, 'result WHITE_WON does not match the game state UNFINISHED'))
+
+    def test_notation_errors(self):
+        """
+        Tests that text that is not valid notation raises a NotationError with its line and ply.
+        """
+        with self.assertRaises(NotationError) as context:
+            list(read_games(io.StringIO('[Black "Ada"]\n\n1. c3-c6 r18-r16\n2. c6-c9 x3\n')))
+        self.assertEqual((context.exception.line, context.exception.ply), (4, 4))
+        with self.assertRaises(NotationError) as context:
+            list(read_games(io.StringIO('1. c3-c6\n')))
+        self.assertEqual(context.exception.message, 'missing result')
+
+    def test_validate_file_in_parallel(self):
+        """
+        Tests that validating a file in many small byte ranges reports the same games and errors, with line numbers
+        within the whole file, as validating it in one range.
+        """
+        # Every fourth game has an illegal second move, and every fifth game claims the wrong result. Each game takes
+        # five lines: a tag, a blank line, two lines of moves and another blank line.
+        games = []
+        expected_errors = []
+        line = 1
+        for index in range(40):
+            moves = list(FULL_GAME)
+            result = 'BLACK_WON'
+            if index % 4 == 0:
+                moves[1] = ('r18', 'r12')
+            if index % 5 == 0:
+                result = 'UNFINISHED'
+            games.append(GameText({'Round': str(index)}, moves, result, 0, []))
+            if index % 4 == 0:
+                expected_errors.append(ValidationError(line + 2, 2, 'illegal move r18-r12'))
+            elif index % 5 == 0:
+                expected_errors.append(ValidationError(line + 3, 13,
+                                                       'result UNFINISHED does not match the game state BLACK_WON'))
+            line += 5
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'games.txt')
+            with open(path, 'w') as game_file:
+                write_games(games, game_file)
+                game_file.write('[Round "last"]\n\n1. c3-c6 r18-r16 2. c6-d7 BLACK_WON\n')
+            expected_errors.append(ValidationError(line + 2, 3, 'illegal move c6-d7'))
+
+            self.assertEqual(validate_file(path, processes=1, chunk_size=2 ** 24), (41, expected_errors))
+            self.assertEqual(validate_file(path, processes=3, chunk_size=300), (41, expected_errors))
+
+
+if __name__ == '__main__':
+    unittest.main()
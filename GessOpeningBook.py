@@ -0,0 +1,96 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: A memory-mapped opening book for the game of Gess
+
+import struct
+
+from GessGame import GessGame
+from GessRecordFile import SortedRecordFile, write_record_file
+
+# The book file is a record file, as written by write_record_file.
+# Each record is a fixed-width entry of a position hash, the origin and destination squares of a move played in that
+# position, and the number of times that move was played. Records are sorted by position hash, then by count.
+_RECORD = struct.Struct('<Q3s3sI')
+_MAGIC = b'GESSBOOK'
+_VERSION = 1
+
+
+def build_opening_book(games, path, max_ply=20):
+    """
+    Builds an opening book file from game records, such as self-play games or curated games.
+    Each game is replayed through a GessGame, and every move played in the first max_ply plies is counted against the
+    hash of the position it was played in. A game is only counted up to its first illegal move.
+    The file is written to a temporary path and then moved into place, so readers never see a partial book.
+    :param games: An iterable of game records, each a list of (origin square, destination square) string pairs.
+    :param path: String of the path the book file is written to.
+    :param max_ply: Integer of the number of plies from the start of each game to include in the book.
+    :return: Returns the number of records written to the book.
+    """
+    counts = {}
+    for moves in games:
+        gess = GessGame()
+        for (origin_square, destination_square) in moves[:max_ply]:
+            position_hash = gess.get_position_hash()
+            if not gess.make_move(origin_square, destination_square):
+                break
+            key = (position_hash, origin_square, destination_square)
+            counts[key] = counts.get(key, 0) + 1
+
+    # Sort by position hash, placing the most played move of each position first
+    entries = sorted(counts.items(), key=lambda entry: (entry[0][0], -entry[1], entry[0][1], entry[0][2]))
+    return write_record_file(path, _MAGIC, _VERSION, _RECORD,
+                             [(position_hash, origin_square.encode(), destination_square.encode(), count)
+                              for (position_hash, origin_square, destination_square), count in entries])
+
+
+class GessOpeningBook(SortedRecordFile):
+    """
+    A GessOpeningBook object gives read access to an opening book file built by build_opening_book.
+    The file is memory-mapped rather than loaded, and positions are found with a binary search over the sorted records,
+    so many processes can share one copy of the book through the operating system's page cache.
+    The GessOpeningBook can return every book move of a position hash, or pick a legal book move for a GessGame.
+    """
+    def __init__(self, path):
+        """
+        Initiates the GessOpeningBook object by memory-mapping the book file at the given path.
+        :param path: String of the path of a book file built by build_opening_book. Raises a ValueError if the file
+        is not an opening book of this version, or is damaged.
+        """
+        super().__init__(path, _MAGIC, _VERSION, _RECORD, 'Gess opening book')
+
+    def _get_book_record(self, index):
+        """
+        Returns the record at the given index of the sorted table.
+        :param index: Integer index of the record.
+        :return: Returns a tuple of the position hash, origin square, destination square and count of the record.
+        """
+        (position_hash, origin_square, destination_square, count) = self.get_record(index)
+        return position_hash, origin_square.decode().strip('\x00'), destination_square.decode().strip('\x00'), count
+
+    def probe(self, position_hash):
+        """
+        Returns the book moves recorded for a position, most played first.
+        :param position_hash: Integer hash of the position, as returned by GessGame.get_position_hash.
+        :return: Returns a list of (origin square, destination square, count) tuples. The list is empty if the position
+        is not in the book.
+        """
+        moves = []
+        for index in range(self.find_first(position_hash), len(self)):
+            record = self._get_book_record(index)
+            if record[0] != position_hash:
+                break
+            moves.append(record[1:])
+        return moves
+
+    def get_book_move(self, gess_game):
+        """
+        Returns the most played book move of the current position of a GessGame that is legal in that position.
+        Each candidate is tried on a copy of the game without its subscribers, so a hash collision can never produce an
+        illegal move and probing publishes no events.
+        :param gess_game: The GessGame whose current position is looked up.
+        :return: Returns a tuple of the origin and destination squares, or None if the position has no legal book move.
+        """
+        for (origin_square, destination_square, _) in self.probe(gess_game.get_position_hash()):
+            if gess_game.copy().make_move(origin_square, destination_square):
+                return origin_square, destination_square
+        return None
@@ -0,0 +1,78 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: Unit testing to check validity of GessOpeningBook.py
+
+import os
+import tempfile
+import unittest
+
+from GessGame import GessGame
+from GessOpeningBook import GessOpeningBook, build_opening_book
+
+
+class TestGessOpeningBook(unittest.TestCase):
+    """
+    Contains unit tests for the build_opening_book function and the GessOpeningBook class
+    """
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._directory.name, 'opening.book')
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_probe_start_position(self):
+        """
+        Tests that the moves played from the starting position are found, most played first.
+        """
+        games = [[('c3', 'c6'), ('r18', 'r16')],
+                 [('c3', 'c6'), ('c18', 'c15')],
+                 [('r3', 'r6')]]
+        self.assertEqual(build_opening_book(games, self._path), 4)
+        with GessOpeningBook(self._path) as book:
+            self.assertEqual(book.probe(GessGame().get_position_hash()), [('c3', 'c6', 2), ('r3', 'r6', 1)])
+            self.assertEqual(book.probe(12345), [])
+
+            gess = GessGame()
+            gess.make_move('c3', 'c6')
+            self.assertEqual(len(book.probe(gess.get_position_hash())), 2)
+
+    def test_get_book_move(self):
+        """
+        Tests that games are only counted up to their first illegal move, and that the book move is returned.
+        """
+        games = [[('r18', 'r16'), ('c3', 'c6')], [('c3', 'c5'), ('c3', 'c5')]]
+        build_opening_book(games, self._path)
+        with GessOpeningBook(self._path) as book:
+            self.assertEqual(len(book), 1)
+            self.assertEqual(book.get_book_move(GessGame()), ('c3', 'c5'))
+
+    def test_get_book_move_publishes_no_events(self):
+        """
+        Tests that looking up a book move leaves the game unchanged and publishes no events to its subscribers.
+        """
+        build_opening_book([[('c3', 'c6')]], self._path)
+        gess = GessGame()
+        events = []
+
+        def record_event(event):
+            events.append(event)
+        gess.subscribe(record_event)
+        with GessOpeningBook(self._path) as book:
+            self.assertEqual(book.get_book_move(gess), ('c3', 'c6'))
+        self.assertEqual(events, [])
+        self.assertEqual(gess.get_position_hash(), GessGame().get_position_hash())
+
+    def test_empty_book(self):
+        """
+        Tests that an empty book can be opened and probed.
+        """
+        build_opening_book([], self._path)
+        with GessOpeningBook(self._path) as book:
+            self.assertEqual(book.probe(GessGame().get_position_hash()), [])
+            self.assertEqual(book.get_book_move(GessGame()), None)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,230 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: Immutable snapshots of Gess positions, sharing unchanged rows between positions
+
+from GessGame import GessGame, get_position_hash
+
+_COLUMNS = 'abcdefghijklmnopqrst'
+_OPPONENTS = {'W': 'B', 'B': 'W'}
+
+
+class Position:
+    """
+    A Position object is a read-only snapshot of a game of Gess: the tokens of the playable 20x20 area of the board,
+    the player to move and the game state.
+    The rows of the board are tuples, so a Position can be read by any number of threads or asyncio tasks at once
+    without locks or copies. Applying a move returns a new Position, which shares every row the move did not change with
+    the Position it was made from, and follows the same rules as GessGame.make_move.
+    """
+    __slots__ = ('_rows', '_player', '_game_state', '_position_hash', '_ring_centers')
+
+    def __init__(self, rows, player='B', game_state='UNFINISHED', ring_centers=None):
+        """
+        Initiates the Position object.
+        :param rows: A sequence of 20 rows of 20 squares (' ', 'W' or 'B'), in the order of the rows of GessBoard, so
+        that rows[0] is row 20 of the board. Rows that are already tuples are shared rather than copied.
+        :param player: The character 'W' or 'B' representing the player to move.
+        :param game_state: String of the game state ('UNFINISHED', 'BLACK_WON' or 'WHITE_WON').
+        :param ring_centers: Optional dictionary from a player to a tuple of the (row, column) centers of the player's
+        rings, if they are already known.
+        """
+        set_slot = object.__setattr__
+        set_slot(self, '_rows', tuple(row if type(row) is tuple else tuple(row) for row in rows))
+        set_slot(self, '_player', player)
+        set_slot(self, '_game_state', game_state)
+        set_slot(self, '_position_hash', None)
+        set_slot(self, '_ring_centers', dict(ring_centers or {}))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Position objects are immutable')
+
+    def __eq__(self, other):
+        return (isinstance(other, Position) and self._player == other._player and
+                self._game_state == other._game_state and self._rows == other._rows)
+
+    def __hash__(self):
+        return self.get_position_hash()
+
+    @classmethod
+    def from_game(cls, gess_game):
+        """
+        Takes a snapshot of the current position of a GessGame.
+        :param gess_game: The GessGame to take the snapshot of. The game itself is not changed.
+        :return: Returns a Position object.
+        """
+        board = gess_game.get_gess_board()
+        return cls([tuple(row[:20]) for row in board[:20]], gess_game.get_current_player(),
+                   gess_game.get_game_state())
+
+    def to_game(self):
+        """
+        Creates a new GessGame in this position, which can be played on without affecting the Position.
+        :return: Returns a GessGame object with the tokens, current player and game state of the Position.
+        """
+        gess = GessGame()
+        board = gess.get_board_object()
+        starting_rows = board.get_board()
+        for row_number, row in enumerate(self._rows):
+            for column_number, square in enumerate(row):
+                if starting_rows[row_number][column_number] != square:
+                    board.set_square(column_number, row_number, square)
+        gess.set_current_player(self._player)
+        gess.set_game_state(self._game_state)
+        return gess
+
+    def get_rows(self):
+        """
+        Returns the rows of the board.
+        :return: Returns a tuple of 20 tuples of 20 squares, where rows[0] is row 20 and rows[i][0] is column a.
+        """
+        return self._rows
+
+    def get_square(self, square):
+        """
+        Returns the contents of a square of the board.
+        :param square: String of column letter and row number of a square on the Gess board, such as 'c3'.
+        :return: Returns the character ' ', 'W' or 'B'.
+        """
+        return self._rows[20 - int(square[1:])][_COLUMNS.index(square[0])]
+
+    def get_current_player(self):
+        """
+        Returns the player to move.
+        :return: Returns the character 'W' or 'B'.
+        """
+        return self._player
+
+    def get_game_state(self):
+        """
+        Returns the game state of the position.
+        :return: Returns a string of the game state ('UNFINISHED', 'BLACK_WON' or 'WHITE_WON').
+        """
+        return self._game_state
+
+    def get_position_hash(self):
+        """
+        Returns the hash of the position, equal to GessGame.get_position_hash of a game in the same position.
+        The hash is computed the first time it is requested.
+        :return: Returns an integer between 0 and 2**64 - 1 identifying the position.
+        """
+        if self._position_hash is None:
+            object.__setattr__(self, '_position_hash', get_position_hash(self._rows, self._player))
+        return self._position_hash
+
+    def get_ring_centers(self, token):
+        """
+        Returns the centers of a player's rings. They are found the first time they are requested.
+        :param token: A single character ('W' or 'B') referring to the player.
+        :return: Returns a tuple of the (row, column) centers of the player's rings.
+        """
+        ring_centers = self._ring_centers.get(token)
+        if ring_centers is None:
+            ring = (token,) * 4 + (' ',) + (token,) * 4
+            rows = self._rows
+            ring_centers = tuple((row_number, column_number)
+                                 for row_number in range(1, 19)
+                                 for column_number in range(1, 19)
+                                 if rows[row_number][column_number] == ' '
+                                 and rows[row_number - 1][column_number - 1:column_number + 2] +
+                                 rows[row_number][column_number - 1:column_number + 2] +
+                                 rows[row_number + 1][column_number - 1:column_number + 2] == ring)
+            # Writing the same value from several threads is harmless, so the cache needs no lock
+            self._ring_centers[token] = ring_centers
+        return ring_centers
+
+    def apply_move(self, origin_square, destination_square):
+        """
+        Applies a move of the player to move, following the rules of GessGame.make_move.
+        :param origin_square: String of column letter and row number of the center of the piece to move.
+        :param destination_square: String of column letter and row number of the square to move the piece to.
+        :return: Returns a new Position after the move, or None if the move is not allowed. This Position is unchanged.
+        """
+        if self._game_state != 'UNFINISHED' or origin_square == destination_square:
+            return None
+        for square in (origin_square, destination_square):
+            if square[0] not in 'bcdefghijklmnopqrs' or not square[1:].isdigit() or \
+                    int(square[1:]) not in range(2, 20):
+                return None
+
+        player = self._player
+        opponent = _OPPONENTS[player]
+        rows = self._rows
+        origin_row = 20 - int(origin_square[1:])
+        origin_column = _COLUMNS.index(origin_square[0])
+        destination_row = 20 - int(destination_square[1:])
+        destination_column = _COLUMNS.index(destination_square[0])
+
+        # The piece must hold only the player's tokens, and move in a straight line
+        piece = rows[origin_row - 1][origin_column - 1:origin_column + 2] + \
+            rows[origin_row][origin_column - 1:origin_column + 2] + \
+            rows[origin_row + 1][origin_column - 1:origin_column + 2]
+        if player not in piece or opponent in piece:
+            return None
+        change_in_rows = destination_row - origin_row
+        change_in_columns = destination_column - origin_column
+        if change_in_rows != 0 and change_in_columns != 0 and abs(change_in_rows) != abs(change_in_columns):
+            return None
+
+        # The piece needs a token on the side it moves towards, and a center token to move more than three squares
+        row_step = (change_in_rows > 0) - (change_in_rows < 0)
+        column_step = (change_in_columns > 0) - (change_in_columns < 0)
+        if piece[(row_step + 1) * 3 + column_step + 1] != player:
+            return None
+        distance = max(abs(change_in_rows), abs(change_in_columns))
+        if distance > 3 and piece[4] != player:
+            return None
+
+        # Lifting or clearing tokens never forms a ring, so the player keeps a ring exactly when one of their rings lies
+        # outside both the origin footprint and the destination footprint
+        remaining_rings = [(ring_row, ring_column) for (ring_row, ring_column) in self.get_ring_centers(player)
+                           if abs(ring_row - origin_row) > 2 or abs(ring_column - origin_column) > 2]
+        if not remaining_rings:
+            return None
+
+        # Each footprint the piece passes through before the destination must be empty, apart from the squares the
+        # piece was lifted from
+        for step in range(1, distance):
+            path_row = origin_row + row_step * step
+            path_column = origin_column + column_step * step
+            for row_number in range(path_row - 1, path_row + 2):
+                for column_number in range(path_column - 1, path_column + 2):
+                    if rows[row_number][column_number] != ' ' and \
+                            (abs(row_number - origin_row) > 1 or abs(column_number - origin_column) > 1):
+                        return None
+
+        if not any(abs(ring_row - destination_row) > 2 or abs(ring_column - destination_column) > 2
+                   for (ring_row, ring_column) in remaining_rings):
+            return None
+
+        # The move is legal. Only the rows it changes are copied; every other row is shared with this Position.
+        changed_rows = {}
+
+        def set_square(row_number, column_number, token):
+            if row_number not in changed_rows:
+                if rows[row_number][column_number] == token:
+                    return
+                changed_rows[row_number] = list(rows[row_number])
+            changed_rows[row_number][column_number] = token
+
+        for row_number in range(origin_row - 1, origin_row + 2):
+            for column_number in range(origin_column - 1, origin_column + 2):
+                set_square(row_number, column_number, ' ')
+        for index, token in enumerate(piece):
+            set_square(destination_row + index // 3 - 1, destination_column + index % 3 - 1, token)
+
+        # Tokens in the boundary rows and columns are removed from the board
+        for row_number in range(20):
+            for column_number in (range(20) if row_number in (0, 19) else (0, 19)):
+                set_square(row_number, column_number, ' ')
+
+        new_rows = tuple(tuple(changed_rows[row_number]) if row_number in changed_rows else row
+                         for row_number, row in enumerate(rows))
+
+        # The opponent's rings can only have been broken by the destination footprint or the boundary clearing
+        opponent_rings = tuple((ring_row, ring_column) for (ring_row, ring_column) in self.get_ring_centers(opponent)
+                               if (abs(ring_row - destination_row) > 2 or abs(ring_column - destination_column) > 2)
+                               and 1 < ring_row < 18 and 1 < ring_column < 18)
+        game_state = 'UNFINISHED'
+        if not opponent_rings:
+            game_state = 'WHITE_WON' if player == 'W' else 'BLACK_WON'
+        return Position(new_rows, opponent, game_state, {opponent: opponent_rings})
@@ -0,0 +1,92 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: Unit testing to check validity of GessPosition.py
+
+import random
+import threading
+import unittest
+
+from GessGame import GessGame
+from GessPosition import Position
+
+
+class TestGessPosition(unittest.TestCase):
+    """
+    Contains unit tests for the Position class
+    """
+
+    def test_apply_move_shares_unchanged_rows(self):
+        """
+        Tests that applying a move returns a new Position sharing every unchanged row, and leaves the original as it was.
+        """
+        # The move c3-c6 changes rows 2 to 6 of the board, which are rows 14 to 18 of the row tuples. Row 7 keeps the token
+        # at c7, which is replaced by the token from c4.
+        start = Position.from_game(GessGame())
+        starting_rows = start.get_rows()
+        moved = start.apply_move('c3', 'c6')
+        self.assertEqual(start.get_rows(), starting_rows)
+        self.assertEqual(start.get_square('c3'), 'B')
+        self.assertEqual(moved.get_square('c3'), ' ')
+        self.assertEqual(moved.get_square('c6'), 'B')
+        self.assertEqual(moved.get_current_player(), 'W')
+        for row_number in range(20):
+            self.assertEqual(moved.get_rows()[row_number] is starting_rows[row_number],
+                             row_number not in range(14, 19))
+
+        # Illegal moves return None, and positions cannot be changed.
+        self.assertEqual(start.apply_move('c3', 'd6'), None)
+        self.assertEqual(moved.apply_move('c6', 'c9'), None)
+        self.assertRaises(AttributeError, setattr, start, '_player', 'W')
+
+    def test_apply_move_matches_make_move(self):
+        """
+        Tests that every move of a random game is accepted or rejected exactly as by GessGame.make_move, and leads to the
+        same position.
+        """
+        # Every move from a few origin squares is tried every ten plies, then a random legal move is played.
+        random_moves = random.Random(2)
+        gess = GessGame()
+        position = Position.from_game(gess)
+        for ply in range(80):
+            if ply % 10 == 0:
+                for origin_square in ['c3', 'l3', 'r3', 'c18', 'l18', 'j10']:
+                    for column in 'bcdefghijklmnopqrs':
+                        for row in range(2, 20):
+                            self.assertEqual(position.apply_move(origin_square, column + str(row)) is not None,
+                                             gess.copy().make_move(origin_square, column + str(row)))
+            legal_moves = gess.get_legal_moves()
+            if not legal_moves:
+                break
+            move = random_moves.choice(legal_moves)
+            gess.make_move(*move)
+            position = position.apply_move(*move)
+            self.assertEqual(position, Position.from_game(gess))
+            self.assertEqual(position.get_position_hash(), gess.get_position_hash())
+        self.assertEqual(position.to_game().get_gess_board(), gess.get_gess_board())
+        self.assertEqual(position.get_game_state(), gess.get_game_state())
+
+    def test_concurrent_readers(self):
+        """
+        Tests that several threads can read and extend the same Position at once with the same results.
+        """
+        # Each thread plays the same moves from the shared starting position and reports the final hash.
+        start = Position.from_game(GessGame())
+        hashes = []
+
+        def play():
+            position = start
+            for move in [('c3', 'c6'), ('r18', 'r16'), ('r3', 'r5')]:
+                position = position.apply_move(*move)
+            hashes.append((position.get_position_hash(), start.get_position_hash()))
+
+        threads = [threading.Thread(target=play) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(set(hashes)), 1)
+        self.assertEqual(hashes[0][1], GessGame().get_position_hash())
+
+
+if __name__ == '__main__':
+    unittest.main()
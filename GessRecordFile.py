@@ -0,0 +1,111 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: Memory-mapped files of fixed-width records sorted by position hash, for the opening book and tablebase
+
+import mmap
+import os
+import struct
+
+# Every record file starts with a header of an 8 byte magic string, a format version and the number of records
+_HEADER = struct.Struct('<8sII')
+
+# Every record starts with the 64 bit position hash it is sorted by
+_KEY = struct.Struct('<Q')
+
+
+def write_record_file(path, magic, version, record_struct, records):
+    """
+    Writes a record file. The file is written to a temporary path and then moved into place, so readers never see a
+    partial file.
+    :param path: String of the path the file is written to.
+    :param magic: 8 byte string identifying the kind of file.
+    :param version: Integer of the format version of the records.
+    :param record_struct: The struct.Struct of a record, starting with an unsigned 64 bit position hash.
+    :param records: A list of tuples of the fields of each record, sorted by position hash.
+    :return: Returns the number of records written.
+    """
+    temporary_path = f'{path}.{os.getpid()}.tmp'
+    with open(temporary_path, 'wb') as record_file:
+        record_file.write(_HEADER.pack(magic, version, len(records)))
+        for record in records:
+            record_file.write(record_struct.pack(*record))
+    os.replace(temporary_path, path)
+    return len(records)
+
+
+class SortedRecordFile:
+    """
+    A SortedRecordFile object gives read access to a file written by write_record_file.
+    The file is memory-mapped rather than loaded, and positions are found with a binary search over the sorted records,
+    so a lookup costs a few page reads and many processes can share one copy of the file through the operating system's
+    page cache.
+    """
+    def __init__(self, path, magic, version, record_struct, description):
+        """
+        Initiates the SortedRecordFile object by memory-mapping the file at the given path.
+        :param path: String of the path of the file.
+        :param magic: 8 byte string the file must start with.
+        :param version: Integer of the format version the file must have.
+        :param record_struct: The struct.Struct of a record, starting with an unsigned 64 bit position hash.
+        :param description: String naming the kind of file in error messages, such as 'Gess opening book'.
+        Raises a ValueError naming the file if it is not of this kind and version, or if its size does not match the
+        number of records in its header.
+        """
+        self._record_struct = record_struct
+        self._file = open(path, 'rb')
+        self._map = None
+        size = os.fstat(self._file.fileno()).st_size
+        header = self._file.read(_HEADER.size)
+        if len(header) < _HEADER.size or _HEADER.unpack(header)[:2] != (magic, version):
+            self.close()
+            raise ValueError(f'{path} is not a {description} of version {version}')
+
+        (_, _, self._record_count) = _HEADER.unpack(header)
+        if size - _HEADER.size != self._record_count * record_struct.size:
+            self.close()
+            raise ValueError(f'{path} is a damaged {description}: its header lists {self._record_count} records of '
+                             f'{record_struct.size} bytes, but {size - _HEADER.size} bytes follow the header')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return self._record_count
+
+    def close(self):
+        """
+        Closes the memory map and the file.
+        :return: Returns True once the file has been closed.
+        """
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+        return True
+
+    def get_record(self, index):
+        """
+        Returns the fields of the record at the given index of the sorted records.
+        :param index: Integer index of the record, from 0 to the number of records minus one.
+        :return: Returns a tuple of the fields of the record, starting with its position hash.
+        """
+        return self._record_struct.unpack_from(self._map, _HEADER.size + index * self._record_struct.size)
+
+    def find_first(self, position_hash):
+        """
+        Finds the first record whose position hash is not less than the requested hash, by binary search.
+        :param position_hash: Integer hash of the position, as returned by GessGame.get_position_hash.
+        :return: Returns the integer index of the record, or the number of records if every hash is less.
+        """
+        low, high = 0, self._record_count
+        while low < high:
+            middle = (low + high) // 2
+            if _KEY.unpack_from(self._map, _HEADER.size + middle * self._record_struct.size)[0] < position_hash:
+                low = middle + 1
+            else:
+                high = middle
+        return low
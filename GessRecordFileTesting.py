@@ -0,0 +1,67 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: Unit testing to check validity of GessRecordFile.py
+
+import os
+import struct
+import tempfile
+import unittest
+
+from GessRecordFile import SortedRecordFile, write_record_file
+
+_RECORD = struct.Struct('<QI')
+_MAGIC = b'GESSTEST'
+
+
+class TestGessRecordFile(unittest.TestCase):
+    """
+    Contains unit tests for the write_record_file function and the SortedRecordFile class
+    """
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._directory.name, 'records.bin')
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def open_records(self):
+        return SortedRecordFile(self._path, _MAGIC, 1, _RECORD, 'test record file')
+
+    def test_find_records(self):
+        """
+        Tests that records are found by binary search on their position hash, including in a file without records.
+        """
+        records = [(3, 30), (3, 31), (2 ** 64 - 1, 7)]
+        self.assertEqual(write_record_file(self._path, _MAGIC, 1, _RECORD, records), 3)
+        with self.open_records() as record_file:
+            self.assertEqual(len(record_file), 3)
+            self.assertEqual([record_file.find_first(position_hash) for position_hash in (0, 3, 4, 2 ** 64 - 1)],
+                             [0, 0, 2, 2])
+            self.assertEqual(record_file.get_record(1), (3, 31))
+
+        write_record_file(self._path, _MAGIC, 1, _RECORD, [])
+        with self.open_records() as record_file:
+            self.assertEqual((len(record_file), record_file.find_first(3)), (0, 0))
+
+    def test_damaged_files(self):
+        """
+        Tests that a file of another kind or version, a truncated file and a file of records of another size are each
+        rejected with a ValueError naming the file.
+        """
+        write_record_file(self._path, _MAGIC, 1, _RECORD, [(1, 1), (2, 2)])
+        with open(self._path, 'rb') as record_file:
+            contents = record_file.read()
+
+        for damaged in (b'GESSBOOK' + contents[8:], contents[:4], contents[:-1], contents + bytes(4)):
+            with open(self._path, 'wb') as record_file:
+                record_file.write(damaged)
+            with self.assertRaises(ValueError) as raised:
+                self.open_records()
+            self.assertIn(self._path, str(raised.exception))
+        with self.assertRaises(ValueError):
+            SortedRecordFile(self._path, _MAGIC, 2, _RECORD, 'test record file')
+
+
+if __name__ == '__main__':
+    unittest.main()
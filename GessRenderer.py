@@ -0,0 +1,149 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: A buffered terminal renderer for the game of Gess
+
+import sys
+import time
+
+
+class GessTerminalRenderer:
+    """
+    A GessTerminalRenderer object draws a Gess board to a terminal stream using ANSI escape codes.
+    Each frame is built in a single buffer and written to the stream with one write call.
+    In live mode, the GessTerminalRenderer remembers the last frame it drew and only redraws the squares that have
+    changed since then, moving the cursor directly to each changed square.
+    The GessTerminalRenderer can also limit the number of frames drawn per second, so that games played at a high
+    move rate do not spend their time waiting on the terminal.
+    """
+    # ANSI formats used for the squares of the board, matching the original GessGame display
+    _EMPTY_FORMAT = '\033[;37;4;43m \033[0m'
+    _WHITE_FORMAT = '\033[;30;4;1;43mO\033[0m'
+    _BLACK_FORMAT = '\033[;4;37;1;43mO\033[0m'
+    _SEPARATOR = '\033[;43;4;37m|\033[0m'
+
+    def __init__(self, stream=None, live=False, max_fps=None, clock=time.monotonic):
+        """
+        Initiates the GessTerminalRenderer object.
+        :param stream: The file-like object the frames are written to. Defaults to sys.stdout at the time of drawing.
+        :param live: Boolean. If True, frames after the first only redraw the squares that changed.
+        :param max_fps: The maximum number of frames drawn per second, or None to draw every frame.
+        :param clock: A function returning the current time in seconds, used for the frame rate limit.
+        """
+        self._stream = stream
+        self._live = live
+        self._min_interval = 1 / max_fps if max_fps else 0
+        self._clock = clock
+        self._last_draw_time = None
+        self._last_board = None
+        self._pending_board = None
+
+    def format_square(self, row_index, square):
+        """
+        Returns the ANSI formatted string for a single square of the board.
+        :param row_index: Integer of the row of the board the square is in. Row 20 holds the column labels.
+        :param square: String of the contents of the square (' ', 'W', 'B' or a label).
+        :return: Returns a string that draws the square in the terminal.
+        """
+        if row_index == 20:
+            return square
+        if square == ' ':
+            return self._EMPTY_FORMAT
+        if square == 'W':
+            return self._WHITE_FORMAT
+        if square == 'B':
+            return self._BLACK_FORMAT
+        return f'\033[;4m{square}\033[0m'
+
+    def format_row(self, row_index, row):
+        """
+        Returns the ANSI formatted line for a full row of the board.
+        :param row_index: Integer of the row of the board.
+        :param row: List of the contents of the squares in the row.
+        :return: Returns a string that draws the row in the terminal, without a trailing newline.
+        """
+        separator = '|' if row_index == 20 else self._SEPARATOR
+        return separator.join([self.format_square(row_index, square) for square in row])
+
+    def render_frame(self, board):
+        """
+        Builds the full frame for the given board as one string.
+        :param board: A list of lists representing the Gess board, as returned by GessGame.get_gess_board.
+        :return: Returns a string of the full frame, including the trailing blank lines.
+        """
+        lines = [self.format_row(row_index, row) for row_index, row in enumerate(board)]
+        return '\n'.join(lines) + '\n\n\n'
+
+    def render_changes(self, board):
+        """
+        Builds a frame that only redraws the squares that changed since the last frame drawn by this renderer.
+        The cursor is moved to each changed square using ANSI cursor addressing (the board is drawn from the top left
+        corner of the terminal), then parked on the line below the board.
+        :param board: A list of lists representing the Gess board.
+        :return: Returns a string of the partial frame. If nothing has been drawn yet, returns a full frame that first
+        clears the screen.
+        """
+        if self._last_board is None or len(self._last_board) != len(board):
+            return '\033[2J\033[H' + self.render_frame(board)
+
+        parts = []
+        for row_index, (row, last_row) in enumerate(zip(board, self._last_board)):
+            if row == last_row:
+                continue
+
+            # The label column may change width, so a change in it redraws the whole line
+            if len(row) != len(last_row) or row[-1] != last_row[-1]:
+                parts.append(f'\033[{row_index + 1};1H\033[K{self.format_row(row_index, row)}')
+                continue
+
+            # Every other square is one character wide and separated by one character from its neighbours
+            for column_index, square in enumerate(row):
+                if square != last_row[column_index]:
+                    parts.append(f'\033[{row_index + 1};{2 * column_index + 1}H')
+                    parts.append(self.format_square(row_index, square))
+
+        parts.append(f'\033[{len(board) + 2};1H')
+        return ''.join(parts)
+
+    def draw(self, board, force=False):
+        """
+        Draws the board to the stream with a single write, unless the frame rate limit has not yet elapsed.
+        A frame skipped due to the rate limit is kept, and can be drawn later using flush.
+        :param board: A list of lists representing the Gess board.
+        :param force: Boolean. If True, the frame is drawn regardless of the frame rate limit.
+        :return: Returns True if the frame was written, or False if it was skipped due to the frame rate limit.
+        """
+        now = self._clock()
+        if not force and self._last_draw_time is not None and now - self._last_draw_time < self._min_interval:
+            self._pending_board = board
+            return False
+
+        frame = self.render_changes(board) if self._live else self.render_frame(board)
+        stream = self._stream if self._stream is not None else sys.stdout
+        stream.write(frame)
+        stream.flush()
+
+        # Keep a copy of the board so that later moves do not change the record of what was drawn
+        if self._live:
+            self._last_board = [list(row) for row in board]
+        self._last_draw_time = now
+        self._pending_board = None
+        return True
+
+    def flush(self):
+        """
+        Draws the most recent frame that was skipped due to the frame rate limit, if there is one.
+        :return: Returns True if a pending frame was drawn, or False if there was nothing to draw.
+        """
+        if self._pending_board is None:
+            return False
+        return self.draw(self._pending_board, force=True)
+
+    def reset(self):
+        """
+        Forgets the last frame drawn, so that the next live frame clears the screen and redraws the full board.
+        :return: Returns True once the renderer has been reset.
+        """
+        self._last_board = None
+        self._pending_board = None
+        self._last_draw_time = None
+        return True
@@ -0,0 +1,77 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: Unit testing to check validity of GessRenderer.py
+
+import io
+import unittest
+
+from GessGame import GessGame
+from GessRenderer import GessTerminalRenderer
+
+
+class TestGessRenderer(unittest.TestCase):
+    """
+    Contains unit tests for the GessTerminalRenderer class
+    """
+
+    def test_single_write_per_frame(self):
+        """
+        Tests that a full frame is written to the stream in a single write.
+        """
+        writes = []
+
+        class RecordingStream(io.StringIO):
+            def write(self, text):
+                writes.append(text)
+                return super().write(text)
+
+        gess = GessGame()
+        gess.display(GessTerminalRenderer(stream=RecordingStream()))
+        self.assertEqual(len(writes), 1)
+        self.assertEqual(writes[0].count('\n'), 23)
+
+    def test_live_mode_only_redraws_changes(self):
+        """
+        Tests that a live renderer clears the screen on the first frame and afterwards only redraws changed squares.
+        """
+        stream = io.StringIO()
+        renderer = GessTerminalRenderer(stream=stream, live=True)
+        gess = GessGame()
+        gess.display(renderer)
+        self.assertTrue(stream.getvalue().startswith('\033[2J\033[H'))
+
+        # Moving c3 to c5 lifts the token on c2, which is drawn on line 19 and column 5 of the terminal
+        stream.truncate(0)
+        stream.seek(0)
+        gess.make_move('c3', 'c5')
+        gess.display(renderer)
+        frame = stream.getvalue()
+        self.assertNotIn('\033[2J', frame)
+        self.assertIn('\033[19;5H', frame)
+        self.assertLess(len(frame), 400)
+
+        # A frame with no changes only moves the cursor below the board
+        stream.truncate(0)
+        stream.seek(0)
+        gess.display(renderer)
+        self.assertEqual(stream.getvalue(), '\033[23;1H')
+
+    def test_frame_rate_limit(self):
+        """
+        Tests that frames drawn faster than the frame rate limit are skipped, and that the latest can be flushed.
+        """
+        now = [0.0]
+        stream = io.StringIO()
+        renderer = GessTerminalRenderer(stream=stream, max_fps=10, clock=lambda: now[0])
+        gess = GessGame()
+        self.assertEqual(renderer.draw(gess.get_gess_board()), True)
+        now[0] = 0.05
+        self.assertEqual(renderer.draw(gess.get_gess_board()), False)
+        self.assertEqual(renderer.flush(), True)
+        self.assertEqual(renderer.flush(), False)
+        now[0] = 0.2
+        self.assertEqual(renderer.draw(gess.get_gess_board()), True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: Random access to the positions of a recorded game of Gess, through cached snapshots every few plies
+
+from collections import OrderedDict
+
+from GessGame import GessGame
+from GessPosition import Position
+
+_COLUMNS = 'abcdefghijklmnopqrst'
+
+
+def get_changed_squares(from_position, to_position):
+    """
+    Returns the squares whose contents differ between two positions, so a display can redraw only those squares.
+    Rows shared between the positions are skipped without being compared square by square.
+    :param from_position: The Position currently displayed.
+    :param to_position: The Position to display.
+    :return: Returns a list of (square name, contents) tuples of the squares of to_position that differ, such as
+    ('c6', 'B').
+    """
+    changed_squares = []
+    for row_number, (from_row, to_row) in enumerate(zip(from_position.get_rows(), to_position.get_rows())):
+        if from_row is to_row or from_row == to_row:
+            continue
+        for column_number, (from_square, to_square) in enumerate(zip(from_row, to_row)):
+            if from_square != to_square:
+                changed_squares.append((f'{_COLUMNS[column_number]}{20 - row_number}', to_square))
+    return changed_squares
+
+
+class GessReplay:
+    """
+    A GessReplay object gives random access to every position of a recorded game.
+    Snapshots of the board are cached every checkpoint_interval plies, and a seek replays forward from the nearest
+    snapshot at or before the requested ply (or from the current ply, if that is nearer), so a seek usually replays
+    fewer than checkpoint_interval moves. Snapshots are immutable Position objects, which share unchanged rows.
+    At most max_checkpoints snapshots are kept besides the starting position; the least recently used are dropped first
+    and rebuilt when a later seek replays through them.
+    """
+    def __init__(self, moves, result=None, checkpoint_interval=10, max_checkpoints=64):
+        """
+        Initiates the GessReplay object, replaying the game once to check its moves and cache its first snapshots.
+        :param moves: A list of (origin square, destination square) string pairs. The game is replayed up to its first
+        illegal move.
+        :param result: Optional string of the recorded result of the game, for games that ended by resignation.
+        :param checkpoint_interval: Integer of the number of plies between snapshots.
+        :param max_checkpoints: Integer of the largest number of snapshots kept besides the starting position.
+        """
+        if checkpoint_interval < 1 or max_checkpoints < 0:
+            raise ValueError('The checkpoint interval must be positive and the number of checkpoints not negative')
+        self._checkpoint_interval = checkpoint_interval
+        self._max_checkpoints = max_checkpoints
+        self._start = Position.from_game(GessGame())
+        self._checkpoints = OrderedDict()
+
+        position = self._start
+        self._moves = []
+        for move in moves:
+            next_position = position.apply_move(*move)
+            if next_position is None:
+                break
+            position = next_position
+            self._moves.append(tuple(move))
+            if len(self._moves) % checkpoint_interval == 0:
+                self._store_checkpoint(len(self._moves), position)
+
+        self._result = result if result is not None else position.get_game_state()
+        self._current_ply = 0
+        self._current_position = self._start
+
+    def __len__(self):
+        return len(self._moves)
+
+    def get_moves(self):
+        """
+        Returns the legal moves of the recorded game.
+        :return: Returns a list of (origin square, destination square) tuples.
+        """
+        return list(self._moves)
+
+    def get_result(self):
+        """
+        Returns the result of the game: the recorded result, or else the game state after the last move.
+        :return: Returns a string of the result ('UNFINISHED', 'BLACK_WON' or 'WHITE_WON').
+        """
+        return self._result
+
+    def get_current_ply(self):
+        """
+        Returns the ply of the position last seeked to.
+        :return: Returns an integer between 0 (the starting position) and the number of moves.
+        """
+        return self._current_ply
+
+    def get_current_position(self):
+        """
+        Returns the position last seeked to.
+        :return: Returns a Position object.
+        """
+        return self._current_position
+
+    def get_checkpoint_count(self):
+        """
+        Returns the number of snapshots currently cached, besides the starting position.
+        :return: Returns an integer no greater than max_checkpoints.
+        """
+        return len(self._checkpoints)
+
+    def _store_checkpoint(self, ply, position):
+        """
+        Caches the snapshot of a ply as the most recently used, dropping the least recently used beyond the limit.
+        """
+        self._checkpoints[ply] = position
+        self._checkpoints.move_to_end(ply)
+        while len(self._checkpoints) > self._max_checkpoints:
+            self._checkpoints.popitem(last=False)
+
+    def get_position(self, ply):
+        """
+        Returns the position after a number of plies, without changing the current ply.
+        :param ply: Integer between 0 (the starting position) and the number of moves.
+        :return: Returns a Position object.
+        """
+        if not 0 <= ply <= len(self._moves):
+            raise ValueError(f'Ply {ply} is outside the game of {len(self._moves)} plies')
+
+        # Start from the current position if it is at or before the ply and nearer than the nearest checkpoint
+        checkpoint_ply = ply - ply % self._checkpoint_interval
+        while checkpoint_ply > 0 and checkpoint_ply not in self._checkpoints:
+            checkpoint_ply -= self._checkpoint_interval
+        if checkpoint_ply <= self._current_ply <= ply:
+            (start_ply, position) = (self._current_ply, self._current_position)
+        elif checkpoint_ply > 0:
+            (start_ply, position) = (checkpoint_ply, self._checkpoints[checkpoint_ply])
+            self._checkpoints.move_to_end(checkpoint_ply)
+        else:
+            (start_ply, position) = (0, self._start)
+
+        for move_ply in range(start_ply, ply):
+            position = position.apply_move(*self._moves[move_ply])
+            if (move_ply + 1) % self._checkpoint_interval == 0 and move_ply + 1 not in self._checkpoints:
+                self._store_checkpoint(move_ply + 1, position)
+        return position
+
+    def seek(self, ply):
+        """
+        Moves the replay to a ply.
+        :param ply: Integer between 0 (the starting position) and the number of moves.
+        :return: Returns a list of (square name, contents) tuples of the squares that changed from the previous ply
+        seeked to, as returned by get_changed_squares.
+        """
+        position = self.get_position(ply)
+        changed_squares = get_changed_squares(self._current_position, position)
+        (self._current_ply, self._current_position) = (ply, position)
+        return changed_squares
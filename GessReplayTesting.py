@@ -0,0 +1,77 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: Unit testing to check validity of GessReplay.py
+
+import random
+import unittest
+
+from GessGame import GessGame
+from GessPosition import Position
+from GessReplay import GessReplay, get_changed_squares
+
+
+def play_random_game(seed, plies):
+    """
+    Plays random legal moves, returning the moves and the Position after every ply.
+    """
+    random_moves = random.Random(seed)
+    gess = GessGame()
+    moves = []
+    positions = [Position.from_game(gess)]
+    while len(moves) < plies and gess.get_game_state() == 'UNFINISHED':
+        legal_moves = gess.get_legal_moves()
+        if not legal_moves:
+            break
+        move = random_moves.choice(legal_moves)
+        gess.make_move(*move)
+        moves.append(move)
+        positions.append(Position.from_game(gess))
+    return moves, positions
+
+
+class TestGessReplay(unittest.TestCase):
+    """
+    Contains unit tests for the GessReplay class
+    """
+
+    def test_seek_matches_replay(self):
+        """
+        Tests that seeking to plies in any order returns the positions of replaying the game from the start, with a
+        bounded number of snapshots, and that the changed squares turn the previous position into the new one.
+        """
+        (moves, positions) = play_random_game(3, 120)
+        replay = GessReplay(moves + [('a1', 'a2')], checkpoint_interval=7, max_checkpoints=4)
+        self.assertEqual(len(replay), len(moves))
+        self.assertEqual(replay.get_moves(), moves)
+
+        random_plies = random.Random(4)
+        for _ in range(300):
+            ply = random_plies.randint(0, len(moves))
+            displayed = [list(row) for row in replay.get_current_position().get_rows()]
+            for (square, contents) in replay.seek(ply):
+                displayed[20 - int(square[1:])]['abcdefghijklmnopqrst'.index(square[0])] = contents
+            self.assertEqual(replay.get_current_ply(), ply)
+            self.assertEqual(replay.get_current_position(), positions[ply])
+            self.assertEqual([list(row) for row in positions[ply].get_rows()], displayed)
+            self.assertLessEqual(replay.get_checkpoint_count(), 4)
+        self.assertEqual(replay.get_checkpoint_count(), 4)
+
+    def test_changed_squares_and_limits(self):
+        """
+        Tests the squares reported as changed by a move, the result of a resigned game and seeking outside the game.
+        """
+        start = Position.from_game(GessGame())
+        self.assertEqual(sorted(get_changed_squares(start, start.apply_move('c3', 'c4'))),
+                         [('b3', ' '), ('b4', 'B'), ('c2', ' '), ('c5', 'B'), ('d3', ' '), ('d4', 'B')])
+
+        replay = GessReplay([('c3', 'c4')], result='WHITE_WON')
+        self.assertEqual(replay.get_result(), 'WHITE_WON')
+        self.assertEqual(GessReplay([('c3', 'c4')]).get_result(), 'UNFINISHED')
+        with self.assertRaises(ValueError):
+            replay.seek(2)
+        with self.assertRaises(ValueError):
+            GessReplay([], checkpoint_interval=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
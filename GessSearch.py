@@ -0,0 +1,435 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: Alpha-beta search and a multi-process parallel search for the game of Gess
+
+import multiprocessing
+import queue
+import random
+import time
+from collections import namedtuple
+from multiprocessing import shared_memory
+
+from GessEvaluation import GessEvaluator
+
+# Scores at or beyond WIN_SCORE - MAXIMUM_PLY are wins found by the search, adjusted by the number of plies to the win
+WIN_SCORE = 1000000
+MAXIMUM_PLY = 256
+
+# The kinds of bound a stored score represents
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+_COLUMNS = 'abcdefghijklmnopqrst'
+_NO_SQUARE = 511
+
+# The result of a search: the best move found as an (origin square, destination square) tuple (or None if the player
+# to move has no legal move), its score from the point of view of the player to move, the depth of the last completed
+# iteration and the number of positions searched.
+SearchResult = namedtuple('SearchResult', ['move', 'score', 'depth', 'nodes'])
+
+
+def _encode_square(square):
+    """
+    Converts a square name such as 'c3' into a number from 0 to 399, using the row and column of the board lists.
+    """
+    return (20 - int(square[1:])) * 20 + _COLUMNS.index(square[0])
+
+
+def _decode_square(number):
+    """
+    Converts a number from _encode_square back into a square name.
+    """
+    return _COLUMNS[number % 20] + str(20 - number // 20)
+
+
+class _SearchStopped(Exception):
+    """
+    Raised inside the search when the time budget has run out or the search has been asked to stop.
+    """
+
+
+class TranspositionTable:
+    """
+    A TranspositionTable object stores the results of searched positions in the memory of this process, for searchers
+    that run in a single process.
+    Each entry is two 64 bit words: the position hash combined with the entry's data by exclusive or, and the data
+    itself (score, depth, bound and best move). Entries are written and read without locks. An entry torn by two
+    writers at once no longer matches its position hash, and is ignored when probed.
+    """
+    def __init__(self, size=2 ** 20):
+        """
+        Initiates the TranspositionTable object with every entry empty.
+        :param size: Integer of the number of entries in the table.
+        """
+        self._size = size
+        self._buffer = bytearray(size * 16)
+        self._slots = memoryview(self._buffer).cast('Q')
+
+    def get_size(self):
+        """
+        Returns the number of entries in the table.
+        :return: Returns an integer of the number of entries.
+        """
+        return self._size
+
+    def clear(self):
+        """
+        Removes every entry from the table.
+        :return: Returns True once the table has been cleared.
+        """
+        self._buffer[:self._size * 16] = bytes(self._size * 16)
+        return True
+
+    def probe(self, position_hash):
+        """
+        Returns the stored entry of a position.
+        :param position_hash: Integer hash of the position, as returned by GessGame.get_position_hash.
+        :return: Returns a tuple of the depth, bound, score and best move (or None) of the entry, or None if the
+        position has no valid entry.
+        """
+        index = (position_hash % self._size) * 2
+        data = self._slots[index + 1]
+        if data == 0 or self._slots[index] ^ data != position_hash:
+            return None
+        score = (data & 0xFFFFFFFF) - 2 ** 31
+        depth = (data >> 32) & 0xFF
+        bound = (data >> 40) & 0x3
+        origin = (data >> 42) & 0x1FF
+        destination = (data >> 51) & 0x1FF
+        move = None if origin == _NO_SQUARE else (_decode_square(origin), _decode_square(destination))
+        return depth, bound, score, move
+
+    def store(self, position_hash, depth, bound, score, move):
+        """
+        Stores the result of searching a position, unless the table holds a deeper result for the same position.
+        :param position_hash: Integer hash of the position.
+        :param depth: Integer of the depth the position was searched to, from 0 to 255.
+        :param bound: EXACT, LOWER_BOUND or UPPER_BOUND.
+        :param score: Integer of the score of the position from the point of view of the player to move.
+        :param move: The best move found as an (origin square, destination square) tuple, or None.
+        :return: Returns True if the entry was written, or False if a deeper entry was kept.
+        """
+        index = (position_hash % self._size) * 2
+        stored_data = self._slots[index + 1]
+        if stored_data and self._slots[index] ^ stored_data == position_hash and (stored_data >> 32) & 0xFF > depth:
+            return False
+
+        (origin, destination) = (_NO_SQUARE, _NO_SQUARE) if move is None else \
+            (_encode_square(move[0]), _encode_square(move[1]))
+        data = (score + 2 ** 31) | depth << 32 | bound << 40 | origin << 42 | destination << 51
+        self._slots[index] = position_hash ^ data
+        self._slots[index + 1] = data
+        return True
+
+    def close(self):
+        """
+        Releases the entries of the table, which can no longer be used.
+        :return: Returns True once the table has been closed.
+        """
+        self._slots.release()
+        return True
+
+
+class SharedTranspositionTable(TranspositionTable):
+    """
+    A SharedTranspositionTable object stores the results of searched positions in a block of shared memory, so that
+    searchers in several processes can share their work. Entries are laid out as in a TranspositionTable.
+    """
+    def __init__(self, size=2 ** 20, name=None):
+        """
+        Initiates the SharedTranspositionTable object, creating a new table or attaching to an existing one.
+        :param size: Integer of the number of entries in the table.
+        :param name: String of the name of an existing table to attach to, as returned by get_name. If not provided,
+        a new table is created, and should be unlinked by its creator once all searchers have finished.
+        """
+        self._size = size
+        self._memory = shared_memory.SharedMemory(name=name, create=name is None, size=size * 16)
+        self._buffer = self._memory.buf
+        self._slots = self._buffer.cast('Q')
+        if name is None:
+            self.clear()
+
+    def get_name(self):
+        """
+        Returns the name other processes use to attach to the table.
+        :return: Returns a string of the name of the shared memory block.
+        """
+        return self._memory.name
+
+    def close(self):
+        """
+        Detaches this process from the table.
+        :return: Returns True once the table has been closed.
+        """
+        super().close()
+        self._buffer = None
+        self._memory.close()
+        return True
+
+    def unlink(self):
+        """
+        Frees the shared memory of the table. Called once by its creator, after every process has closed it.
+        :return: Returns True once the table has been freed.
+        """
+        self._memory.unlink()
+        return True
+
+
+class GessSearcher:
+    """
+    A GessSearcher object searches a GessGame position for the best move of the current player.
+    The GessSearcher uses an iterative deepening alpha-beta (negamax) search over GessGame.get_legal_moves, making and
+    taking back moves with GessGame.make_move and GessGame.undo_move, and scoring positions with a GessEvaluator.
+    Results are stored in an optional transposition table, which may be shared with searchers in other processes.
+    A GessSearcher given a seed searches moves in a shuffled order, so that searchers sharing a table explore
+    different parts of the tree.
+    """
+    def __init__(self, table=None, weights=None, seed=None):
+        """
+        Initiates the GessSearcher object.
+        :param table: Optional TranspositionTable or SharedTranspositionTable to store and look up searched positions.
+        :param weights: Optional dictionary of evaluation weights, passed to the GessEvaluator.
+        :param seed: Optional seed used to shuffle the order moves are searched in.
+        """
+        self._table = table
+        self._weights = weights
+        self._random = random.Random(seed) if seed is not None else None
+        self._game = None
+        self._evaluator = None
+        self._deadline = None
+        self._stop_event = None
+        self._nodes = 0
+        self._store_root = True
+
+    def search(self, gess_game, time_limit=None, max_depth=None, stop_event=None, root_moves=None):
+        """
+        Searches the current position of a GessGame. The game itself is not changed.
+        :param gess_game: The GessGame to search.
+        :param time_limit: Optional number of seconds to search for. The deepest completed iteration is returned.
+        :param max_depth: Optional integer of the deepest iteration to search.
+        :param stop_event: Optional threading or multiprocessing Event. The search stops soon after it is set.
+        At least one of time_limit, max_depth and stop_event must be given, so that the search ends.
+        :param root_moves: Optional list of moves to search at the root, instead of every legal move.
+        :return: Returns a SearchResult. Raises a ValueError if the search has nothing to end it.
+        """
+        if time_limit is None and max_depth is None and stop_event is None:
+            raise ValueError('A search needs a time_limit, a max_depth or a stop_event')
+        self._game = gess_game.copy()
+        self._evaluator = GessEvaluator(self._game.get_board_object(), self._weights)
+        self._deadline = None if time_limit is None else time.monotonic() + time_limit
+        self._stop_event = stop_event
+        self._nodes = 0
+        self._store_root = root_moves is None
+
+        moves = self._game.get_legal_moves()
+        if root_moves is not None:
+            moves = [move for move in moves if move in root_moves]
+        result = SearchResult(moves[0] if moves else None, 0, 0, 0)
+        if not moves:
+            return result._replace(score=-WIN_SCORE)
+
+        depth = 1
+        while max_depth is None or depth <= max_depth:
+            try:
+                (score, move) = self._search_root(moves, depth)
+            except _SearchStopped:
+                break
+            result = SearchResult(move, score, depth, self._nodes)
+
+            # Search the best move first in the next iteration, and stop once a forced result has been found
+            moves.remove(move)
+            moves.insert(0, move)
+            if abs(score) >= WIN_SCORE - MAXIMUM_PLY or depth >= MAXIMUM_PLY:
+                break
+            depth += 1
+        return result._replace(nodes=self._nodes)
+
+    def _check_stop(self):
+        """
+        Raises _SearchStopped if the time budget has run out or the search has been asked to stop.
+        """
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            raise _SearchStopped
+        if self._stop_event is not None and self._stop_event.is_set():
+            raise _SearchStopped
+
+    def _order_moves(self, moves, first_move):
+        """
+        Orders moves for searching, placing the move from the transposition table first.
+        """
+        if self._random is not None:
+            self._random.shuffle(moves)
+        if first_move is not None and first_move in moves:
+            moves.remove(first_move)
+            moves.insert(0, first_move)
+        return moves
+
+    def _search_root(self, moves, depth):
+        """
+        Searches each move of the root position to the given depth.
+        :return: Returns a tuple of the best score and best move.
+        """
+        alpha = -WIN_SCORE - 1
+        best_move = moves[0]
+        for move in moves:
+            self._game.make_move(*move)
+            try:
+                score = -self._negamax(depth - 1, -WIN_SCORE - 1, -alpha, 1)
+            finally:
+                self._game.undo_move()
+            if score > alpha:
+                alpha = score
+                best_move = move
+        # A search limited to some of the root moves does not give the score of the root position
+        if self._table is not None and self._store_root:
+            self._table.store(self._game.get_position_hash(), depth, EXACT, alpha, best_move)
+        return alpha, best_move
+
+    def _negamax(self, depth, alpha, beta, ply):
+        """
+        Returns the score of the current position from the point of view of the player to move, searched to the given
+        depth within the alpha-beta window.
+        """
+        self._nodes += 1
+        if self._nodes % 64 == 0:
+            self._check_stop()
+
+        # The previous move won the game, so the player to move has lost. Sooner losses score lower.
+        if self._game.get_game_state() != 'UNFINISHED':
+            return -WIN_SCORE + ply
+        player = self._game.get_current_player()
+        if depth == 0:
+            return self._evaluator.evaluate(player)
+
+        position_hash = self._game.get_position_hash()
+        table_move = None
+        if self._table is not None:
+            entry = self._table.probe(position_hash)
+            if entry is not None:
+                (entry_depth, bound, score, table_move) = entry
+
+                # Wins are stored relative to the position, and converted back to plies from the root here
+                if score >= WIN_SCORE - MAXIMUM_PLY:
+                    score -= ply
+                elif score <= -WIN_SCORE + MAXIMUM_PLY:
+                    score += ply
+                if entry_depth >= depth:
+                    if bound == EXACT or (bound == LOWER_BOUND and score >= beta) or \
+                            (bound == UPPER_BOUND and score <= alpha):
+                        return score
+
+        # A move breaking the opponent's last ring wins at once, and no other move can score higher
+        if self._game.get_ring_capture_move() is not None:
+            return WIN_SCORE - ply - 1
+
+        moves = self._game.get_legal_moves()
+        if not moves:
+            return -WIN_SCORE + ply
+
+        original_alpha = alpha
+        best_score = -WIN_SCORE - 1
+        best_move = None
+        for move in self._order_moves(moves, table_move):
+            self._game.make_move(*move)
+            try:
+                score = -self._negamax(depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                self._game.undo_move()
+            if score > best_score:
+                best_score = score
+                best_move = move
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+
+        if self._table is not None:
+            if best_score <= original_alpha:
+                bound = UPPER_BOUND
+            elif best_score >= beta:
+                bound = LOWER_BOUND
+            else:
+                bound = EXACT
+            stored_score = best_score
+            if stored_score >= WIN_SCORE - MAXIMUM_PLY:
+                stored_score += ply
+            elif stored_score <= -WIN_SCORE + MAXIMUM_PLY:
+                stored_score -= ply
+            self._table.store(position_hash, min(depth, 255), bound, stored_score, best_move)
+        return best_score
+
+
+def search(gess_game, time_limit=None, max_depth=None, weights=None, root_moves=None):
+    """
+    Searches the current position of a GessGame in this process.
+    :param gess_game: The GessGame to search. The game itself is not changed.
+    :param time_limit: Optional number of seconds to search for.
+    :param max_depth: Optional integer of the deepest iteration to search. At least one of time_limit and
+    max_depth must be given.
+    :param weights: Optional dictionary of evaluation weights.
+    :param root_moves: Optional list of moves to search at the root, instead of every legal move.
+    :return: Returns a SearchResult. Raises a ValueError if neither time_limit nor max_depth is given.
+    """
+    if time_limit is None and max_depth is None:
+        raise ValueError('search needs a time_limit or a max_depth')
+    return GessSearcher(weights=weights).search(gess_game, time_limit, max_depth, root_moves=root_moves)
+
+
+def _run_search_process(gess_game, table_name, table_size, worker_index, time_limit, max_depth, weights,
+                        stop_event, results):
+    """
+    Runs one searcher of a parallel search in a worker process, and puts its result on the results queue.
+    """
+    table = SharedTranspositionTable(table_size, name=table_name)
+    try:
+        # The first searcher keeps the natural move order. The others shuffle their moves, so that each explores a
+        # different part of the tree and leaves results in the shared table for the rest.
+        seed = None if worker_index == 0 else worker_index
+        result = GessSearcher(table, weights, seed).search(gess_game, time_limit, max_depth, stop_event)
+        results.put((worker_index, result))
+    finally:
+        table.close()
+
+
+def parallel_search(gess_game, processes=None, time_limit=None, max_depth=None, weights=None, table_size=2 ** 20):
+    """
+    Searches the current position of a GessGame with several searcher processes sharing one transposition table.
+    The searchers run independently over the same root position, in the style of Lazy SMP. The first searcher to
+    finish its time budget (or its deepest iteration) decides the result, and the rest are then stopped.
+    :param gess_game: The GessGame to search. The game itself is not changed.
+    :param processes: Optional integer of the number of searcher processes. Defaults to the number of CPUs.
+    :param time_limit: Optional number of seconds to search for.
+    :param max_depth: Optional integer of the deepest iteration to search. At least one of time_limit and
+    max_depth must be given.
+    :param weights: Optional dictionary of evaluation weights.
+    :param table_size: Integer of the number of entries in the shared transposition table.
+    :return: Returns a SearchResult. Raises a ValueError if neither time_limit nor max_depth is given.
+    """
+    if time_limit is None and max_depth is None:
+        raise ValueError('parallel_search needs a time_limit or a max_depth')
+    processes = processes or multiprocessing.cpu_count()
+    table = SharedTranspositionTable(table_size)
+    stop_event = multiprocessing.Event()
+    results = multiprocessing.Queue()
+    position = gess_game.copy()
+    workers = [multiprocessing.Process(target=_run_search_process,
+                                       args=(position, table.get_name(), table_size, worker_index, time_limit,
+                                             max_depth, weights, stop_event, results))
+               for worker_index in range(processes)]
+    try:
+        for worker in workers:
+            worker.start()
+        while True:
+            try:
+                (_, result) = results.get(timeout=0.1)
+                break
+            except queue.Empty:
+                if not any(worker.is_alive() for worker in workers):
+                    raise RuntimeError('every searcher process stopped without a result')
+    finally:
+        stop_event.set()
+        for worker in workers:
+            worker.join()
+        table.close()
+        table.unlink()
+    return result
@@ -0,0 +1,95 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: Unit testing to check validity of GessSearch.py
+
+import unittest
+
+from GessGame import GessGame
+from GessSearch import EXACT, LOWER_BOUND, WIN_SCORE, GessSearcher, SharedTranspositionTable, TranspositionTable, \
+    parallel_search, search
+from GessTestGames import FULL_GAME
+
+
+def play_moves(moves):
+    """
+    Returns a GessGame after playing the given moves from the starting position.
+    """
+    gess = GessGame()
+    for move in moves:
+        gess.make_move(*move)
+    return gess
+
+
+class TestGessSearch(unittest.TestCase):
+    """
+    Contains unit tests for the SharedTranspositionTable and GessSearcher classes and the parallel search
+    """
+
+    def test_transposition_table(self):
+        """
+        Tests that entries are stored and found by position hash, that deeper entries are kept, and that a shared
+        table is seen by every handle to it.
+        """
+        position_hash = GessGame().get_position_hash()
+        local_table = TranspositionTable(1024)
+        table = SharedTranspositionTable(1024)
+        try:
+            for checked_table in (local_table, table):
+                self.assertEqual(checked_table.probe(position_hash), None)
+                self.assertEqual(checked_table.store(position_hash, 3, EXACT, -25, ('c3', 'c6')), True)
+                self.assertEqual(checked_table.probe(position_hash), (3, EXACT, -25, ('c3', 'c6')))
+                self.assertEqual(checked_table.store(position_hash, 2, LOWER_BOUND, 40, None), False)
+                self.assertEqual(checked_table.probe(position_hash ^ 1024), None)
+            local_table.clear()
+            self.assertEqual(local_table.probe(position_hash), None)
+
+            # A second handle to the same shared memory sees the same entries
+            attached = SharedTranspositionTable(1024, name=table.get_name())
+            self.assertEqual(attached.probe(position_hash), (3, EXACT, -25, ('c3', 'c6')))
+            attached.close()
+        finally:
+            local_table.close()
+            table.close()
+            table.unlink()
+
+    def test_search_finds_winning_move(self):
+        """
+        Tests that the search finds the move that captures the opponent's last ring.
+        """
+        gess = play_moves(FULL_GAME[:-1])
+        result = search(gess, max_depth=1)
+        self.assertEqual(result.score, WIN_SCORE - 1)
+        self.assertEqual(result.depth, 1)
+        self.assertEqual(gess.make_move(*result.move), True)
+        self.assertEqual(gess.get_game_state(), 'BLACK_WON')
+
+    def test_search_does_not_change_game(self):
+        """
+        Tests that a time limited search returns a legal move and leaves the searched game unchanged.
+        """
+        gess = play_moves(FULL_GAME[:4])
+        position_hash = gess.get_position_hash()
+        result = search(gess, time_limit=0.5)
+        self.assertIn(result.move, gess.get_legal_moves())
+        self.assertEqual(gess.get_position_hash(), position_hash)
+
+    def test_search_needs_a_limit(self):
+        """
+        Tests that a search with nothing to end it is refused rather than run without end.
+        """
+        gess = GessGame()
+        self.assertRaises(ValueError, search, gess)
+        self.assertRaises(ValueError, GessSearcher().search, gess)
+
+    def test_parallel_search(self):
+        """
+        Tests that searchers in several processes agree on the winning move.
+        """
+        gess = play_moves(FULL_GAME[:-1])
+        result = parallel_search(gess, processes=2, max_depth=1, table_size=4096)
+        self.assertEqual(result.score, WIN_SCORE - 1)
+        self.assertRaises(ValueError, parallel_search, gess)
+
+
+if __name__ == '__main__':
+    unittest.main()
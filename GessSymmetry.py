@@ -0,0 +1,118 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: Symmetry transforms and position canonicalisation for the game of Gess
+
+from GessGame import get_position_hash
+
+# The rules of Gess are unchanged by mirroring the board left to right, and by rotating the board by 180 degrees while
+# swapping the colors of the tokens and the player to move. Together with their combination (flipping the board top to
+# bottom with a color swap) and the identity, these form a group of four transforms, each of which is its own inverse.
+# The starting layout itself is only unchanged by the top to bottom flip with a color swap, but positions reached in
+# play fall into classes of up to four equivalent positions under the full group.
+IDENTITY = 'IDENTITY'
+MIRROR = 'MIRROR'
+ROTATE_SWAP = 'ROTATE_SWAP'
+FLIP_SWAP = 'FLIP_SWAP'
+TRANSFORMS = (IDENTITY, MIRROR, ROTATE_SWAP, FLIP_SWAP)
+
+_COLUMNS = 'abcdefghijklmnopqrst'
+_SWAPPED_TOKENS = {'W': 'B', 'B': 'W'}
+
+
+def _mirrors_columns(transform):
+    return transform in (MIRROR, ROTATE_SWAP)
+
+
+def _flips_rows(transform):
+    return transform in (ROTATE_SWAP, FLIP_SWAP)
+
+
+def _swaps_colors(transform):
+    return transform in (ROTATE_SWAP, FLIP_SWAP)
+
+
+def transform_player(player, transform):
+    """
+    Returns the player a transform maps the given player to.
+    :param player: The character 'W' or 'B'.
+    :param transform: One of the transforms in TRANSFORMS.
+    :return: Returns the character 'W' or 'B'.
+    """
+    return _SWAPPED_TOKENS[player] if _swaps_colors(transform) else player
+
+
+def transform_square(square, transform):
+    """
+    Returns the name of the square a transform maps the given square to.
+    :param square: String of column letter and row number of a Gess board square, such as 'c3'.
+    :param transform: One of the transforms in TRANSFORMS.
+    :return: Returns a string of the column letter and row number of the transformed square.
+    """
+    column = square[0]
+    row = int(square[1:])
+    if _mirrors_columns(transform):
+        column = _COLUMNS[19 - _COLUMNS.index(column)]
+    if _flips_rows(transform):
+        row = 21 - row
+    return column + str(row)
+
+
+def transform_move(move, transform):
+    """
+    Returns the move a transform maps the given move to.
+    Since each transform is its own inverse, this also maps a move found in a transformed position back to the original.
+    :param move: A tuple of the origin and destination squares of a move.
+    :param transform: One of the transforms in TRANSFORMS.
+    :return: Returns a tuple of the transformed origin and destination squares.
+    """
+    return tuple(transform_square(square, transform) for square in move)
+
+
+def transform_board(board, transform):
+    """
+    Returns a new board with a transform applied to the tokens of the playable 20x20 area.
+    The row and column labels are copied unchanged.
+    :param board: A list of lists representing the Gess board, as returned by GessBoard.get_board.
+    :param transform: One of the transforms in TRANSFORMS.
+    :return: Returns a new list of lists representing the transformed board.
+    """
+    transformed = [list(row) for row in board]
+    for row_index in range(20):
+        source_row = board[19 - row_index if _flips_rows(transform) else row_index]
+        for column_index in range(20):
+            square = source_row[19 - column_index if _mirrors_columns(transform) else column_index]
+            if _swaps_colors(transform):
+                square = _SWAPPED_TOKENS.get(square, square)
+            transformed[row_index][column_index] = square
+    return transformed
+
+
+def canonicalise(board, player):
+    """
+    Maps a position to the canonical representative of its symmetry class: the transformed position with the smallest
+    position hash. Every position in the class has the same canonical representative.
+    :param board: A list of lists representing the Gess board.
+    :param player: The character 'W' or 'B' representing the player to move.
+    :return: Returns a tuple of the canonical board, the canonical player to move, the canonical position hash, and the
+    transform that maps the given position to the canonical one. Applying the same transform to a move found in the
+    canonical position maps it back to the given position.
+    """
+    best = None
+    for transform in TRANSFORMS:
+        transformed_board = transform_board(board, transform)
+        transformed_player = transform_player(player, transform)
+        position_hash = get_position_hash(transformed_board, transformed_player)
+        if best is None or position_hash < best[2]:
+            best = (transformed_board, transformed_player, position_hash, transform)
+    return best
+
+
+def get_canonical_hash(gess_game):
+    """
+    Returns the canonical position hash of the current position of a GessGame, for use as a cache or book key.
+    :param gess_game: The GessGame whose current position is canonicalised.
+    :return: Returns a tuple of the canonical position hash and the transform that maps the game's position to the
+    canonical position. Moves stored for the canonical position are mapped back using transform_move.
+    """
+    (_, _, position_hash, transform) = canonicalise(gess_game.get_gess_board(), gess_game.get_current_player())
+    return position_hash, transform
@@ -0,0 +1,70 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: Unit testing to check validity of GessSymmetry.py
+
+import unittest
+
+from GessGame import GessGame, get_position_hash
+from GessSymmetry import FLIP_SWAP, IDENTITY, MIRROR, ROTATE_SWAP, TRANSFORMS, canonicalise, get_canonical_hash, \
+    transform_board, transform_move, transform_player, transform_square
+
+
+class TestGessSymmetry(unittest.TestCase):
+    """
+    Contains unit tests for the symmetry transforms and canonicalisation functions
+    """
+
+    def test_transform_square(self):
+        """
+        Tests that squares are mapped by each transform, and that each transform is its own inverse.
+        """
+        self.assertEqual(transform_square('c3', MIRROR), 'r3')
+        self.assertEqual(transform_square('c3', ROTATE_SWAP), 'r18')
+        for transform in TRANSFORMS:
+            self.assertEqual(transform_move(transform_move(('b2', 'k19'), transform), transform), ('b2', 'k19'))
+
+    def test_starting_position_symmetry(self):
+        """
+        Tests that the starting layout is unchanged by the top to bottom flip with a color swap, but not by the mirror.
+        """
+        board = GessGame().get_gess_board()
+        self.assertEqual(transform_board(board, FLIP_SWAP), board)
+        self.assertNotEqual(transform_board(board, MIRROR), board)
+        self.assertEqual(canonicalise(board, 'B')[2], canonicalise(board, 'W')[2])
+
+    def test_equivalent_positions_share_canonical_hash(self):
+        """
+        Tests that every transform of a position has the same canonical hash, reached through its own transform.
+        """
+        gess = GessGame()
+        for move in [('c3', 'c6'), ('r18', 'r16'), ('k6', 'n9')]:
+            self.assertEqual(gess.make_move(*move), True)
+        board = gess.get_gess_board()
+        player = gess.get_current_player()
+        (canonical_board, canonical_player, position_hash, transform) = canonicalise(board, player)
+        self.assertEqual(get_canonical_hash(gess), (position_hash, transform))
+        self.assertEqual(transform_board(board, transform), canonical_board)
+        self.assertEqual(get_position_hash(canonical_board, canonical_player), position_hash)
+
+        for other_transform in TRANSFORMS:
+            transformed_board = transform_board(board, other_transform)
+            transformed_player = transform_player(player, other_transform)
+            self.assertEqual(canonicalise(transformed_board, transformed_player)[2], position_hash)
+            if other_transform != IDENTITY:
+                self.assertNotEqual(get_position_hash(transformed_board, transformed_player), gess.get_position_hash())
+
+    def test_moves_follow_transformed_positions(self):
+        """
+        Tests that playing a transformed move from a transformed position reaches the transformed result.
+        """
+        gess = GessGame()
+        gess.make_move('c3', 'c6')
+        flipped = GessGame()
+        flipped.make_move('r3', 'r6')
+        flipped.make_move(*transform_move(('c3', 'c6'), FLIP_SWAP))
+        gess.make_move(*transform_move(('r3', 'r6'), FLIP_SWAP))
+        self.assertEqual(transform_board(gess.get_gess_board(), FLIP_SWAP), flipped.get_gess_board())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,207 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: An endgame tablebase for the game of Gess, solved by retrograde analysis and stored as a memory-mapped file
+
+import random
+import struct
+from collections import deque, namedtuple
+
+from GessGame import GessGame
+from GessPosition import Position
+from GessRecordFile import SortedRecordFile, write_record_file
+
+# The results stored for a position, from the point of view of the player to move
+WIN = 1
+LOSS = -1
+
+# The solution of a position: its result for the player to move, the number of plies until the game is won or lost with
+# best play (the winner winning as quickly as possible, and the loser losing as slowly as possible), and the best move as
+# an (origin square, destination square) tuple, or None if the player to move has no legal move.
+TablebaseEntry = namedtuple('TablebaseEntry', ['result', 'distance', 'move'])
+
+# The tablebase file is a record file, as written by write_record_file.
+# Each record is a fixed-width entry of a position hash, the result and distance of the position and its best move.
+# Records are sorted by position hash.
+_RECORD = struct.Struct('<QbH3s3s')
+_MAGIC = b'GESSTBAS'
+_VERSION = 1
+
+
+def generate_ring_endgames(count, extra_tokens=2, seed=None):
+    """
+    Generates random endgame positions in which each player has a single ring and a few other tokens.
+    :param count: Integer of the number of positions to generate.
+    :param extra_tokens: Integer of the number of tokens each player has besides their ring.
+    :param seed: Optional seed of the random placement, so that the same positions can be generated again.
+    :return: Returns a list of Position objects, with unfinished game states and either player to move.
+    """
+    random_placement = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        rows = [[' '] * 20 for _ in range(20)]
+
+        # The rings are placed apart from each other, with every token inside the boundary rows and columns
+        (black_center, white_center) = [(random_placement.randint(2, 17), random_placement.randint(2, 17))
+                                        for _ in range(2)]
+        if abs(black_center[0] - white_center[0]) < 3 and abs(black_center[1] - white_center[1]) < 3:
+            continue
+        for (token, (center_row, center_column)) in (('B', black_center), ('W', white_center)):
+            for row_number in range(center_row - 1, center_row + 2):
+                for column_number in range(center_column - 1, center_column + 2):
+                    if (row_number, column_number) != (center_row, center_column):
+                        rows[row_number][column_number] = token
+
+        # The other tokens go on empty squares away from the center of either ring, so neither ring is filled in
+        for token in 'BW':
+            placed = 0
+            while placed < extra_tokens:
+                row_number = random_placement.randint(1, 18)
+                column_number = random_placement.randint(1, 18)
+                if rows[row_number][column_number] == ' ' and \
+                        (row_number, column_number) not in (black_center, white_center):
+                    rows[row_number][column_number] = token
+                    placed += 1
+
+        position = Position(rows, random_placement.choice('BW'))
+        if position.get_ring_centers('B') and position.get_ring_centers('W'):
+            positions.append(position)
+    return positions
+
+
+def _get_legal_moves(position):
+    """
+    Returns the legal moves of the player to move in a position, as found by GessGame.get_legal_moves.
+    """
+    return position.to_game().get_legal_moves()
+
+
+def solve_endgames(seeds, max_positions=100000):
+    """
+    Solves every position reachable from the seed positions by retrograde analysis.
+    The positions reachable from the seeds are found by applying every legal move, until max_positions positions have
+    been found. Solving then starts from the positions in which the game has been won, and works backwards: a position
+    is won if some move leads to a lost position, and lost if every move leads to a won position. A player with no legal
+    move has lost, since they can only resign.
+    Positions whose moves lead beyond the explored positions, and positions in which neither player can force a win,
+    are left unsolved.
+    :param seeds: An iterable of Position objects or GessGame objects to start from.
+    :param max_positions: Integer of the largest number of positions to explore.
+    :return: Returns a dictionary from each solved Position with an unfinished game to its TablebaseEntry.
+    """
+    indices = {}
+    positions = []
+    for seed in seeds:
+        position = Position.from_game(seed) if isinstance(seed, GessGame) else seed
+        if position not in indices:
+            indices[position] = len(positions)
+            positions.append(position)
+
+    # Explore the positions reachable from the seeds, recording the moves leading into each position
+    predecessors = [[] for _ in positions]
+    unsolved_moves = {}
+    solutions = {}
+    solved = deque()
+    for index, position in enumerate(positions):
+        if position.get_game_state() != 'UNFINISHED':
+            solutions[index] = TablebaseEntry(LOSS, 0, None)
+            solved.append(index)
+            continue
+        if len(positions) >= max_positions:
+            continue
+
+        legal_moves = _get_legal_moves(position)
+        unsolved_moves[index] = len(legal_moves)
+        if not legal_moves:
+            solutions[index] = TablebaseEntry(LOSS, 0, None)
+            solved.append(index)
+        for move in legal_moves:
+            child = position.apply_move(*move)
+            if child not in indices:
+                indices[child] = len(positions)
+                positions.append(child)
+                predecessors.append([])
+            predecessors[indices[child]].append((index, move))
+
+    # Work backwards from the solved positions, in order of distance, so that every win is as short as possible and
+    # every loss as long as possible
+    while solved:
+        index = solved.popleft()
+        (result, distance, _) = solutions[index]
+        for (parent, move) in predecessors[index]:
+            if parent in solutions:
+                continue
+            if result == LOSS:
+                solutions[parent] = TablebaseEntry(WIN, distance + 1, move)
+                solved.append(parent)
+            else:
+                unsolved_moves[parent] -= 1
+                if unsolved_moves[parent] == 0:
+                    solutions[parent] = TablebaseEntry(LOSS, distance + 1, move)
+                    solved.append(parent)
+
+    return {positions[index]: entry for index, entry in solutions.items()
+            if positions[index].get_game_state() == 'UNFINISHED'}
+
+
+def build_tablebase(seeds, path, max_positions=100000):
+    """
+    Solves the positions reachable from the seed positions and writes the solved positions to a tablebase file.
+    The file is written by write_record_file, so readers never see a partial tablebase.
+    :param seeds: An iterable of Position objects or GessGame objects to start from, such as the positions returned by
+    generate_ring_endgames.
+    :param path: String of the path the tablebase file is written to.
+    :param max_positions: Integer of the largest number of positions to explore.
+    :return: Returns the number of records written to the tablebase.
+    """
+    solutions = solve_endgames(seeds, max_positions)
+    entries = sorted((position.get_position_hash(), entry) for position, entry in solutions.items())
+    records = []
+    for position_hash, (result, distance, move) in entries:
+        (origin_square, destination_square) = move or ('', '')
+        records.append((position_hash, result, distance, origin_square.encode(), destination_square.encode()))
+    return write_record_file(path, _MAGIC, _VERSION, _RECORD, records)
+
+
+class GessTablebase(SortedRecordFile):
+    """
+    A GessTablebase object gives read access to a tablebase file built by build_tablebase.
+    The file is memory-mapped rather than loaded, and positions are found with a binary search over the sorted records,
+    so a probe costs a few page reads and many processes can share one copy of the tablebase.
+    """
+    def __init__(self, path):
+        """
+        Initiates the GessTablebase object by memory-mapping the tablebase file at the given path.
+        :param path: String of the path of a tablebase file built by build_tablebase. Raises a ValueError if the file
+        is not a tablebase of this version, or is damaged.
+        """
+        super().__init__(path, _MAGIC, _VERSION, _RECORD, 'Gess tablebase')
+
+    def probe(self, position_hash):
+        """
+        Returns the solution of a position.
+        :param position_hash: Integer hash of the position, as returned by GessGame.get_position_hash.
+        :return: Returns a TablebaseEntry, or None if the position is not in the tablebase.
+        """
+        index = self.find_first(position_hash)
+        if index == len(self):
+            return None
+        (record_hash, result, distance, origin_square, destination_square) = self.get_record(index)
+        if record_hash != position_hash:
+            return None
+        move = None
+        if origin_square.strip(b'\x00'):
+            move = (origin_square.decode().strip('\x00'), destination_square.decode().strip('\x00'))
+        return TablebaseEntry(result, distance, move)
+
+    def get_tablebase_move(self, gess_game):
+        """
+        Returns the best move of the current position of a GessGame, if the position is in the tablebase.
+        The move is tried on a copy of the game, so a hash collision can never produce an illegal move.
+        :param gess_game: The GessGame whose current position is looked up.
+        :return: Returns a tuple of the origin and destination squares, or None if the position is not in the tablebase
+        or has no legal move.
+        """
+        entry = self.probe(gess_game.get_position_hash())
+        if entry is None or entry.move is None or not gess_game.copy().make_move(*entry.move):
+            return None
+        return entry.move
@@ -0,0 +1,70 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: Unit testing to check validity of GessTablebase.py
+
+import os
+import tempfile
+import unittest
+
+from GessTablebase import GessTablebase, LOSS, WIN, build_tablebase, generate_ring_endgames, solve_endgames
+
+
+class TestGessTablebase(unittest.TestCase):
+    """
+    Contains unit tests for the solve_endgames and build_tablebase functions and the GessTablebase class
+    """
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._directory.name, 'endgames.tablebase')
+        self._seeds = generate_ring_endgames(3, extra_tokens=1, seed=1)
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_solutions_follow_the_rules(self):
+        """
+        Tests that every solved position is won or lost as claimed when its moves are played with GessGame.make_move.
+        """
+        # A winning move ends the game or leads to a loss one ply shorter, and every move of a lost position leads to a
+        # win at most one ply shorter. A position lost in no plies has no legal moves.
+        solutions = solve_endgames(self._seeds, max_positions=3000)
+        self.assertGreater(len(solutions), 0)
+        for position, (result, distance, move) in solutions.items():
+            gess = position.to_game()
+            if result == WIN:
+                self.assertEqual(gess.make_move(*move), True)
+                if gess.get_game_state() == 'UNFINISHED':
+                    self.assertEqual(solutions[position.apply_move(*move)][:2], (LOSS, distance - 1))
+                else:
+                    self.assertEqual(distance, 1)
+            elif distance == 0:
+                self.assertEqual(gess.get_legal_moves(), [])
+            else:
+                for legal_move in gess.get_legal_moves():
+                    child_result = solutions[position.apply_move(*legal_move)]
+                    self.assertEqual(child_result.result, WIN)
+                    self.assertLessEqual(child_result.distance, distance - 1)
+
+    def test_build_and_probe(self):
+        """
+        Tests that a tablebase file returns the solutions of its positions, and nothing for other positions.
+        """
+        solutions = solve_endgames(self._seeds, max_positions=3000)
+        self.assertEqual(build_tablebase(self._seeds, self._path, max_positions=3000), len(solutions))
+        with GessTablebase(self._path) as tablebase:
+            self.assertEqual(len(tablebase), len(solutions))
+            for position, entry in solutions.items():
+                self.assertEqual(tablebase.probe(position.get_position_hash()), entry)
+                if entry.result == WIN:
+                    self.assertEqual(tablebase.get_tablebase_move(position.to_game()), entry.move)
+            self.assertEqual(tablebase.probe(12345), None)
+
+        # A file that is not a tablebase is rejected
+        with open(self._path, 'wb') as other_file:
+            other_file.write(b'GESSBOOK' + bytes(8))
+        self.assertRaises(ValueError, GessTablebase, self._path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,7 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: Recorded games of Gess shared by the unit tests
+
+# The moves of a full game, in which Black's last move captures White's only ring
+FULL_GAME = [('c3', 'c5'), ('r18', 'r16'), ('r3', 'r5'), ('r16', 'q16'), ('k6', 'n9'), ('m15', 'j12'), ('r5', 'r3'),
+             ('j13', 'h15'), ('j7', 'h7'), ('j10', 'h12'), ('i3', 'i13'), ('c15', 'c12'), ('i13', 'l16')]
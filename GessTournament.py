@@ -0,0 +1,311 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: A round-robin tournament harness with Elo ratings for engines playing the game of Gess
+
+import math
+import multiprocessing
+import random
+from collections import namedtuple
+from multiprocessing.connection import wait
+
+from GessGame import GessGame
+from GessSearch import search
+
+# The reasons a tournament game can end
+RING_CAPTURED = 'RING_CAPTURED'
+RESIGNATION = 'RESIGNATION'
+TIME_FORFEIT = 'TIME_FORFEIT'
+ILLEGAL_MOVE = 'ILLEGAL_MOVE'
+POLICY_ERROR = 'POLICY_ERROR'
+MOVE_LIMIT = 'MOVE_LIMIT'
+
+# The record of a tournament game: the indices of the Black and White engines, the final game state ('BLACK_WON',
+# 'WHITE_WON', or 'DRAW' if the move limit was reached), the reason the game ended, and the moves played.
+GameRecord = namedtuple('GameRecord', ['black', 'white', 'result', 'reason', 'moves'])
+
+# The rating of an engine: its name, Elo rating, the lower and upper bounds of the confidence interval of the rating,
+# the number of games played and the points scored (1 per win and 0.5 per draw).
+Rating = namedtuple('Rating', ['name', 'rating', 'lower', 'upper', 'games', 'score'])
+
+
+class RandomPolicy:
+    """
+    A RandomPolicy object plays a uniformly random legal move, and resigns when it has none.
+    """
+    def __init__(self, seed=None):
+        self._random = random.Random(seed)
+
+    def new_game(self, seed):
+        """
+        Reseeds the policy at the start of a tournament game, so that repeated games between the same engines differ.
+        """
+        self._random.seed(seed)
+
+    def __call__(self, gess_game, time_limit):
+        legal_moves = gess_game.get_legal_moves()
+        return self._random.choice(legal_moves) if legal_moves else None
+
+
+class SearchPolicy:
+    """
+    A SearchPolicy object plays the best move found by GessSearch within the time limit of each move.
+    Without a time limit or a maximum depth, it searches one ply deep. It resigns when it has no legal move.
+    """
+    def __init__(self, max_depth=None, weights=None, time_fraction=0.8):
+        """
+        Initiates the SearchPolicy object.
+        :param max_depth: Optional integer of the deepest iteration to search.
+        :param weights: Optional dictionary of evaluation weights.
+        :param time_fraction: The fraction of each move's time limit given to the search.
+        """
+        self._max_depth = max_depth
+        self._weights = weights
+        self._time_fraction = time_fraction
+
+    def __call__(self, gess_game, time_limit):
+        time_limit = None if time_limit is None else time_limit * self._time_fraction
+        max_depth = 1 if time_limit is None and self._max_depth is None else self._max_depth
+        result = search(gess_game, time_limit, max_depth, self._weights)
+        return result.move
+
+
+def _run_policy_process(policy, gess_game, move_time, connection):
+    """
+    Asks a policy for its move in a child process, and sends back the reason it forfeits (None if it does not), the
+    move and the policy itself, so that the parent keeps any state the policy changed while choosing the move.
+    """
+    try:
+        move = policy(gess_game, move_time)
+    except Exception:
+        connection.send((POLICY_ERROR, None, None))
+        return
+    connection.send((None, move, policy))
+
+
+def _call_policy(policy, gess_game, move_time, time_margin):
+    """
+    Asks a policy for its move. With a move time, the policy runs in a child process, which is terminated once it has
+    taken longer than the move time plus the margin, so that nothing is left running after a time forfeit.
+    :return: Returns a tuple of the reason the policy forfeits the game (None if it does not), the move returned and
+    the policy to ask for the next move.
+    """
+    if move_time is None:
+        try:
+            return None, policy(gess_game, move_time), policy
+        except Exception:
+            return POLICY_ERROR, None, policy
+
+    (receiver, sender) = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=_run_policy_process, args=(policy, gess_game, move_time, sender))
+    process.start()
+    sender.close()
+    try:
+        if not receiver.poll(move_time + time_margin):
+            process.terminate()
+            return TIME_FORFEIT, None, policy
+
+        # A child process that stops without sending its move, such as one whose policy cannot be pickled, has failed
+        try:
+            (forfeit, move, policy_after_move) = receiver.recv()
+        except EOFError:
+            return POLICY_ERROR, None, policy
+        return forfeit, move, policy_after_move or policy
+    finally:
+        process.join()
+        receiver.close()
+
+
+def play_game(black_policy, white_policy, move_time=None, time_margin=0.5, max_plies=300, seed=None):
+    """
+    Plays one game between two policies.
+    A policy is a callable taking the GessGame (a copy of the game) and the move time limit, and returning the move to
+    play as an (origin square, destination square) tuple, or None to resign through GessGame.resign_game.
+    A policy that takes longer than the move time plus the margin, raises an exception or returns an illegal move
+    forfeits the game. With a move time, each move is chosen in a child process, which is terminated if it runs out of
+    time, so the policies must be picklable. The policy is copied back from the child process after each move, so the
+    state it keeps (such as the moves left to a scripted policy) carries over to its next move.
+    :param black_policy: The policy playing Black.
+    :param white_policy: The policy playing White.
+    :param move_time: Optional number of seconds each move may take.
+    :param time_margin: Number of seconds a move may exceed the move time by before it forfeits the game.
+    :param max_plies: Integer of the number of plies after which the game is drawn.
+    :param seed: Optional seed passed to the new_game method of each policy that has one.
+    :return: Returns a GameRecord with the engine indices set to None.
+    """
+    policies = {'B': black_policy, 'W': white_policy}
+    for policy in policies.values():
+        if hasattr(policy, 'new_game'):
+            policy.new_game(seed)
+
+    gess = GessGame()
+    moves = []
+    reason = None
+    while gess.get_game_state() == 'UNFINISHED':
+        if len(moves) >= max_plies:
+            return GameRecord(None, None, 'DRAW', MOVE_LIMIT, moves)
+
+        player = gess.get_current_player()
+        (forfeit, move, policies[player]) = _call_policy(policies[player], gess.copy(), move_time, time_margin)
+
+        # A forfeit ends the game as if the player to move had resigned
+        if forfeit is not None:
+            reason = forfeit
+        elif move is None:
+            reason = RESIGNATION
+        elif not gess.make_move(*move):
+            reason = ILLEGAL_MOVE
+        else:
+            moves.append(tuple(move))
+            continue
+        gess.resign_game()
+    return GameRecord(None, None, gess.get_game_state(), reason or RING_CAPTURED, moves)
+
+
+def _play_scheduled_game(task, connection):
+    """
+    Plays one scheduled game of a tournament in a process of its own, and sends its GameRecord to the tournament.
+    """
+    (black, white, black_policy, white_policy, move_time, time_margin, max_plies, seed) = task
+    record = play_game(black_policy, white_policy, move_time, time_margin, max_plies, seed)
+    connection.send(record._replace(black=black, white=white))
+    connection.close()
+
+
+def _solve(matrix, vector):
+    """
+    Solves the linear system matrix * x = vector by Gauss-Jordan elimination with partial pivoting.
+    """
+    size = len(vector)
+    rows = [list(matrix[index]) + [vector[index]] for index in range(size)]
+    for column in range(size):
+        pivot = max(range(column, size), key=lambda row: abs(rows[row][column]))
+        rows[column], rows[pivot] = rows[pivot], rows[column]
+        for row in range(size):
+            if row != column:
+                factor = rows[row][column] / rows[column][column]
+                rows[row] = [value - factor * pivot_value for value, pivot_value in zip(rows[row], rows[column])]
+    return [rows[index][size] / rows[index][index] for index in range(size)]
+
+
+def compute_elo(records, engine_count, prior_draws=2, confidence=1.96):
+    """
+    Computes Elo ratings by maximum likelihood from the results of tournament games.
+    Each engine is also given prior_draws virtual draws against an opponent rated 0, which keeps the ratings of engines
+    that win or lose every game finite. The ratings are centered on 0.
+    :param records: A list of GameRecords.
+    :param engine_count: Integer of the number of engines in the tournament.
+    :param prior_draws: Number of virtual draws each engine is given against an engine rated 0.
+    :param confidence: The number of standard errors either side of each rating in its confidence interval.
+    Defaults to 1.96, for 95% intervals.
+    :return: Returns a list of (rating, lower bound, upper bound) tuples, one per engine.
+    """
+    scale = math.log(10) / 400
+    games = [(record.black, record.white, {'BLACK_WON': 1.0, 'WHITE_WON': 0.0}.get(record.result, 0.5))
+             for record in records]
+    ratings = [0.0] * engine_count
+
+    def expected(rating, opponent_rating):
+        return 1 / (1 + 10 ** ((opponent_rating - rating) / 400))
+
+    # Newton's method on the log likelihood, whose Hessian is the negative of the Fisher information
+    information = None
+    for _ in range(100):
+        gradient = [0.0] * engine_count
+        information = [[0.0] * engine_count for _ in range(engine_count)]
+        for index in range(engine_count):
+            probability = expected(ratings[index], 0.0)
+            gradient[index] += scale * prior_draws * (0.5 - probability)
+            information[index][index] += scale ** 2 * prior_draws * probability * (1 - probability)
+        for (black, white, score) in games:
+            probability = expected(ratings[black], ratings[white])
+            weight = scale ** 2 * probability * (1 - probability)
+            gradient[black] += scale * (score - probability)
+            gradient[white] -= scale * (score - probability)
+            information[black][black] += weight
+            information[white][white] += weight
+            information[black][white] -= weight
+            information[white][black] -= weight
+        step = _solve(information, gradient)
+        ratings = [rating + change for rating, change in zip(ratings, step)]
+        if max(abs(change) for change in step) < 1e-6:
+            break
+
+    # The variance of each rating is the diagonal of the inverse of the Fisher information
+    errors = []
+    for index in range(engine_count):
+        unit = [1.0 if row == index else 0.0 for row in range(engine_count)]
+        errors.append(math.sqrt(max(_solve(information, unit)[index], 0.0)))
+    mean = sum(ratings) / engine_count
+    return [(rating - mean, rating - mean - confidence * error, rating - mean + confidence * error)
+            for rating, error in zip(ratings, errors)]
+
+
+def run_tournament(engines, names=None, games_per_color=1, move_time=None, time_margin=0.5, max_plies=300,
+                   processes=None, seed=0):
+    """
+    Plays a round-robin tournament in which every pair of engines plays each other with both color assignments.
+    Each game is played in a process of its own, with at most the given number of games running at once, so the
+    engines must be picklable, such as instances of RandomPolicy, SearchPolicy or other module-level classes. Game
+    processes are not pool workers, so they can start the child processes that time each move.
+    :param engines: A list of policies, as described in play_game.
+    :param names: Optional list of the names of the engines. Defaults to the engines' class names and indices.
+    :param games_per_color: Integer of the number of games each pair plays with each color assignment.
+    :param move_time: Optional number of seconds each move may take.
+    :param time_margin: Number of seconds a move may exceed the move time by before it forfeits the game.
+    :param max_plies: Integer of the number of plies after which a game is drawn.
+    :param processes: Optional integer of the number of games played at once. Defaults to the number of CPUs.
+    :param seed: Integer the seed of each game is derived from.
+    :return: Returns a tuple of the list of GameRecords, in the order they were scheduled, and the list of Ratings of
+    the engines, in the order the engines were given.
+    """
+    if names is None:
+        names = [f'{type(engine).__name__}-{index}' for index, engine in enumerate(engines)]
+    tasks = []
+    for first in range(len(engines)):
+        for second in range(first + 1, len(engines)):
+            for (black, white) in ((first, second), (second, first)):
+                for _ in range(games_per_color):
+                    tasks.append((black, white, engines[black], engines[white], move_time, time_margin, max_plies,
+                                  seed + len(tasks)))
+
+    processes = processes or multiprocessing.cpu_count()
+    records = [None] * len(tasks)
+    pending = list(enumerate(tasks))
+    running = {}
+    try:
+        while pending or running:
+            while pending and len(running) < processes:
+                (index, task) = pending.pop(0)
+                (receiver, sender) = multiprocessing.Pipe(duplex=False)
+                worker = multiprocessing.Process(target=_play_scheduled_game, args=(task, sender))
+                worker.start()
+                sender.close()
+                running[receiver] = (index, worker)
+
+            # A finished game sends its record, and a crashed game closes its end of the pipe
+            for receiver in wait(list(running)):
+                (index, worker) = running.pop(receiver)
+                try:
+                    records[index] = receiver.recv()
+                except EOFError:
+                    raise RuntimeError(f'the process of game {index} stopped without a result')
+                finally:
+                    receiver.close()
+                    worker.join()
+    finally:
+        for (_, worker) in running.values():
+            worker.terminate()
+            worker.join()
+
+    points = [0.0] * len(engines)
+    game_counts = [0] * len(engines)
+    for record in records:
+        game_counts[record.black] += 1
+        game_counts[record.white] += 1
+        black_score = {'BLACK_WON': 1.0, 'WHITE_WON': 0.0}.get(record.result, 0.5)
+        points[record.black] += black_score
+        points[record.white] += 1 - black_score
+
+    ratings = [Rating(names[index], rating, lower, upper, game_counts[index], points[index])
+               for index, (rating, lower, upper) in enumerate(compute_elo(records, len(engines)))]
+    return records, ratings
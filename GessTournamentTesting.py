@@ -0,0 +1,144 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: Unit testing to check validity of GessTournament.py
+
+import multiprocessing
+import time
+import unittest
+
+from GessTestGames import FULL_GAME
+from GessTournament import GameRecord, ILLEGAL_MOVE, MOVE_LIMIT, POLICY_ERROR, RESIGNATION, RING_CAPTURED, \
+    TIME_FORFEIT, RandomPolicy, SearchPolicy, compute_elo, play_game, run_tournament
+
+
+class ScriptedPolicy:
+    """
+    Plays the moves of a fixed list in order, then resigns.
+    """
+    def __init__(self, moves):
+        self._moves = list(moves)
+
+    def __call__(self, gess_game, time_limit):
+        return self._moves.pop(0) if self._moves else None
+
+
+class ResigningPolicy:
+    """
+    Resigns immediately.
+    """
+    def __call__(self, gess_game, time_limit):
+        return None
+
+
+class IllegalPolicy:
+    """
+    Always attempts to move a piece off the board.
+    """
+    def __call__(self, gess_game, time_limit):
+        return 'r3', 'v3'
+
+
+class SlowPolicy:
+    """
+    Plays the first legal move after sleeping for 0.2 seconds, longer than the move times it is tested with.
+    """
+    def __call__(self, gess_game, time_limit):
+        time.sleep(0.2)
+        return gess_game.get_legal_moves()[0]
+
+
+class HangingPolicy:
+    """
+    Takes far longer than any move time to choose a move.
+    """
+    def __call__(self, gess_game, time_limit):
+        time.sleep(30)
+        return gess_game.get_legal_moves()[0]
+
+
+class FailingPolicy:
+    """
+    Raises an exception instead of choosing a move.
+    """
+    def __call__(self, gess_game, time_limit):
+        raise RuntimeError('the engine crashed')
+
+
+class TestGessTournament(unittest.TestCase):
+    """
+    Contains unit tests for playing tournament games, computing Elo ratings and running a tournament
+    """
+
+    def test_game_endings(self):
+        """
+        Tests that each way a game can end is recorded with the right result and reason.
+        """
+        record = play_game(ScriptedPolicy(FULL_GAME[0::2]), ScriptedPolicy(FULL_GAME[1::2]))
+        self.assertEqual((record.result, record.reason, record.moves), ('BLACK_WON', RING_CAPTURED, FULL_GAME))
+        self.assertEqual(play_game(RandomPolicy(1), ResigningPolicy()).result, 'BLACK_WON')
+        self.assertEqual(play_game(ResigningPolicy(), RandomPolicy(1)).reason, RESIGNATION)
+        self.assertEqual(play_game(IllegalPolicy(), RandomPolicy(1))[2:4], ('WHITE_WON', ILLEGAL_MOVE))
+        self.assertEqual(play_game(SlowPolicy(), RandomPolicy(1), move_time=0.01, time_margin=0.05)[2:4],
+                         ('WHITE_WON', TIME_FORFEIT))
+        record = play_game(RandomPolicy(1), RandomPolicy(2), max_plies=6)
+        self.assertEqual((record.result, record.reason, len(record.moves)), ('DRAW', MOVE_LIMIT, 6))
+        self.assertEqual(play_game(RandomPolicy(1), FailingPolicy())[2:4], ('BLACK_WON', POLICY_ERROR))
+
+    def test_timed_moves(self):
+        """
+        Tests that a policy running past its move time forfeits as soon as the margin is over and is stopped rather than
+        left running, that policies keep their state between timed moves, and that a search policy without a time limit
+        or depth still finishes its moves.
+        """
+        start = time.monotonic()
+        self.assertEqual(play_game(RandomPolicy(1), HangingPolicy(), move_time=0.05, time_margin=0.2)[2:4],
+                         ('BLACK_WON', TIME_FORFEIT))
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual(multiprocessing.active_children(), [])
+
+        record = play_game(ScriptedPolicy(FULL_GAME[0::2]), ScriptedPolicy(FULL_GAME[1::2]), move_time=5)
+        self.assertEqual((record.result, record.reason, record.moves), ('BLACK_WON', RING_CAPTURED, FULL_GAME))
+        self.assertEqual(play_game(RandomPolicy(1), FailingPolicy(), move_time=5)[2:4], ('BLACK_WON', POLICY_ERROR))
+
+        # Each tournament game runs in its own process, which times the moves in child processes of its own
+        (records, _) = run_tournament([RandomPolicy(), HangingPolicy()], move_time=0.05, time_margin=0.2, processes=2)
+        self.assertEqual([(record.reason, len(record.moves)) for record in records],
+                         [(TIME_FORFEIT, 1), (TIME_FORFEIT, 0)])
+        self.assertEqual(len(play_game(SearchPolicy(), RandomPolicy(1), max_plies=2).moves), 2)
+
+    def test_elo(self):
+        """
+        Tests that Elo ratings order the engines by their results, with intervals around each rating.
+        """
+        records = [GameRecord(0, 1, 'BLACK_WON', RING_CAPTURED, [])] * 6 + \
+                  [GameRecord(1, 0, 'BLACK_WON', RING_CAPTURED, [])] * 3 + \
+                  [GameRecord(1, 2, 'DRAW', MOVE_LIMIT, [])] * 4
+        ratings = compute_elo(records, 3)
+        self.assertGreater(ratings[0][0], ratings[1][0])
+        self.assertAlmostEqual(ratings[1][0], ratings[2][0], delta=60)
+        self.assertAlmostEqual(sum(rating for (rating, _, _) in ratings), 0)
+        for (rating, lower, upper) in ratings:
+            self.assertLess(lower, rating)
+            self.assertAlmostEqual(rating - lower, upper - rating)
+
+        # More games give narrower intervals
+        narrow = compute_elo(records * 10, 3)
+        self.assertLess(narrow[0][2] - narrow[0][1], ratings[0][2] - ratings[0][1])
+
+    def test_round_robin(self):
+        """
+        Tests that every pair of engines plays with both color assignments, and that the ratings follow the results.
+        """
+        engines = [RandomPolicy(), ResigningPolicy(), SearchPolicy(max_depth=1)]
+        (records, ratings) = run_tournament(engines, games_per_color=1, max_plies=4, processes=3)
+        self.assertEqual([(record.black, record.white) for record in records],
+                         [(0, 1), (1, 0), (0, 2), (2, 0), (1, 2), (2, 1)])
+        self.assertEqual([rating.games for rating in ratings], [4, 4, 4])
+        self.assertEqual(ratings[1].score, 0)
+        self.assertEqual(ratings[1].name, 'ResigningPolicy-1')
+        self.assertLess(ratings[1].rating, ratings[0].rating)
+        self.assertLess(ratings[1].rating, ratings[2].rating)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,222 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: A streaming exporter of training data for the game of Gess, written to sharded .npy files
+
+import itertools
+import multiprocessing
+import os
+
+import numpy as np
+
+from GessGame import GessGame
+from GessSymmetry import IDENTITY, TRANSFORMS, transform_board, transform_move, transform_player
+
+_COLUMNS = 'abcdefghijklmnopqrst'
+
+# The final game states, and the value each is stored as in a shard
+RESULTS = {'BLACK_WON': 1, 'WHITE_WON': -1, 'UNFINISHED': 0}
+_SWAPPED_RESULTS = {'BLACK_WON': 'WHITE_WON', 'WHITE_WON': 'BLACK_WON', 'UNFINISHED': 'UNFINISHED'}
+
+# The arrays stored in each shard, with the shape of one sample and the type of the array
+SHARD_ARRAYS = {
+    'boards': ((2, 20, 20), np.uint8),
+    'players': ((), np.int8),
+    'moves': ((), np.int32),
+    'results': ((), np.int8),
+}
+
+
+def board_to_tensor(board):
+    """
+    Converts a Gess board into an array of two planes of the playable 20x20 area.
+    :param board: A list of lists representing the Gess board, as returned by GessGame.get_gess_board.
+    :return: Returns a uint8 array of shape (2, 20, 20), holding 1 where plane 0 has a Black token and plane 1 has a
+    White token. The rows and columns match the rows and columns of the board lists.
+    """
+    squares = np.array([row[:20] for row in board[:20]])
+    return np.stack([squares == 'B', squares == 'W']).astype(np.uint8)
+
+
+def encode_move(move):
+    """
+    Converts a move into a single integer.
+    :param move: A tuple of the origin and destination squares of a move, such as ('c3', 'c6').
+    :return: Returns origin * 400 + destination, where each square is numbered row * 20 + column of the board lists.
+    """
+    (origin, destination) = [(20 - int(square[1:])) * 20 + _COLUMNS.index(square[0]) for square in move]
+    return origin * 400 + destination
+
+
+def decode_move(number):
+    """
+    Converts an integer from encode_move back into a move.
+    :param number: Integer returned by encode_move.
+    :return: Returns a tuple of the origin and destination squares.
+    """
+    return tuple(_COLUMNS[square % 20] + str(20 - square // 20) for square in divmod(int(number), 400))
+
+
+def iter_samples(records, augment=False):
+    """
+    Replays game records through a GessGame and lazily yields one training sample per move played.
+    Each game is replayed up to its first illegal move, and its final state is attached to all of its samples.
+    :param records: An iterable of game records, each a list of (origin square, destination square) string pairs.
+    :param augment: Boolean. If True, each sample is also yielded under every other symmetry transform of the rules.
+    :return: Returns a generator of (board tensor, player to move, move played, final game state) tuples.
+    """
+    for moves in records:
+        gess = GessGame()
+        positions = []
+        for move in moves:
+            board = [list(row) for row in gess.get_gess_board()]
+            player = gess.get_current_player()
+            if not gess.make_move(*move):
+                break
+            positions.append((board, player, tuple(move)))
+
+        game_state = gess.get_game_state()
+        for (board, player, move) in positions:
+            for transform in (TRANSFORMS if augment else (IDENTITY,)):
+                transformed_player = transform_player(player, transform)
+                transformed_state = game_state if transformed_player == player else _SWAPPED_RESULTS[game_state]
+                yield (board_to_tensor(transform_board(board, transform)), transformed_player,
+                       transform_move(move, transform), transformed_state)
+
+
+def _samples_to_arrays(task):
+    """
+    Converts a chunk of game records into stacked sample arrays. Runs in a worker process of the exporter.
+    :param task: A tuple of a list of game records and the augment flag.
+    :return: Returns a dictionary from each name in SHARD_ARRAYS to an array holding one entry per sample.
+    """
+    (records, augment) = task
+    columns = {name: [] for name in SHARD_ARRAYS}
+    for (tensor, player, move, game_state) in iter_samples(records, augment):
+        columns['boards'].append(tensor)
+        columns['players'].append(0 if player == 'B' else 1)
+        columns['moves'].append(encode_move(move))
+        columns['results'].append(RESULTS[game_state])
+    return {name: np.array(values, dtype=SHARD_ARRAYS[name][1]).reshape((-1,) + SHARD_ARRAYS[name][0])
+            for name, values in columns.items()}
+
+
+class ShardWriter:
+    """
+    A ShardWriter object writes training samples to a directory of fixed-size shards.
+    Each shard is a set of .npy files (boards, players, moves and results) holding shard_size samples, except the last
+    shard, which holds the remaining samples. Only one shard is held in memory at a time, and the files can be opened
+    with numpy.load(path, mmap_mode='r') without loading them.
+    """
+    def __init__(self, directory, shard_size=65536, prefix='shard'):
+        """
+        Initiates the ShardWriter object, creating the directory if needed.
+        :param directory: String of the directory the shards are written to.
+        :param shard_size: Integer of the number of samples in each full shard.
+        :param prefix: String the file names of the shards start with.
+        """
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._shard_size = shard_size
+        self._prefix = prefix
+        self._buffers = {name: np.zeros((shard_size,) + shape, dtype=dtype)
+                         for name, (shape, dtype) in SHARD_ARRAYS.items()}
+        self._count = 0
+        self._shard_paths = []
+        self._sample_count = 0
+
+    def get_shard_paths(self):
+        """
+        Returns the paths of the shards written so far.
+        :return: Returns a list of path prefixes, one per shard. Each array is stored at the prefix followed by
+        '-<name>.npy', and can be opened using load_shard.
+        """
+        return list(self._shard_paths)
+
+    def get_sample_count(self):
+        """
+        Returns the number of samples written so far, including those not yet flushed to a shard.
+        :return: Returns an integer of the number of samples.
+        """
+        return self._sample_count
+
+    def write_arrays(self, arrays):
+        """
+        Writes a batch of samples, flushing a shard each time one fills up.
+        :param arrays: A dictionary from each name in SHARD_ARRAYS to an array with one entry per sample.
+        :return: Returns True once the samples have been written or buffered.
+        """
+        total = len(arrays['moves'])
+        start = 0
+        while start < total:
+            count = min(total - start, self._shard_size - self._count)
+            for name, buffer in self._buffers.items():
+                buffer[self._count:self._count + count] = arrays[name][start:start + count]
+            self._count += count
+            self._sample_count += count
+            start += count
+            if self._count == self._shard_size:
+                self.flush()
+        return True
+
+    def flush(self):
+        """
+        Writes the buffered samples as a new shard, if there are any.
+        :return: Returns True if a shard was written, or False if there were no samples to write.
+        """
+        if self._count == 0:
+            return False
+        path = os.path.join(self._directory, f'{self._prefix}-{len(self._shard_paths):05d}')
+        for name, buffer in self._buffers.items():
+            np.save(f'{path}-{name}.npy', buffer[:self._count])
+        self._shard_paths.append(path)
+        self._count = 0
+        return True
+
+    def close(self):
+        """
+        Writes the last, partially filled shard.
+        :return: Returns the list of shard path prefixes written.
+        """
+        self.flush()
+        return self.get_shard_paths()
+
+
+def load_shard(path):
+    """
+    Opens the arrays of a shard as read-only memory maps.
+    :param path: A shard path prefix, as returned by ShardWriter.get_shard_paths.
+    :return: Returns a dictionary from each name in SHARD_ARRAYS to a memory-mapped array.
+    """
+    return {name: np.load(f'{path}-{name}.npy', mmap_mode='r') for name in SHARD_ARRAYS}
+
+
+def _chunk_records(records, augment, games_per_chunk):
+    """
+    Groups game records into chunks for the worker processes, reading the records lazily.
+    """
+    records = iter(records)
+    while True:
+        chunk = list(itertools.islice(records, games_per_chunk))
+        if not chunk:
+            return
+        yield chunk, augment
+
+
+def export_training_data(records, directory, shard_size=65536, augment=False, processes=None, games_per_chunk=64):
+    """
+    Replays game records in worker processes and writes their samples to fixed-size .npy shards.
+    Records are read lazily in chunks and the shards are written in the order of the records, so memory use is bounded
+    by the shard size and the chunks in flight, not by the number of games.
+    :param records: An iterable of game records, each a list of (origin square, destination square) string pairs.
+    :param directory: String of the directory the shards are written to.
+    :param shard_size: Integer of the number of samples in each full shard.
+    :param augment: Boolean. If True, each sample is also written under every other symmetry transform of the rules.
+    :param processes: Optional integer of the number of worker processes. Defaults to the number of CPUs.
+    :param games_per_chunk: Integer of the number of games sent to a worker at a time.
+    :return: Returns the list of shard path prefixes written.
+    """
+    writer = ShardWriter(directory, shard_size)
+    with multiprocessing.Pool(processes) as pool:
+        for arrays in pool.imap(_samples_to_arrays, _chunk_records(records, augment, games_per_chunk)):
+            writer.write_arrays(arrays)
+    return writer.close()
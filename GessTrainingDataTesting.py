@@ -0,0 +1,67 @@
+# Author: Asa Holland
+# Date: 10/19/2026
+# Description: Unit testing to check validity of GessTrainingData.py
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from GessGame import GessGame
+from GessTestGames import FULL_GAME
+from GessTrainingData import ShardWriter, board_to_tensor, decode_move, encode_move, export_training_data, \
+    iter_samples, load_shard
+
+
+class TestGessTrainingData(unittest.TestCase):
+    """
+    Contains unit tests for the training data samples, shard writer and exporter
+    """
+
+    def test_samples(self):
+        """
+        Tests that each move played yields a sample holding the position before the move and the final game state.
+        """
+        samples = list(iter_samples([FULL_GAME, [('c3', 'c5'), ('c3', 'c5')]]))
+        self.assertEqual(len(samples), len(FULL_GAME) + 1)
+        (tensor, player, move, game_state) = samples[0]
+        self.assertEqual(tensor.shape, (2, 20, 20))
+        self.assertTrue(np.array_equal(tensor, board_to_tensor(GessGame().get_gess_board())))
+        self.assertEqual(tensor[0].sum(), 43)
+        self.assertEqual((player, move, game_state), ('B', ('c3', 'c5'), 'BLACK_WON'))
+        self.assertEqual(samples[1][1:], ('W', ('r18', 'r16'), 'BLACK_WON'))
+        self.assertEqual(samples[-1][1:], ('B', ('c3', 'c5'), 'UNFINISHED'))
+        self.assertEqual(decode_move(encode_move(('b2', 's19'))), ('b2', 's19'))
+
+    def test_augmented_samples(self):
+        """
+        Tests that augmentation yields every symmetry of a sample, swapping the result when colors are swapped.
+        """
+        samples = list(iter_samples([FULL_GAME[:1]], augment=True))
+        self.assertEqual(len(samples), 4)
+        self.assertEqual([sample[1] for sample in samples], ['B', 'B', 'W', 'W'])
+        self.assertEqual(samples[2][2], ('r18', 'r16'))
+        self.assertTrue(np.array_equal(samples[2][0][1], samples[0][0][0][::-1, ::-1]))
+
+    def test_shards(self):
+        """
+        Tests that samples are split into fixed-size shards that can be memory-mapped, in the order of the records.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            paths = export_training_data([FULL_GAME] * 3, directory, shard_size=16, processes=2, games_per_chunk=1)
+            self.assertEqual(len(paths), 3)
+            shards = [load_shard(path) for path in paths]
+            self.assertEqual([len(shard['moves']) for shard in shards], [16, 16, 7])
+            self.assertIsInstance(shards[0]['boards'], np.memmap)
+            moves = np.concatenate([shard['moves'] for shard in shards])
+            self.assertEqual([decode_move(number) for number in moves[:13]], FULL_GAME)
+            self.assertEqual(list(np.concatenate([shard['results'] for shard in shards])), [1] * 39)
+            self.assertEqual(list(shards[0]['players'][:4]), [0, 1, 0, 1])
+
+            writer = ShardWriter(os.path.join(directory, 'empty'))
+            self.assertEqual(writer.close(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()